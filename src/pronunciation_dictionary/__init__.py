@@ -1,7 +1,20 @@
-from pronunciation_dictionary.deserialization import DeserializationOptions, deserialize
-from pronunciation_dictionary.io import load_dict, load_dict_from_url, save_dict
+from pronunciation_dictionary.binary_format import (BinaryPronunciationDict, open_dict_binary,
+                                                    save_dict_binary)
+from pronunciation_dictionary.compact_dictionary import CompactPronunciationDict
+from pronunciation_dictionary.deserialization import (DeserializationOptions, deserialize,
+                                                      deserialize_lines)
+from pronunciation_dictionary.external_sort import sort_dict_file
+from pronunciation_dictionary.filtering import EntryFilter, filter_dict
+from pronunciation_dictionary.io import (DictionaryLoader, UrlDictionaryLoader, load_dict,
+                                         load_dict_from_url, load_dict_from_url_async, load_dicts,
+                                         save_dict)
+from pronunciation_dictionary.merging import merge_dict_files, merge_dicts
+from pronunciation_dictionary.metrics import PipelineMetrics
 from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.parse_cache import ParseCache
 from pronunciation_dictionary.phoneme_set_extraction import get_phoneme_set
+from pronunciation_dictionary.progress import CancellationToken, OperationCancelledError
+from pronunciation_dictionary.pronunciation_index import PronunciationIndex
 from pronunciation_dictionary.pronunciation_selection import (get_first_pronunciation,
                                                               get_last_pronunciation,
                                                               get_longest_pronunciation,
@@ -9,10 +22,18 @@ from pronunciation_dictionary.pronunciation_selection import (get_first_pronunci
                                                               get_pronunciation_with_lowest_weight,
                                                               get_random_pronunciation,
                                                               get_shortest_pronunciation,
-                                                              get_weighted_pronunciation)
+                                                              get_weighted_pronunciation,
+                                                              select_pronunciations)
 from pronunciation_dictionary.serialization import SerializationOptions, serialize
+from pronunciation_dictionary.symbol_index import SymbolIndex
+from pronunciation_dictionary.symbol_mapping import SymbolMapping, map_dict_file, map_symbols
 from pronunciation_dictionary.types import (Pronunciation, PronunciationDict, Pronunciations,
                                             Symbol, Weight, Word)
-from pronunciation_dictionary.validation import (validate_dictionary, validate_pronunciation,
+from pronunciation_dictionary.validation import (DictionaryViolation, get_dictionary_violations,
+                                                 validate_dictionary, validate_pronunciation,
                                                  validate_pronunciations, validate_seed,
                                                  validate_weight, validate_word)
+from pronunciation_dictionary.weight_transformation import (WeightTransformationOptions,
+                                                            transform_weights)
+from pronunciation_dictionary.weighted_sampling import WeightedPronunciationSampler
+from pronunciation_dictionary.word_index import WordIndex, load_word_index, save_word_index
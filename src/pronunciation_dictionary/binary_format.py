@@ -0,0 +1,286 @@
+import mmap
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+from math import isnan
+from pathlib import Path
+from typing import (BinaryIO, Dict, Iterable, Iterator, ItemsView, List, Mapping, Tuple,
+                    ValuesView)
+
+from pronunciation_dictionary.types import PronunciationDict, Pronunciations, Symbol, Word
+from pronunciation_dictionary.validation import validate_dictionary, validate_type
+
+MAGIC = b"PRONDICT"
+FORMAT_VERSION = 1
+# magic, version, byte order, has int weights, four counts and the offsets of ten sections
+HEADER_FORMAT = "<8sHBB4x4Q10Q"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+SECTION_ALIGNMENT = 8
+TEXT_ENCODING = "UTF-8"
+TEXT_ERRORS = "surrogatepass"
+BYTE_ORDERS = {"little": 0, "big": 1}
+
+
+def save_dict_binary(dictionary: PronunciationDict, path: Path) -> None:
+  try:
+    validate_dictionary(dictionary)
+  except ValueError as error:
+    raise ValueError("dictionary", error.args[1]) from error
+  if msg := validate_type(path, Path):
+    raise ValueError(f"Parameter 'path': {msg}")
+
+  symbols: List[Symbol] = []
+  symbol_ids: Dict[Symbol, int] = {}
+  encoded_words: List[bytes] = []
+  pronunciation_starts = array("Q", [0])
+  symbol_starts = array("Q", [0])
+  flat_symbol_ids = array("I")
+  weights = array("d")
+  weight_is_int = array("B")
+
+  for word, pronunciations in dictionary.items():
+    encoded_words.append(word.encode(TEXT_ENCODING, TEXT_ERRORS))
+    for pronunciation, weight in pronunciations.items():
+      for symbol in pronunciation:
+        symbol_id = symbol_ids.get(symbol)
+        if symbol_id is None:
+          symbol_id = len(symbols)
+          symbol_ids[symbol] = symbol_id
+          symbols.append(symbol)
+        flat_symbol_ids.append(symbol_id)
+      symbol_starts.append(len(flat_symbol_ids))
+      try:
+        float_weight = float(weight)
+      except OverflowError as error:
+        raise ValueError("dictionary", f"Weight \"{weight}\" can't be stored as float!") from error
+      # NaN is the only weight which is not equal to itself
+      if float_weight != weight and not isnan(float_weight):
+        raise ValueError("dictionary", f"Weight \"{weight}\" can't be stored as float!")
+      weights.append(weight)
+      weight_is_int.append(not isinstance(weight, float))
+    pronunciation_starts.append(len(weights))
+
+  # the order of UTF-8 bytes is the same as the order of the code points
+  sorted_word_indices = array("Q", sorted(
+    range(len(encoded_words)), key=encoded_words.__getitem__))
+  symbol_offsets, symbol_blob = __get_blob(
+    symbol.encode(TEXT_ENCODING, TEXT_ERRORS) for symbol in symbols
+  )
+  word_offsets, word_blob = __get_blob(encoded_words)
+  has_int_weights = any(weight_is_int)
+
+  sections = (
+    symbol_offsets,
+    symbol_blob,
+    word_offsets,
+    word_blob,
+    sorted_word_indices,
+    pronunciation_starts,
+    symbol_starts,
+    flat_symbol_ids,
+    weights,
+    weight_is_int if has_int_weights else array("B"),
+  )
+
+  path.parent.mkdir(parents=True, exist_ok=True)
+  with path.open(mode="wb") as file:
+    file.write(bytes(HEADER_SIZE))
+    section_offsets = [__write_section(file, section) for section in sections]
+    header = struct.pack(
+      HEADER_FORMAT,
+      MAGIC,
+      FORMAT_VERSION,
+      BYTE_ORDERS[sys.byteorder],
+      has_int_weights,
+      len(symbols),
+      len(encoded_words),
+      len(weights),
+      len(flat_symbol_ids),
+      *section_offsets,
+    )
+    file.seek(0)
+    file.write(header)
+
+
+def __get_blob(encoded_texts: Iterable[bytes]) -> Tuple[array, bytes]:
+  offsets = array("Q", [0])
+  parts = []
+  for encoded_text in encoded_texts:
+    parts.append(encoded_text)
+    offsets.append(offsets[-1] + len(encoded_text))
+  return offsets, b"".join(parts)
+
+
+def __write_section(file: BinaryIO, section: bytes) -> int:
+  position = file.tell()
+  padding = -position % SECTION_ALIGNMENT
+  file.write(bytes(padding))
+  file.write(section)
+  return position + padding
+
+
+def open_dict_binary(path: Path) -> "BinaryPronunciationDict":
+  if msg := validate_type(path, Path):
+    raise ValueError(f"Parameter 'path': {msg}")
+
+  result = BinaryPronunciationDict(path)
+  return result
+
+
+class BinaryPronunciationDict(Mapping[Word, Pronunciations]):
+  # read-only; all data stays in the memory-mapped file and is decoded on access
+  def __init__(self, path: Path) -> None:
+    self.__path = path
+    self.__views: List[memoryview] = []
+    with path.open(mode="rb") as file:
+      self.__mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    buffer = memoryview(self.__mmap)
+    self.__views.append(buffer)
+    if len(buffer) < HEADER_SIZE:
+      self.close()
+      raise ValueError("path", "File is not a binary dictionary!")
+    magic, version, byte_order, has_int_weights, n_symbols, n_words, n_pronunciations, n_symbol_ids, *section_offsets = struct.unpack_from(
+      HEADER_FORMAT, buffer)
+    if magic != MAGIC:
+      self.close()
+      raise ValueError("path", "File is not a binary dictionary!")
+    if version != FORMAT_VERSION:
+      self.close()
+      raise ValueError("path", f"Format version {version} is not supported!")
+    if byte_order != BYTE_ORDERS[sys.byteorder]:
+      self.close()
+      raise ValueError("path", "Byte order of the file is not supported on this platform!")
+
+    def get_section(section_nr: int, type_code: str, count: int) -> memoryview:
+      start = section_offsets[section_nr]
+      end = start + count * array(type_code).itemsize
+      section = buffer[start:end].cast(type_code)
+      self.__views.append(section)
+      return section
+
+    symbol_offsets = get_section(0, "Q", n_symbols + 1)
+    symbol_blob = get_section(1, "B", symbol_offsets[-1])
+    self.__symbols: Tuple[Symbol, ...] = tuple(
+      str(symbol_blob[start:end], TEXT_ENCODING, TEXT_ERRORS)
+      for start, end in zip(symbol_offsets[:-1], symbol_offsets[1:])
+    )
+    self.__word_offsets = get_section(2, "Q", n_words + 1)
+    self.__word_blob_start = section_offsets[3]
+    self.__sorted_word_indices = get_section(4, "Q", n_words)
+    self.__pronunciation_starts = get_section(5, "Q", n_words + 1)
+    self.__symbol_starts = get_section(6, "Q", n_pronunciations + 1)
+    self.__symbol_ids = get_section(7, "I", n_symbol_ids)
+    self.__weights = get_section(8, "d", n_pronunciations)
+    self.__weight_is_int = get_section(9, "B", n_pronunciations if has_int_weights else 0)
+    self.__len = n_words
+
+  @property
+  def path(self) -> Path:
+    return self.__path
+
+  @property
+  def symbols(self) -> Tuple[Symbol, ...]:
+    return self.__symbols
+
+  def close(self) -> None:
+    # the mapping can only be closed after all views on it are released
+    for view in reversed(self.__views):
+      view.release()
+    self.__views.clear()
+    self.__mmap.close()
+
+  def __enter__(self) -> "BinaryPronunciationDict":
+    return self
+
+  def __exit__(self, *args) -> None:
+    self.close()
+
+  def __reduce__(self):
+    # other processes map the same file again instead of receiving a copy
+    return open_dict_binary, (self.__path,)
+
+  def __get_encoded_word(self, word_index: int) -> bytes:
+    # slicing the mapping directly returns bytes which can be compared
+    start = self.__word_blob_start + self.__word_offsets[word_index]
+    end = self.__word_blob_start + self.__word_offsets[word_index + 1]
+    return self.__mmap[start:end]
+
+  def __find_word_index(self, word: Word) -> int:
+    if not isinstance(word, str):
+      return -1
+    encoded_word = word.encode(TEXT_ENCODING, TEXT_ERRORS)
+    sorted_word_indices = self.__sorted_word_indices
+    get_encoded_word = self.__get_encoded_word
+    low, high = 0, len(sorted_word_indices)
+    while low < high:
+      middle = (low + high) // 2
+      if get_encoded_word(sorted_word_indices[middle]) < encoded_word:
+        low = middle + 1
+      else:
+        high = middle
+    if low < len(sorted_word_indices):
+      word_index = sorted_word_indices[low]
+      if get_encoded_word(word_index) == encoded_word:
+        return word_index
+    return -1
+
+  def __get_pronunciations(self, word_index: int) -> Pronunciations:
+    first_pronunciation = self.__pronunciation_starts[word_index]
+    last_pronunciation = self.__pronunciation_starts[word_index + 1]
+    # reading whole slices at once is faster than accessing each element of the views
+    symbol_starts = self.__symbol_starts[first_pronunciation:last_pronunciation + 1].tolist()
+    symbol_ids = self.__symbol_ids[symbol_starts[0]:symbol_starts[-1]].tolist()
+    weights = self.__weights[first_pronunciation:last_pronunciation].tolist()
+    if len(self.__weight_is_int) > 0:
+      weight_is_int = self.__weight_is_int[first_pronunciation:last_pronunciation].tolist()
+      weights = [
+        int(weight) if is_int else weight
+        for weight, is_int in zip(weights, weight_is_int)
+      ]
+    symbols = self.__symbols
+    offset = symbol_starts[0]
+    result = OrderedDict(
+      (tuple(symbols[symbol_id] for symbol_id in symbol_ids[start - offset:end - offset]), weight)
+      for start, end, weight in zip(symbol_starts[:-1], symbol_starts[1:], weights)
+    )
+    return result
+
+  def __getitem__(self, word: Word) -> Pronunciations:
+    word_index = self.__find_word_index(word)
+    if word_index == -1:
+      raise KeyError(word)
+    return self.__get_pronunciations(word_index)
+
+  def __contains__(self, word: object) -> bool:
+    return self.__find_word_index(word) != -1
+
+  def __iter__(self) -> Iterator[Word]:
+    for word_index in range(self.__len):
+      yield self.__get_encoded_word(word_index).decode(TEXT_ENCODING, TEXT_ERRORS)
+
+  def __len__(self) -> int:
+    return self.__len
+
+  def items(self) -> ItemsView[Word, Pronunciations]:
+    return BinaryItemsView(self)
+
+  def values(self) -> ValuesView[Pronunciations]:
+    return BinaryValuesView(self)
+
+  def _iter_items(self) -> Iterator[Tuple[Word, Pronunciations]]:
+    # iterating in file order doesn't require a word lookup
+    for word_index in range(self.__len):
+      yield self.__get_encoded_word(word_index).decode(TEXT_ENCODING, TEXT_ERRORS), self.__get_pronunciations(word_index)
+
+
+class BinaryItemsView(ItemsView):
+  def __iter__(self) -> Iterator[Tuple[Word, Pronunciations]]:
+    return self._mapping._iter_items()
+
+
+class BinaryValuesView(ValuesView):
+  def __iter__(self) -> Iterator[Pronunciations]:
+    for _, pronunciations in self._mapping._iter_items():
+      yield pronunciations
@@ -0,0 +1,81 @@
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Mapping, Tuple, Union
+
+from pronunciation_dictionary.types import (Pronunciation, PronunciationDict, Pronunciations,
+                                            Symbol, Weight, Word)
+from pronunciation_dictionary.validation import validate_dictionary
+
+MAX_SHORT_SYMBOL_ID = 2**16 - 1
+
+
+class CompactPronunciationDict(Mapping[Word, Pronunciations]):
+  # read-only; all pronunciations are stored as symbol ids in one flat array
+  def __init__(self, dictionary: PronunciationDict) -> None:
+    try:
+      validate_dictionary(dictionary)
+    except ValueError as error:
+      raise ValueError("dictionary", error.args[1]) from error
+
+    symbols: List[Symbol] = []
+    symbol_ids: Dict[Symbol, int] = {}
+    word_indices: Dict[Word, int] = {}
+    pronunciation_starts = array("L", [0])
+    symbol_starts = array("L", [0])
+    flat_symbol_ids: List[int] = []
+    weights: List[Weight] = []
+
+    for word, pronunciations in dictionary.items():
+      word_indices[word] = len(word_indices)
+      for pronunciation, weight in pronunciations.items():
+        for symbol in pronunciation:
+          symbol_id = symbol_ids.get(symbol)
+          if symbol_id is None:
+            symbol_id = len(symbols)
+            symbol_ids[symbol] = symbol_id
+            symbols.append(symbol)
+          flat_symbol_ids.append(symbol_id)
+        symbol_starts.append(len(flat_symbol_ids))
+        weights.append(weight)
+      pronunciation_starts.append(len(weights))
+
+    self.__symbols: Tuple[Symbol, ...] = tuple(symbols)
+    self.__word_indices = word_indices
+    self.__pronunciation_starts = pronunciation_starts
+    self.__symbol_starts = symbol_starts
+    self.__symbol_ids = array("H" if len(symbols) <= MAX_SHORT_SYMBOL_ID else "L", flat_symbol_ids)
+    # integer weights would be converted to float in an array
+    all_weights_are_float = all(isinstance(weight, float) for weight in weights)
+    self.__weights: Union[array, List[Weight]] = array(
+      "d", weights) if all_weights_are_float else weights
+
+  @property
+  def symbols(self) -> Tuple[Symbol, ...]:
+    return self.__symbols
+
+  def __getitem__(self, word: Word) -> Pronunciations:
+    word_index = self.__word_indices[word]
+    result = OrderedDict(
+      self.__get_pronunciation_weight_pair(pronunciation_index)
+      for pronunciation_index in range(
+        self.__pronunciation_starts[word_index],
+        self.__pronunciation_starts[word_index + 1],
+      )
+    )
+    return result
+
+  def __get_pronunciation_weight_pair(self, pronunciation_index: int) -> Tuple[Pronunciation, Weight]:
+    symbols = self.__symbols
+    start = self.__symbol_starts[pronunciation_index]
+    end = self.__symbol_starts[pronunciation_index + 1]
+    pronunciation = tuple(symbols[symbol_id] for symbol_id in self.__symbol_ids[start:end])
+    return pronunciation, self.__weights[pronunciation_index]
+
+  def __contains__(self, word: object) -> bool:
+    return word in self.__word_indices
+
+  def __iter__(self) -> Iterator[Word]:
+    return iter(self.__word_indices)
+
+  def __len__(self) -> int:
+    return len(self.__word_indices)
@@ -0,0 +1,39 @@
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from typing import IO, Literal, Optional
+
+Compression = Literal["gzip", "xz", "bz2", "zstd"]
+
+COMPRESSION_SUFFIXES = {
+  ".gz": "gzip",
+  ".xz": "xz",
+  ".lzma": "xz",
+  ".bz2": "bz2",
+  ".zst": "zstd",
+}
+
+BUFFER_SIZE = 1024 * 1024
+
+
+def get_compression(path: Path) -> Optional[Compression]:
+  result = COMPRESSION_SUFFIXES.get(path.suffix.lower())
+  return result
+
+
+def open_text(path: Path, mode: Literal["r", "w", "x"], encoding: str, compression: Optional[Compression]) -> IO[str]:
+  if compression is None:
+    return path.open(mode=mode, encoding=encoding, buffering=BUFFER_SIZE)
+  if compression == "gzip":
+    return gzip.open(path, mode=f"{mode}t", encoding=encoding)
+  if compression == "xz":
+    return lzma.open(path, mode=f"{mode}t", encoding=encoding)
+  if compression == "bz2":
+    return bz2.open(path, mode=f"{mode}t", encoding=encoding)
+  assert compression == "zstd"
+  try:
+    import zstandard
+  except ImportError as error:
+    raise ValueError("compression", "Package 'zstandard' is required for zstd compression!") from error
+  return zstandard.open(path, mode=f"{mode}t", encoding=encoding)
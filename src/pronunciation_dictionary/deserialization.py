@@ -1,13 +1,22 @@
 import re
-from collections import OrderedDict
+from collections import OrderedDict, abc, deque
 from dataclasses import dataclass
 from functools import partial
-from logging import getLogger
-from multiprocessing.pool import Pool
-from typing import List, Optional, Tuple
+from itertools import chain, islice
+from logging import DEBUG, Logger, getLogger
+from multiprocessing.pool import AsyncResult, Pool
+from sys import intern
+from time import perf_counter
+from typing import (Callable, Deque, FrozenSet, Generator, Iterable, List, Optional, Sequence,
+                    Tuple, TypeVar, Union)
 
+from pronunciation_dictionary.filtering import (EntryFilter, _get_word_predicate,
+                                                validate_entry_filter)
+from pronunciation_dictionary.metrics import PipelineMetrics
 from pronunciation_dictionary.mp_options import MultiprocessingOptions
-from pronunciation_dictionary.types import Pronunciation, PronunciationDict, Weight, Word
+from pronunciation_dictionary.progress import (CancellationToken, ProgressCallback,
+                                               ProgressReporter)
+from pronunciation_dictionary.types import Pronunciation, PronunciationDict, Symbol, Weight, Word
 from pronunciation_dictionary.validation import validate_mp_options, validate_type
 
 WORD_PRON_PATTERN = re.compile(r"(\S+)\s+(.+)")
@@ -18,6 +27,16 @@ WORD_ALT_PATTERN = re.compile(r"(\S+)(\([0-9]+\))")
 PRON_COMMENT_PATTERN = re.compile(r"(.*\S+)\s+(#.*)")
 PRON_SYMB_SEP_PATTERN = re.compile(r"\s+")
 DEFAULT_WEIGHT: Weight = 1.0
+PENDING_BLOCKS_PER_JOB = 4
+
+T = TypeVar("T")
+R = TypeVar("R")
+LineParseResult = Tuple[Optional[Tuple[Word, Optional[Weight], Pronunciation]], Sequence[str]]
+# None for lines which were removed by the words of the entry filter and the word for lines which were removed by its symbols
+FilteredLineParseResult = Union[None, Word, LineParseResult]
+NO_MESSAGES: Tuple[str, ...] = ()
+WEIGHT_CHARS = "0123456789."
+DIGIT_CHARS = "0123456789"
 
 
 @dataclass()
@@ -40,7 +59,7 @@ def validate_deserialization_options(options: DeserializationOptions) -> Optiona
   return None
 
 
-def deserialize(lines: List[str], options: DeserializationOptions, mp_options: MultiprocessingOptions) -> PronunciationDict:
+def deserialize(lines: List[str], options: DeserializationOptions, mp_options: MultiprocessingOptions, metrics: Optional[PipelineMetrics] = None, progress: Optional[ProgressCallback] = None, cancellation_token: Optional[CancellationToken] = None, entry_filter: Optional[EntryFilter] = None) -> PronunciationDict:
   if msg := validate_type(lines, list):
     raise ValueError(f"Property 'lines': {msg}")
   if msg := validate_deserialization_options(options):
@@ -51,129 +70,368 @@ def deserialize(lines: List[str], options: DeserializationOptions, mp_options: M
   if len(lines) == 0:
     return OrderedDict()
 
+  result = deserialize_lines(lines, options, mp_options, metrics,
+                             progress, cancellation_token, entry_filter)
+  return result
+
+
+def deserialize_lines(lines: Iterable[str], options: DeserializationOptions, mp_options: MultiprocessingOptions, metrics: Optional[PipelineMetrics] = None, progress: Optional[ProgressCallback] = None, cancellation_token: Optional[CancellationToken] = None, entry_filter: Optional[EntryFilter] = None) -> PronunciationDict:
+  if msg := validate_type(lines, abc.Iterable):
+    raise ValueError(f"Property 'lines': {msg}")
+  if msg := validate_deserialization_options(options):
+    raise ValueError(f"Parameter 'options': {msg}")
+  if msg := validate_mp_options(mp_options):
+    raise ValueError(f"Parameter 'mp_options': {msg}")
+
+  if msg := validate_progress_arguments(progress, cancellation_token):
+    raise ValueError(msg)
+  if entry_filter is not None and (msg := validate_entry_filter(entry_filter)):
+    raise ValueError(f"Parameter 'entry_filter': {msg}")
+
+  result = deserialize_sources([lines], options, mp_options, pool=None, metrics=metrics,
+                               progress=progress, cancellation_token=cancellation_token,
+                               entry_filter=entry_filter)[0]
+  return result
+
+
+def validate_progress_arguments(progress: Optional[ProgressCallback], cancellation_token: Optional[CancellationToken]) -> Optional[str]:
+  if progress is not None and not callable(progress):
+    return "Parameter 'progress': Value needs to be callable!"
+  if cancellation_token is not None and (msg := validate_type(cancellation_token, CancellationToken)):
+    return f"Parameter 'cancellation_token': {msg}"
+  return None
+
+
+def deserialize_sources(sources: List[Iterable[str]], options: DeserializationOptions, mp_options: MultiprocessingOptions, pool: Optional[Pool], metrics: Optional[PipelineMetrics] = None, progress: Optional[ProgressCallback] = None, cancellation_token: Optional[CancellationToken] = None, entry_filter: Optional[EntryFilter] = None) -> List[PronunciationDict]:
+  # the lines of all sources are parsed in the same pool one after another; they are consumed lazily, i.e., only the pending blocks are kept in memory
   logger = getLogger(__name__)
+  start = perf_counter()
+  progress_reporter = None if progress is None else ProgressReporter(progress)
+
+  pronunciation_dicts: List[PronunciationDict] = [OrderedDict() for _ in sources]
+  line_counts = [0] * len(sources)
+  skipped_counts = [0] * len(sources)
+  duplicate_counts = [0] * len(sources)
+  filtered_counts = [0] * len(sources)
+  parsed_blocks = __parse_blocks(sources, options, mp_options, pool,
+                                 metrics, cancellation_token, entry_filter)
+  try:
+    __merge_blocks(parsed_blocks, pronunciation_dicts, line_counts, skipped_counts, duplicate_counts,
+                   filtered_counts, metrics, progress_reporter, cancellation_token, logger)
+  finally:
+    # stops the own pool immediately if the parsing was cancelled or interrupted
+    parsed_blocks.close()
+  if entry_filter is not None and entry_filter.symbols is not None:
+    for pronunciation_dict in pronunciation_dicts:
+      __remove_placeholders(pronunciation_dict)
+  if progress_reporter is not None:
+    progress_reporter.finish()
 
-  process_method = partial(
-    process_get_pronunciation,
+  # the single lines are only logged on level DEBUG
+  for line_count, skipped_count, duplicate_count in zip(line_counts, skipped_counts, duplicate_counts):
+    if skipped_count > 0 or duplicate_count > 0:
+      logger.info(
+        f"Skipped {skipped_count} empty, comment or invalid line(s) and {duplicate_count} duplicate pronunciation(s) of {line_count} line(s).")
+  if entry_filter is not None:
+    for line_count, filtered_count in zip(line_counts, filtered_counts):
+      logger.info(f"Filtered out {filtered_count} of {line_count} line(s).")
+
+  if metrics is not None:
+    metrics.add_count("lines", sum(line_counts))
+    metrics.add_count("skipped_lines", sum(skipped_counts))
+    metrics.add_count("duplicates", sum(duplicate_counts))
+    if entry_filter is not None:
+      metrics.add_count("filtered_lines", sum(filtered_counts))
+    metrics.add_count("words", sum(len(pronunciation_dict) for pronunciation_dict in pronunciation_dicts))
+    metrics.add_seconds("deserialization", perf_counter() - start)
+  return pronunciation_dicts
+
+
+def __merge_blocks(parsed_blocks: Iterable[Tuple[int, List[FilteredLineParseResult]]], pronunciation_dicts: List[PronunciationDict], line_counts: List[int], skipped_counts: List[int], duplicate_counts: List[int], filtered_counts: List[int], metrics: Optional[PipelineMetrics], progress_reporter: Optional[ProgressReporter], cancellation_token: Optional[CancellationToken], logger: Logger) -> None:
+  # the messages of each line would be formatted even if they aren't logged
+  log_debug = logger.isEnabledFor(DEBUG)
+  for source_i, block_result in parsed_blocks:
+    if cancellation_token is not None:
+      cancellation_token.raise_if_cancelled()
+    merge_start = perf_counter()
+    pronunciation_dict = pronunciation_dicts[source_i]
+    line_nr = line_counts[source_i]
+    for line_result in block_result:
+      line_nr += 1
+      if line_result is None:
+        filtered_counts[source_i] += 1
+        continue
+      if isinstance(line_result, str):
+        filtered_counts[source_i] += 1
+        if line_result not in pronunciation_dict:
+          # the placeholder keeps the position the word would have without the filter, it is removed afterwards if the word gets no pronunciation
+          pronunciation_dict[line_result] = None
+        continue
+      values, messages = line_result
+      for message in messages:
+        logger.debug(f"Line {line_nr}: {message}")
+      if values is None:
+        skipped_counts[source_i] += 1
+        continue
+      if not __add_entry(pronunciation_dict, values, line_nr, logger, log_debug):
+        duplicate_counts[source_i] += 1
+    line_counts[source_i] = line_nr
+    if metrics is not None:
+      metrics.add_seconds("merge", perf_counter() - merge_start)
+    if progress_reporter is not None:
+      progress_reporter.update(len(block_result))
+
+
+def __remove_placeholders(pronunciation_dict: PronunciationDict) -> None:
+  removed_words = [
+    word for word, pronunciations in pronunciation_dict.items()
+    if pronunciations is None
+  ]
+  for word in removed_words:
+    del pronunciation_dict[word]
+
+
+def __parse_blocks(sources: List[Iterable[str]], options: DeserializationOptions, mp_options: MultiprocessingOptions, pool: Optional[Pool], metrics: Optional[PipelineMetrics], cancellation_token: Optional[CancellationToken], entry_filter: Optional[EntryFilter]) -> Generator[Tuple[int, List[FilteredLineParseResult]], None, None]:
+  # only the symbols are sent to the workers, the words are checked before
+  symbols = None
+  if entry_filter is not None and entry_filter.symbols is not None:
+    symbols = frozenset(entry_filter.symbols)
+  parse_method = partial(
+    process_parse_block,
     options=options,
+    collect_messages=getLogger(__name__).isEnabledFor(DEBUG),
+    is_filtered=entry_filter is not None,
+    symbols=symbols,
   )
 
+  # each block consists of `chunksize` contiguous lines of one source and is parsed as one task
+  blocks = (
+    (source_i, block)
+    for source_i, lines in enumerate(sources)
+    for block in get_batches(lines, mp_options.chunksize)
+  )
+  if entry_filter is not None and (word_predicate := _get_word_predicate(entry_filter)) is not None:
+    is_line_kept = __get_line_filter(word_predicate, options)
+    # the removed lines are replaced by None to keep the line numbers
+    blocks = (
+      (source_i, [line if is_line_kept(line) else None for line in block])
+      for source_i, block in blocks
+    )
+  if metrics is not None:
+    blocks = metrics.measure_iterable("read", blocks)
+  if cancellation_token is not None:
+    # no further blocks are read or submitted after the cancellation
+    blocks = __stop_if_cancelled(blocks, cancellation_token)
+  first_blocks = list(islice(blocks, 2))
+  blocks = chain(first_blocks, blocks)
+
+  fits_into_one_block = len(first_blocks) < 2
+  if mp_options.n_jobs == 1 or fits_into_one_block:
+    for block in blocks:
+      source_i, result, parse_seconds = parse_method(block)
+      if metrics is not None:
+        metrics.add_seconds("parse", parse_seconds)
+      yield source_i, result
+    return
+
+  max_pending_blocks = mp_options.n_jobs * PENDING_BLOCKS_PER_JOB
+  if pool is not None:
+    yield from __parse_blocks_in_pool(pool, parse_method, blocks, max_pending_blocks, mp_options.n_jobs, metrics)
+    return
+
+  pool_start = perf_counter()
   with Pool(
     processes=mp_options.n_jobs,
-    initializer=__init_pool_prepare_cache_mp,
-    initargs=(lines,),
     maxtasksperchild=mp_options.maxtasksperchild,
   ) as pool:
-    entries = range(len(lines))
-    iterator = pool.imap(process_method, entries, mp_options.chunksize)
-    # iterator = tqdm(iterator, total=len(entries), unit="lines")
-    result = dict(iterator)
-
-  pronunciation_dict: PronunciationDict = OrderedDict()
-  for line_i in range(len(lines)):
-    line_nr = line_i + 1
-    assert line_i in result
-    values, messages = result[line_i]
-    for message in messages:
-      logger.info(f"Line {line_nr}: {message}")
-    if values is None:
-      continue
-    word, weight, pronunciation = values
-    had_weight = weight is not None
-
-    if weight is None:
-      weight = DEFAULT_WEIGHT
-
-    if had_weight and weight == 0:
-      logger.info(
-        f"Line {line_nr}: Ignored line because to word \"{word}\" the pronunciation \"{' '.join(pronunciation)}\" had zero weight.")
-    if word in pronunciation_dict:
-      if pronunciation in pronunciation_dict[word]:
-        if had_weight:
-          existing_weight = pronunciation_dict[word]
-          if weight != existing_weight:
-            logger.warning(
-              f"Line {line_nr}: Ignored line because to word \"{word}\" the pronunciation \"{' '.join(pronunciation)}\" was already assigned previously but with another weight ({existing_weight} vs. {weight})!.")
-          else:
-            logger.info(
-              f"Line {line_nr}: Ignored line because to word \"{word}\" the pronunciation \"{' '.join(pronunciation)}\" was already assigned previously (with same weight of {weight}).")
-        else:
-          logger.info(
-            f"Line {line_nr}: Ignored line because to word \"{word}\" the pronunciation \"{' '.join(pronunciation)}\" was already assigned previously.")
-        continue
-      pronunciation_dict[word][pronunciation] = weight
-    else:
-      pronunciation_dict[word] = OrderedDict((
-        (pronunciation, weight),
-      ))
+    if metrics is not None:
+      metrics.add_seconds("pool_startup", perf_counter() - pool_start)
+    yield from __parse_blocks_in_pool(pool, parse_method, blocks, max_pending_blocks, mp_options.n_jobs, metrics)
+
+
+def __parse_blocks_in_pool(pool: Pool, parse_method: Callable[[Tuple[int, List[Optional[str]]]], Tuple[int, List[FilteredLineParseResult], float]], blocks: Iterable[Tuple[int, List[Optional[str]]]], max_pending_blocks: int, n_jobs: int, metrics: Optional[PipelineMetrics]) -> Generator[Tuple[int, List[FilteredLineParseResult]], None, None]:
+  start = perf_counter()
+  for source_i, result, parse_seconds in imap_bounded(pool, parse_method, blocks, max_pending_blocks, metrics):
+    if metrics is not None:
+      metrics.add_seconds("worker", parse_seconds)
+    yield source_i, result
+  if metrics is not None:
+    metrics.n_jobs = n_jobs
+    metrics.add_seconds("parallel", perf_counter() - start)
+
+
+def __stop_if_cancelled(items: Iterable[T], cancellation_token: CancellationToken) -> Generator[T, None, None]:
+  for item in items:
+    cancellation_token.raise_if_cancelled()
+    yield item
+
+
+def imap_bounded(pool: Pool, method: Callable[[T], R], tasks: Iterable[T], max_pending: int, metrics: Optional[PipelineMetrics] = None) -> Generator[R, None, None]:
+  # in contrast to `Pool.imap`, the tasks are not read all at once; the results are returned in order
+  pending: Deque[AsyncResult] = deque()
+  for task in tasks:
+    pending.append(pool.apply_async(method, (task,)))
+    if len(pending) >= max_pending:
+      yield __get_result(pending.popleft(), metrics)
+  while len(pending) > 0:
+    yield __get_result(pending.popleft(), metrics)
+
+
+def __get_result(async_result: AsyncResult, metrics: Optional[PipelineMetrics]) -> R:
+  if metrics is None:
+    return async_result.get()
+  with metrics.measure("wait"):
+    return async_result.get()
+
+
+def get_batches(items: Iterable[T], batch_size: int) -> Generator[List[T], None, None]:
+  iterator = iter(items)
+  while batch := list(islice(iterator, batch_size)):
+    yield batch
+
+
+def process_parse_block(task: Tuple[int, List[Optional[str]]], options: DeserializationOptions, collect_messages: bool, is_filtered: bool = False, symbols: Optional[FrozenSet[Symbol]] = None) -> Tuple[int, List[FilteredLineParseResult], float]:
+  start = perf_counter()
+  source_i, block = task
+  parse = get_line_parser(options, collect_messages)
+  if is_filtered:
+    parse = __get_filtered_parser(parse, symbols)
+  result = list(map(parse, block))
+  return source_i, result, perf_counter() - start
 
-  return pronunciation_dict
 
+def __get_filtered_parser(parse: Callable[[str], LineParseResult], symbols: Optional[FrozenSet[Symbol]]) -> Callable[[Optional[str]], FilteredLineParseResult]:
+  # lines which were removed before are not parsed
+  def parse_filtered(line: Optional[str]) -> FilteredLineParseResult:
+    if line is None:
+      return None
+    result = parse(line)
+    values = result[0]
+    if symbols is not None and values is not None and not symbols.issuperset(values[2]):
+      return values[0]
+    return result
 
-process_lines: List[str] = None
+  return parse_filtered
 
 
-def __init_pool_prepare_cache_mp(lines: List[str]) -> None:
-  global process_lines
-  process_lines = lines
+def __get_line_filter(word_predicate: Callable[[Word], bool], options: DeserializationOptions) -> Callable[[str], bool]:
+  # checks only the first token like `parse` would get the word; empty, comment and invalid lines are kept to be skipped by the parser
+  consider_comments = options.consider_comments
+  consider_word_nrs = options.consider_word_nrs
 
+  def is_line_kept(line: str) -> bool:
+    parts = line.split(None, 1)
+    if len(parts) < 2:
+      return True
+    word = parts[0]
+    if consider_comments and word.startswith(";;;"):
+      return True
+    if consider_word_nrs and word[-1] == ")":
+      nr_start = word.rfind("(")
+      if nr_start > 0 and nr_start < len(word) - 2 and not word[nr_start + 1:-1].strip(DIGIT_CHARS):
+        word = word[:nr_start]
+    return word_predicate(word)
 
-def process_get_pronunciation(line_i: int, options: DeserializationOptions) -> Tuple[int, Optional[Tuple[Tuple[Word, Optional[Weight], Pronunciation], List[str]]]]:
-  global process_lines
-  assert 0 <= line_i < len(process_lines)
-  line = process_lines[line_i]
-  return line_i, parse_line(line, options)
+  return is_line_kept
 
 
-def parse_line(line: str, options: DeserializationOptions) -> Optional[Tuple[Tuple[Word, Optional[Weight], Pronunciation], List[str]]]:
-  line = line.strip()
-  line_is_empty = line == ""
-  if line_is_empty:
-    return None, ["Ignored empty line."]
+def __add_entry(pronunciation_dict: PronunciationDict, values: Tuple[Word, Optional[Weight], Pronunciation], line_nr: int, logger: Logger, log_debug: bool) -> bool:
+  # returns False if the pronunciation was already assigned
+  word, weight, pronunciation = values
+  had_weight = weight is not None
 
-  if options.consider_comments:
-    is_comment = line.startswith(";;;")
-    if is_comment:
-      return None, [f"Ignored comment -> \"{line}\""]
+  if weight is None:
+    weight = DEFAULT_WEIGHT
 
-  if options.consider_weights:
-    word_weight_pronun_match = re.fullmatch(WORD_WEIGHT_PRON_PATTERN, line)
-    is_invalid_line = word_weight_pronun_match is None
-    if is_invalid_line:
-      return None, [f"Ignored invalid line -> \"{line}\""]
-    word = word_weight_pronun_match.group(1)
-    weight = word_weight_pronun_match.group(2)
-    pronunciation = word_weight_pronun_match.group(3)
-    try:
-      weight = float(weight)
-    except ValueError as error:
-      return None, [f"Weight couldn't be parsed -> \"{weight}\""]
+  if log_debug and had_weight and weight == 0:
+    logger.debug(
+      f"Line {line_nr}: Ignored line because to word \"{word}\" the pronunciation \"{' '.join(pronunciation)}\" had zero weight.")
+  pronunciations = pronunciation_dict.get(word)
+  if pronunciations is not None:
+    if pronunciation in pronunciations:
+      if had_weight:
+        existing_weight = pronunciations[pronunciation]
+        if weight != existing_weight:
+          logger.warning(
+            f"Line {line_nr}: Ignored line because to word \"{word}\" the pronunciation \"{' '.join(pronunciation)}\" was already assigned previously but with another weight ({existing_weight} vs. {weight})!.")
+        elif log_debug:
+          logger.debug(
+            f"Line {line_nr}: Ignored line because to word \"{word}\" the pronunciation \"{' '.join(pronunciation)}\" was already assigned previously (with same weight of {weight}).")
+      elif log_debug:
+        logger.debug(
+          f"Line {line_nr}: Ignored line because to word \"{word}\" the pronunciation \"{' '.join(pronunciation)}\" was already assigned previously.")
+      return False
+    pronunciations[pronunciation] = weight
   else:
-    word_pronun_match = re.fullmatch(WORD_PRON_PATTERN, line)
-    is_invalid_line = word_pronun_match is None
-    if is_invalid_line:
-      return None, [f"Ignored invalid line -> \"{line}\""]
-    word = word_pronun_match.group(1)
-    weight = None
-    pronunciation = word_pronun_match.group(2)
-
-  msgs = []
-
-  if options.consider_word_nrs:
-    word_nr_match = re.fullmatch(WORD_ALT_PATTERN, word)
-    has_word_nr = word_nr_match is not None
-    if has_word_nr:
-      word = word_nr_match.group(1)
-      msgs.append(f"Got alternate pronunciation \"{word_nr_match.group(2)}\" for word \"{word}\"")
-
-  if options.consider_pronunciation_comments:
-    comment_match = re.fullmatch(PRON_COMMENT_PATTERN, pronunciation)
-    has_comment = comment_match is not None
-    if has_comment:
-      pronunciation = comment_match.group(1)
-      msgs.append(
-        f"Got comment for word \"{word}\" and pronunciation \"{pronunciation}\" -> \"{comment_match.group(2)}\"")
-
-  symbols = re.split(PRON_SYMB_SEP_PATTERN, pronunciation)
-  pronunciation = tuple(symbols)
-  return (word, weight, pronunciation), msgs
+    # replaces a placeholder of the entry filter at its position
+    pronunciation_dict[word] = OrderedDict((
+      (pronunciation, weight),
+    ))
+  return True
+
+
+def parse_line(line: str, options: DeserializationOptions) -> LineParseResult:
+  parse = get_line_parser(options, collect_messages=True)
+  result = parse(line)
+  return result
+
+
+def get_line_parser(options: DeserializationOptions, collect_messages: bool) -> Callable[[str], LineParseResult]:
+  # the parser implements the patterns from above by splitting each line only once
+  consider_comments = options.consider_comments
+  consider_word_nrs = options.consider_word_nrs
+  consider_pronunciation_comments = options.consider_pronunciation_comments
+  consider_weights = options.consider_weights
+  max_split = 2 if consider_weights else 1
+
+  def parse(line: str) -> LineParseResult:
+    line = line.strip()
+    if not line:
+      return None, ["Ignored empty line."] if collect_messages else NO_MESSAGES
+
+    if consider_comments and line.startswith(";;;"):
+      return None, [f"Ignored comment -> \"{line}\""] if collect_messages else NO_MESSAGES
+
+    parts = line.split(None, max_split)
+    # `.` doesn't match line breaks in the patterns
+    if len(parts) <= max_split or "\n" in parts[max_split]:
+      return None, [f"Ignored invalid line -> \"{line}\""] if collect_messages else NO_MESSAGES
+
+    if consider_weights:
+      word, weight, pronunciation = parts
+      if weight.strip(WEIGHT_CHARS):
+        return None, [f"Ignored invalid line -> \"{line}\""] if collect_messages else NO_MESSAGES
+      try:
+        weight = float(weight)
+      except ValueError:
+        return None, [f"Weight couldn't be parsed -> \"{weight}\""] if collect_messages else NO_MESSAGES
+    else:
+      word, pronunciation = parts
+      weight = None
+
+    msgs = [] if collect_messages else NO_MESSAGES
+
+    if consider_word_nrs and word[-1] == ")":
+      nr_start = word.rfind("(")
+      if nr_start > 0 and nr_start < len(word) - 2 and not word[nr_start + 1:-1].strip(DIGIT_CHARS):
+        word_nr = word[nr_start:]
+        word = word[:nr_start]
+        if collect_messages:
+          msgs.append(f"Got alternate pronunciation \"{word_nr}\" for word \"{word}\"")
+
+    symbols = pronunciation.split()
+
+    if consider_pronunciation_comments and "#" in pronunciation:
+      for symbol_i in range(len(symbols) - 1, 0, -1):
+        if symbols[symbol_i][0] == "#":
+          symbols = symbols[:symbol_i]
+          if collect_messages:
+            comment_match = PRON_COMMENT_PATTERN.fullmatch(pronunciation)
+            msgs.append(
+              f"Got comment for word \"{word}\" and pronunciation \"{comment_match.group(1)}\" -> \"{comment_match.group(2)}\"")
+          break
+
+    # symbols are interned, i.e., each distinct symbol is stored only once
+    return (word, weight, tuple(map(intern, symbols))), msgs
+
+  return parse
@@ -0,0 +1,133 @@
+import heapq
+import pickle
+from collections import OrderedDict
+from itertools import groupby
+from logging import getLogger
+from operator import itemgetter
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Generator, Iterable, Iterator, List, Optional, Tuple
+
+from pronunciation_dictionary.deserialization import (DEFAULT_WEIGHT, DeserializationOptions,
+                                                      get_batches, get_line_parser,
+                                                      validate_deserialization_options)
+from pronunciation_dictionary.io import _read_lines
+from pronunciation_dictionary.merging import _write_entries_atomic
+from pronunciation_dictionary.serialization import (SerializationOptions,
+                                                    _validate_serialization_options)
+from pronunciation_dictionary.types import Pronunciation, Pronunciations, Weight, Word
+from pronunciation_dictionary.validation import validate_type
+
+DEFAULT_MAX_ENTRIES_IN_MEMORY = 1000000
+# entries which are pickled at once into a run file
+RUN_BATCH_SIZE = 10000
+
+# word, line number, weight (None if the line had no weight) and pronunciation
+SortEntry = Tuple[Word, int, Optional[Weight], Pronunciation]
+
+
+def sort_dict_file(path: Path, output_path: Path, encoding: str, options: DeserializationOptions, serialization_options: SerializationOptions, max_entries_in_memory: int = DEFAULT_MAX_ENTRIES_IN_MEMORY, tmp_dir: Optional[Path] = None) -> None:
+  # sorts the words of a file which doesn't need to fit into memory; the pronunciations are deduplicated like in `deserialize`
+  if msg := validate_type(path, Path):
+    raise ValueError(f"Parameter 'path': {msg}")
+  if msg := validate_type(output_path, Path):
+    raise ValueError(f"Parameter 'output_path': {msg}")
+  if msg := validate_type(encoding, str):
+    raise ValueError(f"Parameter 'encoding': {msg}")
+  if msg := validate_deserialization_options(options):
+    raise ValueError(f"Parameter 'options': {msg}")
+  if msg := _validate_serialization_options(serialization_options):
+    raise ValueError(f"Parameter 'serialization_options': {msg}")
+  if not (isinstance(max_entries_in_memory, int) and max_entries_in_memory > 0):
+    raise ValueError("Parameter 'max_entries_in_memory': Invalid value!")
+  if tmp_dir is not None and (msg := validate_type(tmp_dir, Path)):
+    raise ValueError(f"Parameter 'tmp_dir': {msg}")
+
+  logger = getLogger(__name__)
+  line_counts = [0, 0]
+  entries = __get_entries(_read_lines(path, encoding), options, line_counts)
+  runs = get_batches(entries, max_entries_in_memory)
+
+  with TemporaryDirectory(prefix="pronunciation_dictionary_sort", dir=tmp_dir) as runs_dir:
+    run_paths: List[Path] = []
+    sorted_entries: Iterable[SortEntry] = ()
+    for run in runs:
+      # the line numbers are unique, i.e., the entries are sorted by word and then by their order in the file
+      run.sort()
+      if len(run_paths) == 0 and len(run) < max_entries_in_memory:
+        # the whole file fits into memory
+        sorted_entries = run
+        break
+      run_paths.append(__write_run(run, Path(runs_dir), len(run_paths)))
+      # the run is released before the next one is read
+      del run
+    if len(run_paths) > 0:
+      logger.debug(f"Merging {len(run_paths)} sorted runs.")
+      sorted_entries = heapq.merge(*(__read_run(run_path) for run_path in run_paths))
+
+    duplicate_counts = [0, 0]
+    words = (
+      (word, __get_pronunciations(word_entries, duplicate_counts))
+      for word, word_entries in groupby(sorted_entries, key=itemgetter(0))
+    )
+    # the output can be the input file
+    _write_entries_atomic(output_path, encoding, words, serialization_options)
+
+  line_count, skipped_count = line_counts
+  duplicate_count, conflict_count = duplicate_counts
+  if skipped_count > 0 or duplicate_count > 0:
+    logger.info(
+      f"Skipped {skipped_count} empty, comment or invalid line(s) and {duplicate_count} duplicate pronunciation(s) of {line_count} line(s).")
+  if conflict_count > 0:
+    logger.warning(
+      f"{conflict_count} duplicate pronunciation(s) had another weight than the first occurrence and were ignored!")
+
+
+def __get_entries(lines: Iterable[str], options: DeserializationOptions, line_counts: List[int]) -> Generator[SortEntry, None, None]:
+  parse = get_line_parser(options, collect_messages=False)
+  line_nr = 0
+  for line_nr, line in enumerate(lines, start=1):
+    values, _ = parse(line)
+    if values is None:
+      line_counts[1] += 1
+      continue
+    word, weight, pronunciation = values
+    # the line number keeps the order of the pronunciations of a word
+    yield word, line_nr, weight, pronunciation
+  line_counts[0] = line_nr
+
+
+def __write_run(run: List[SortEntry], runs_dir: Path, run_nr: int) -> Path:
+  run_path = runs_dir / f"{run_nr}.pickle"
+  with run_path.open(mode="wb") as file:
+    for batch in get_batches(run, RUN_BATCH_SIZE):
+      pickle.dump(batch, file, protocol=pickle.HIGHEST_PROTOCOL)
+  return run_path
+
+
+def __read_run(run_path: Path) -> Generator[SortEntry, None, None]:
+  with run_path.open(mode="rb") as file:
+    while True:
+      try:
+        batch = pickle.load(file)
+      except EOFError:
+        return
+      yield from batch
+
+
+def __get_pronunciations(word_entries: Iterator[SortEntry], duplicate_counts: List[int]) -> Pronunciations:
+  # the first occurrence of a pronunciation is kept like in `deserialize`
+  result: Pronunciations = OrderedDict()
+  for _, _, weight, pronunciation in word_entries:
+    had_weight = weight is not None
+    if weight is None:
+      weight = DEFAULT_WEIGHT
+    existing_weight = result.get(pronunciation)
+    if existing_weight is None:
+      result[pronunciation] = weight
+      continue
+    duplicate_counts[0] += 1
+    if had_weight and weight != existing_weight:
+      duplicate_counts[1] += 1
+  return result
+
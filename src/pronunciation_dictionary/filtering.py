@@ -0,0 +1,79 @@
+import re
+from collections import OrderedDict
+from collections.abc import Set
+from dataclasses import dataclass
+from typing import AbstractSet, Callable, Optional, Pattern
+
+from pronunciation_dictionary.types import Pronunciation, PronunciationDict, Symbol, Word
+from pronunciation_dictionary.validation import validate_dictionary, validate_type
+
+
+@dataclass()
+class EntryFilter():
+  # an entry is kept if it matches all given properties; words are compared without their word numbers, e.g., `ABBE` for `ABBE(2)`
+  words: Optional[AbstractSet[Word]] = None
+  # needs to match the whole word
+  word_pattern: Optional[Pattern] = None
+  # all symbols of the pronunciation need to be contained
+  symbols: Optional[AbstractSet[Symbol]] = None
+
+
+def validate_entry_filter(entry_filter: EntryFilter) -> Optional[str]:
+  if msg := validate_type(entry_filter, EntryFilter):
+    return msg
+  if not (entry_filter.words is None or isinstance(entry_filter.words, Set)):
+    return "Property 'words' is invalid!"
+  if not (entry_filter.word_pattern is None or isinstance(entry_filter.word_pattern, re.Pattern)):
+    return "Property 'word_pattern' is invalid!"
+  if not (entry_filter.symbols is None or isinstance(entry_filter.symbols, Set)):
+    return "Property 'symbols' is invalid!"
+  return None
+
+
+def filter_dict(dictionary: PronunciationDict, entry_filter: EntryFilter, validate: bool = True) -> PronunciationDict:
+  # returns the same entries in the same order as loading the dictionary with `entry_filter`; the dictionary is not changed
+  if validate:
+    try:
+      validate_dictionary(dictionary)
+    except ValueError as error:
+      raise ValueError("dictionary", error.args[1]) from error
+  if msg := validate_entry_filter(entry_filter):
+    raise ValueError(f"Parameter 'entry_filter': {msg}")
+
+  is_word_kept = _get_word_predicate(entry_filter)
+  is_pronunciation_kept = _get_pronunciation_predicate(entry_filter)
+  result: PronunciationDict = OrderedDict()
+  for word, pronunciations in dictionary.items():
+    if is_word_kept is not None and not is_word_kept(word):
+      continue
+    if is_pronunciation_kept is None:
+      result[word] = pronunciations.copy()
+      continue
+    kept_pronunciations = OrderedDict(
+      (pronunciation, weight)
+      for pronunciation, weight in pronunciations.items()
+      if is_pronunciation_kept(pronunciation)
+    )
+    if len(kept_pronunciations) > 0:
+      result[word] = kept_pronunciations
+  return result
+
+
+def _get_word_predicate(entry_filter: EntryFilter) -> Optional[Callable[[Word], bool]]:
+  # None if all words are kept
+  words = entry_filter.words
+  word_pattern = entry_filter.word_pattern
+  if words is None and word_pattern is None:
+    return None
+  if word_pattern is None:
+    return words.__contains__
+  if words is None:
+    return lambda word: word_pattern.fullmatch(word) is not None
+  return lambda word: word in words and word_pattern.fullmatch(word) is not None
+
+
+def _get_pronunciation_predicate(entry_filter: EntryFilter) -> Optional[Callable[[Pronunciation], bool]]:
+  # None if all pronunciations are kept
+  if entry_filter.symbols is None:
+    return None
+  return frozenset(entry_filter.symbols).issuperset
@@ -1,36 +1,115 @@
+import asyncio
+import os
+from functools import partial
+from multiprocessing.pool import Pool
 from pathlib import Path
-from typing import List
-from urllib.request import urlopen
+from time import perf_counter
+from typing import IO, Generator, Iterable, List, Optional
+from uuid import uuid4
 
-from pronunciation_dictionary.deserialization import (DeserializationOptions, deserialize,
-                                                      validate_deserialization_options)
+from pronunciation_dictionary.compression import Compression, get_compression, open_text
+from pronunciation_dictionary.deserialization import (DeserializationOptions, deserialize_lines,
+                                                      deserialize_sources,
+                                                      validate_deserialization_options,
+                                                      validate_progress_arguments)
+from pronunciation_dictionary.filtering import EntryFilter, filter_dict, validate_entry_filter
+from pronunciation_dictionary.metrics import PipelineMetrics
 from pronunciation_dictionary.mp_options import MultiprocessingOptions
-from pronunciation_dictionary.serialization import (SerializationOptions,
-                                                    _validate_serialization_options, serialize)
+from pronunciation_dictionary.parse_cache import ParseCache
+from pronunciation_dictionary.progress import (CancellationToken, ProgressCallback,
+                                               ProgressReporter)
+from pronunciation_dictionary.serialization import (SerializationOptions, _serialize_blocks,
+                                                    _validate_serialization_options)
 from pronunciation_dictionary.types import PronunciationDict
+from pronunciation_dictionary.url_reading import HttpConnectionPool, read_url_lines
 from pronunciation_dictionary.validation import (validate_dictionary, validate_mp_options,
                                                  validate_type)
 
 
-def save_dict(dictionary: PronunciationDict, path: Path, encoding: str, options: SerializationOptions) -> None:
-  try:
-    validate_dictionary(dictionary)
-  except ValueError as error:
-    raise ValueError("dictionary", error.args[1]) from error
+def save_dict(dictionary: PronunciationDict, path: Path, encoding: str, options: SerializationOptions, validate: bool = True, atomic: bool = False, mp_options: Optional[MultiprocessingOptions] = None, metrics: Optional[PipelineMetrics] = None, progress: Optional[ProgressCallback] = None, cancellation_token: Optional[CancellationToken] = None) -> None:
+  if validate:
+    validation_start = perf_counter()
+    try:
+      validate_dictionary(dictionary)
+    except ValueError as error:
+      raise ValueError("dictionary", error.args[1]) from error
+    if metrics is not None:
+      metrics.add_seconds("validation", perf_counter() - validation_start)
   if msg := validate_type(path, Path):
     raise ValueError(f"Parameter 'path': {msg}")
   if msg := validate_type(encoding, str):
     raise ValueError(f"Parameter 'encoding': {msg}")
   if msg := _validate_serialization_options(options):
     raise ValueError(f"Parameter 'options': {msg}")
+  if msg := validate_type(atomic, bool):
+    raise ValueError(f"Parameter 'atomic': {msg}")
+  if mp_options is not None and (msg := validate_mp_options(mp_options)):
+    raise ValueError(f"Parameter 'mp_options': {msg}")
+  if msg := validate_progress_arguments(progress, cancellation_token):
+    raise ValueError(msg)
 
-  lines_gen = serialize(dictionary, options)
-  dict_content = "\n".join(lines_gen)
+  # the dictionary was already validated
+  serialized_blocks = _serialize_blocks(dictionary, options, mp_options)
+  blocks: Iterable[str] = serialized_blocks
+  if metrics is not None:
+    blocks = metrics.measure_iterable("serialization", blocks)
+  progress_reporter = None if progress is None else ProgressReporter(progress)
+  compression = get_compression(path)
   path.parent.mkdir(parents=True, exist_ok=True)
-  path.write_text(dict_content, encoding)
 
+  try:
+    if not atomic:
+      # a cancelled or interrupted write leaves a partially written file
+      with open_text(path, "w", encoding, compression) as file:
+        __write_blocks(file, blocks, metrics, progress_reporter, cancellation_token)
+    else:
+      __write_atomic(path, encoding, compression, blocks,
+                     metrics, progress_reporter, cancellation_token)
+  finally:
+    # stops the own pool immediately if the writing was cancelled or interrupted
+    serialized_blocks.close()
+  if progress_reporter is not None:
+    progress_reporter.finish()
+  if metrics is not None:
+    metrics.add_count("bytes", path.stat().st_size)
+
+
+def __write_atomic(path: Path, encoding: str, compression: Optional[Compression], blocks: Iterable[str], metrics: Optional[PipelineMetrics], progress_reporter: Optional[ProgressReporter], cancellation_token: Optional[CancellationToken]) -> None:
+  # the file is renamed only after it was written completely
+  tmp_path = path.parent / f".{path.name}.{uuid4().hex}.tmp"
+  try:
+    with open_text(tmp_path, "x", encoding, compression) as file:
+      __write_blocks(file, blocks, metrics, progress_reporter, cancellation_token)
+    os.replace(tmp_path, path)
+  except BaseException:
+    tmp_path.unlink(missing_ok=True)
+    raise
+
+
+def __write_blocks(file: IO[str], blocks: Iterable[str], metrics: Optional[PipelineMetrics], progress_reporter: Optional[ProgressReporter], cancellation_token: Optional[CancellationToken]) -> None:
+  # the same content as `"\n".join(serialize(...))` is written without holding all lines in memory
+  is_first_block = True
+  for block in blocks:
+    if cancellation_token is not None:
+      cancellation_token.raise_if_cancelled()
+    if block == "":
+      continue
+    write_start = perf_counter()
+    if not is_first_block:
+      file.write("\n")
+    file.write(block)
+    is_first_block = False
+    if metrics is not None or progress_reporter is not None:
+      line_count = block.count("\n") + 1
+      if metrics is not None:
+        metrics.add_seconds("write", perf_counter() - write_start)
+        metrics.add_count("lines", line_count)
+      if progress_reporter is not None:
+        progress_reporter.update(line_count)
 
-def load_dict(path: Path, encoding: str, options: DeserializationOptions, mp_options: MultiprocessingOptions) -> PronunciationDict:
+
+def load_dict(path: Path, encoding: str, options: DeserializationOptions, mp_options: MultiprocessingOptions, cache: Optional[ParseCache] = None, metrics: Optional[PipelineMetrics] = None, progress: Optional[ProgressCallback] = None, cancellation_token: Optional[CancellationToken] = None, entry_filter: Optional[EntryFilter] = None) -> PronunciationDict:
+  # with `entry_filter`, cached dictionaries are filtered and the filtered result is not cached
   if msg := validate_type(path, Path):
     raise ValueError(f"Parameter 'path': {msg}")
   if msg := validate_type(encoding, str):
@@ -39,14 +118,150 @@ def load_dict(path: Path, encoding: str, options: DeserializationOptions, mp_opt
     raise ValueError(f"Parameter 'options': {msg}")
   if msg := validate_mp_options(mp_options):
     raise ValueError(f"Parameter 'mp_options': {msg}")
+  if cache is not None and (msg := validate_type(cache, ParseCache)):
+    raise ValueError(f"Parameter 'cache': {msg}")
+  if msg := validate_progress_arguments(progress, cancellation_token):
+    raise ValueError(msg)
+  if entry_filter is not None and (msg := validate_entry_filter(entry_filter)):
+    raise ValueError(f"Parameter 'entry_filter': {msg}")
+
+  file_key = None
+  if cache is not None:
+    cache_start = perf_counter()
+    # the key is taken before the file is read, i.e., a file which changes while it is parsed is parsed again on the next load
+    file_key = cache.get_file_key(path)
+    result = cache.get(path, encoding, options, file_key)
+    if metrics is not None:
+      metrics.add_seconds("cache", perf_counter() - cache_start)
+    if result is not None:
+      if metrics is not None:
+        metrics.add_count("cache_hits")
+      if entry_filter is not None:
+        result = filter_dict(result, entry_filter, validate=False)
+      return result
+
+  if metrics is not None:
+    metrics.add_count("bytes", path.stat().st_size)
+  lines = _read_lines(path, encoding)
+  result = deserialize_lines(lines, options, mp_options, metrics,
+                             progress, cancellation_token, entry_filter)
+
+  if cache is not None and entry_filter is None:
+    cache_start = perf_counter()
+    cache.put(path, encoding, options, result, file_key)
+    if metrics is not None:
+      metrics.add_seconds("cache", perf_counter() - cache_start)
+  return result
+
+
+def load_dicts(paths: List[Path], encoding: str, options: DeserializationOptions, mp_options: MultiprocessingOptions, cache: Optional[ParseCache] = None, metrics: Optional[PipelineMetrics] = None, progress: Optional[ProgressCallback] = None, cancellation_token: Optional[CancellationToken] = None, entry_filter: Optional[EntryFilter] = None) -> List[PronunciationDict]:
+  if msg := validate_mp_options(mp_options):
+    raise ValueError(f"Parameter 'mp_options': {msg}")
 
-  text = path.read_text(encoding)
-  lines = text.splitlines()
-  result = deserialize(lines, options, mp_options)
+  with DictionaryLoader(mp_options) as loader:
+    result = loader.load_dicts(paths, encoding, options, cache, metrics,
+                               progress, cancellation_token, entry_filter)
   return result
 
 
-def load_dict_from_url(url: str, encoding: str, options: DeserializationOptions, mp_options: MultiprocessingOptions) -> PronunciationDict:
+class DictionaryLoader():
+  # owns one pool which is shared by all loads until the loader is closed
+  def __init__(self, mp_options: MultiprocessingOptions) -> None:
+    if msg := validate_mp_options(mp_options):
+      raise ValueError(f"Parameter 'mp_options': {msg}")
+    self.__mp_options = mp_options
+    self.__pool: Optional[Pool] = None
+    if mp_options.n_jobs > 1:
+      self.__pool = Pool(
+        processes=mp_options.n_jobs,
+        maxtasksperchild=mp_options.maxtasksperchild,
+      )
+
+  def load_dict(self, path: Path, encoding: str, options: DeserializationOptions, cache: Optional[ParseCache] = None, metrics: Optional[PipelineMetrics] = None, progress: Optional[ProgressCallback] = None, cancellation_token: Optional[CancellationToken] = None, entry_filter: Optional[EntryFilter] = None) -> PronunciationDict:
+    result = self.load_dicts([path], encoding, options, cache, metrics,
+                             progress, cancellation_token, entry_filter)[0]
+    return result
+
+  def load_dicts(self, paths: List[Path], encoding: str, options: DeserializationOptions, cache: Optional[ParseCache] = None, metrics: Optional[PipelineMetrics] = None, progress: Optional[ProgressCallback] = None, cancellation_token: Optional[CancellationToken] = None, entry_filter: Optional[EntryFilter] = None) -> List[PronunciationDict]:
+    # with `entry_filter`, cached dictionaries are filtered and the filtered results are not cached
+    if msg := validate_type(paths, list):
+      raise ValueError(f"Parameter 'paths': {msg}")
+    for path in paths:
+      if msg := validate_type(path, Path):
+        raise ValueError(f"Parameter 'paths': {msg}")
+    if msg := validate_type(encoding, str):
+      raise ValueError(f"Parameter 'encoding': {msg}")
+    if msg := validate_deserialization_options(options):
+      raise ValueError(f"Parameter 'options': {msg}")
+    if cache is not None and (msg := validate_type(cache, ParseCache)):
+      raise ValueError(f"Parameter 'cache': {msg}")
+    if msg := validate_progress_arguments(progress, cancellation_token):
+      raise ValueError(msg)
+    if entry_filter is not None and (msg := validate_entry_filter(entry_filter)):
+      raise ValueError(f"Parameter 'entry_filter': {msg}")
+
+    result: List[Optional[PronunciationDict]] = [None] * len(paths)
+    file_keys: List[Optional[str]] = [None] * len(paths)
+    if cache is not None:
+      for path_nr, path in enumerate(paths):
+        # the keys are taken before the files are read
+        file_keys[path_nr] = cache.get_file_key(path)
+        dictionary = cache.get(path, encoding, options, file_keys[path_nr])
+        if dictionary is not None and entry_filter is not None:
+          dictionary = filter_dict(dictionary, entry_filter, validate=False)
+        result[path_nr] = dictionary
+    missing_path_nrs = [path_nr for path_nr, dictionary in enumerate(result) if dictionary is None]
+
+    # the blocks of all files are parsed concurrently, the files are read one after another
+    sources = [_read_lines(paths[path_nr], encoding) for path_nr in missing_path_nrs]
+    if metrics is not None:
+      if cache is not None:
+        metrics.add_count("cache_hits", len(paths) - len(missing_path_nrs))
+      metrics.add_count("bytes", sum(paths[path_nr].stat().st_size for path_nr in missing_path_nrs))
+    parsed_dictionaries = self.deserialize_sources(
+      sources, options, metrics, progress, cancellation_token, entry_filter)
+
+    for path_nr, dictionary in zip(missing_path_nrs, parsed_dictionaries):
+      result[path_nr] = dictionary
+      if cache is not None and entry_filter is None:
+        cache.put(paths[path_nr], encoding, options, dictionary, file_keys[path_nr])
+    return result
+
+  def deserialize_sources(self, sources: List[Iterable[str]], options: DeserializationOptions, metrics: Optional[PipelineMetrics] = None, progress: Optional[ProgressCallback] = None, cancellation_token: Optional[CancellationToken] = None, entry_filter: Optional[EntryFilter] = None) -> List[PronunciationDict]:
+    if msg := validate_deserialization_options(options):
+      raise ValueError(f"Parameter 'options': {msg}")
+    if msg := validate_progress_arguments(progress, cancellation_token):
+      raise ValueError(msg)
+    if entry_filter is not None and (msg := validate_entry_filter(entry_filter)):
+      raise ValueError(f"Parameter 'entry_filter': {msg}")
+
+    result = deserialize_sources(sources, options, self.__mp_options, self.__pool,
+                                 metrics, progress, cancellation_token, entry_filter)
+    return result
+
+  def close(self) -> None:
+    if self.__pool is not None:
+      self.__pool.close()
+      self.__pool.join()
+      self.__pool = None
+
+  def __enter__(self) -> "DictionaryLoader":
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback) -> None:
+    if exc_type is not None and self.__pool is not None:
+      self.__pool.terminate()
+    self.close()
+
+
+def _read_lines(path: Path, encoding: str) -> Generator[str, None, None]:
+  with open_text(path, "r", encoding, get_compression(path)) as file:
+    for line in file:
+      # splitting again results in the same lines as `str.splitlines()` on the whole text
+      yield from line.splitlines()
+
+
+def load_dict_from_url(url: str, encoding: str, options: DeserializationOptions, mp_options: MultiprocessingOptions, cache_dir: Optional[Path] = None) -> PronunciationDict:
   if msg := validate_type(url, str):
     raise ValueError(f"Parameter 'url': {msg}")
   if msg := validate_type(encoding, str):
@@ -55,13 +270,59 @@ def load_dict_from_url(url: str, encoding: str, options: DeserializationOptions,
     raise ValueError(f"Parameter 'options': {msg}")
   if msg := validate_mp_options(mp_options):
     raise ValueError(f"Parameter 'mp_options': {msg}")
+  if cache_dir is not None and (msg := validate_type(cache_dir, Path)):
+    raise ValueError(f"Parameter 'cache_dir': {msg}")
 
-  lines = __read_lines_from_url(url, encoding)
-  result = deserialize(lines, options, mp_options)
+  lines = read_url_lines(url, encoding, cache_dir, connection_pool=None)
+  result = deserialize_lines(lines, options, mp_options)
   return result
 
 
-def __read_lines_from_url(url: str, encoding: str) -> List[str]:
-  with urlopen(url) as url_content:
-    result = [line.decode(encoding) for line in url_content]
+async def load_dict_from_url_async(url: str, encoding: str, options: DeserializationOptions, mp_options: MultiprocessingOptions, cache_dir: Optional[Path] = None) -> PronunciationDict:
+  # the download and parsing run in a thread, i.e., multiple dictionaries can be loaded concurrently
+  loop = asyncio.get_running_loop()
+  method = partial(load_dict_from_url, url, encoding, options, mp_options, cache_dir)
+  result = await loop.run_in_executor(None, method)
   return result
+
+
+class UrlDictionaryLoader():
+  # reuses one connection per host and one process pool for all loads until the loader is closed
+  def __init__(self, mp_options: MultiprocessingOptions, cache_dir: Optional[Path] = None) -> None:
+    if cache_dir is not None and (msg := validate_type(cache_dir, Path)):
+      raise ValueError(f"Parameter 'cache_dir': {msg}")
+    self.__loader = DictionaryLoader(mp_options)
+    self.__connection_pool = HttpConnectionPool()
+    self.__cache_dir = cache_dir
+
+  def load_dict(self, url: str, encoding: str, options: DeserializationOptions) -> PronunciationDict:
+    result = self.load_dicts([url], encoding, options)[0]
+    return result
+
+  def load_dicts(self, urls: List[str], encoding: str, options: DeserializationOptions) -> List[PronunciationDict]:
+    if msg := validate_type(urls, list):
+      raise ValueError(f"Parameter 'urls': {msg}")
+    for url in urls:
+      if msg := validate_type(url, str):
+        raise ValueError(f"Parameter 'urls': {msg}")
+    if msg := validate_type(encoding, str):
+      raise ValueError(f"Parameter 'encoding': {msg}")
+
+    # the responses are read one after another, therefore one connection per host is sufficient
+    sources = [
+      read_url_lines(url, encoding, self.__cache_dir, self.__connection_pool)
+      for url in urls
+    ]
+    result = self.__loader.deserialize_sources(sources, options)
+    return result
+
+  def close(self) -> None:
+    self.__connection_pool.close()
+    self.__loader.close()
+
+  def __enter__(self) -> "UrlDictionaryLoader":
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback) -> None:
+    self.__connection_pool.close()
+    self.__loader.__exit__(exc_type, exc_value, traceback)
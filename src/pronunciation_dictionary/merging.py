@@ -0,0 +1,268 @@
+import heapq
+import os
+from collections import OrderedDict
+from functools import partial
+from itertools import chain, groupby
+from multiprocessing.pool import Pool
+from operator import add, itemgetter
+from pathlib import Path
+from typing import Callable, Dict, Generator, Iterable, List, Literal, Optional, Tuple
+from uuid import uuid4
+
+from pronunciation_dictionary.compression import get_compression, open_text
+from pronunciation_dictionary.deserialization import (DEFAULT_WEIGHT, DeserializationOptions,
+                                                      get_batches, get_line_parser,
+                                                      validate_deserialization_options)
+from pronunciation_dictionary.io import _read_lines
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.serialization import (SerializationOptions, _get_lines_formatter,
+                                                    _validate_serialization_options)
+from pronunciation_dictionary.types import PronunciationDict, Pronunciations, Weight, Word
+from pronunciation_dictionary.validation import (validate_dictionary, validate_mp_options,
+                                                 validate_type)
+
+# all policies keep the order in which the words and pronunciations occur first
+MergePolicy = Literal["first-wins", "last-wins", "add-weights", "max-weight", "normalize"]
+POLICIES = ("first-wins", "last-wins", "add-weights", "max-weight", "normalize")
+BLOCK_SIZE = 10000
+
+
+def validate_policy(policy: MergePolicy) -> Optional[str]:
+  if policy not in POLICIES:
+    return f"Value needs to be one of: {', '.join(POLICIES)}!"
+  return None
+
+
+def merge_dicts(dictionaries: List[PronunciationDict], policy: MergePolicy, validate: bool = True, mp_options: Optional[MultiprocessingOptions] = None) -> PronunciationDict:
+  # the dictionaries are not changed
+  if msg := validate_type(dictionaries, list):
+    raise ValueError(f"Parameter 'dictionaries': {msg}")
+  if validate:
+    for dictionary in dictionaries:
+      try:
+        validate_dictionary(dictionary)
+      except ValueError as error:
+        raise ValueError("dictionaries", error.args[1]) from error
+  if msg := validate_policy(policy):
+    raise ValueError(f"Parameter 'policy': {msg}")
+  if mp_options is not None and (msg := validate_mp_options(mp_options)):
+    raise ValueError(f"Parameter 'mp_options': {msg}")
+
+  if mp_options is None or mp_options.n_jobs == 1 or sum(map(len, dictionaries)) <= BLOCK_SIZE:
+    return __merge_dicts(dictionaries, policy)
+
+  words = list(dict.fromkeys(chain.from_iterable(dictionaries)))
+  block_ranges = (
+    (start, min(start + BLOCK_SIZE, len(words)))
+    for start in range(0, len(words), BLOCK_SIZE)
+  )
+  process_method = partial(process_merge_words, policy=policy)
+
+  result: PronunciationDict = OrderedDict()
+  with Pool(
+    processes=mp_options.n_jobs,
+    initializer=__init_pool_prepare_cache_mp,
+    initargs=(words, dictionaries),
+    maxtasksperchild=mp_options.maxtasksperchild,
+  ) as pool:
+    blocks = pool.imap(process_method, block_ranges, mp_options.chunksize)
+    for block_words, block in zip(get_batches(words, BLOCK_SIZE), blocks):
+      result.update(zip(block_words, block))
+  return result
+
+
+def __merge_dicts(dictionaries: List[PronunciationDict], policy: MergePolicy) -> PronunciationDict:
+  # each entry is added in linear time instead of collecting the pronunciations of each word first
+  merge = _get_merge_method(policy)
+  normalize = policy == "normalize"
+  result: PronunciationDict = OrderedDict()
+  merged_words: Dict[Word, None] = {}
+  for dictionary in dictionaries:
+    for word, pronunciations in dictionary.items():
+      if normalize:
+        pronunciations = _get_normalized(pronunciations)
+      merged_pronunciations = result.get(word)
+      if merged_pronunciations is None:
+        result[word] = pronunciations if normalize else pronunciations.copy()
+        continue
+      merge(merged_pronunciations, pronunciations)
+      merged_words[word] = None
+
+  if normalize:
+    for word in merged_words:
+      result[word] = _get_normalized(result[word])
+  return result
+
+
+process_words: List[Word] = None
+process_dictionaries: List[PronunciationDict] = None
+
+
+def __init_pool_prepare_cache_mp(words: List[Word], dictionaries: List[PronunciationDict]) -> None:
+  global process_words
+  global process_dictionaries
+  process_words = words
+  process_dictionaries = dictionaries
+
+
+def process_merge_words(block_range: Tuple[int, int], policy: MergePolicy) -> List[Pronunciations]:
+  global process_words
+  global process_dictionaries
+  start, end = block_range
+  assert 0 <= start < end <= len(process_words)
+  result = [
+    _merge_word_pronunciations([
+      dictionary[word]
+      for dictionary in process_dictionaries
+      if word in dictionary
+    ], policy)
+    for word in process_words[start:end]
+  ]
+  return result
+
+
+def _merge_word_pronunciations(pronunciations_list: List[Pronunciations], policy: MergePolicy) -> Pronunciations:
+  # the pronunciations of one word in the order of the dictionaries
+  assert len(pronunciations_list) > 0
+  if policy == "normalize":
+    pronunciations_list = [_get_normalized(pronunciations)
+                           for pronunciations in pronunciations_list]
+  if len(pronunciations_list) == 1:
+    return pronunciations_list[0] if policy == "normalize" else pronunciations_list[0].copy()
+
+  merge = _get_merge_method(policy)
+  result = pronunciations_list[0].copy()
+  for pronunciations in pronunciations_list[1:]:
+    merge(result, pronunciations)
+  if policy == "normalize":
+    result = _get_normalized(result)
+  return result
+
+
+def _get_merge_method(policy: MergePolicy) -> Callable[[Pronunciations, Pronunciations], None]:
+  # adds the pronunciations of the second argument to the first one
+  if policy == "first-wins":
+    def merge(result: Pronunciations, pronunciations: Pronunciations) -> None:
+      for pronunciation, weight in pronunciations.items():
+        if pronunciation not in result:
+          result[pronunciation] = weight
+  elif policy == "last-wins":
+    def merge(result: Pronunciations, pronunciations: Pronunciations) -> None:
+      result.update(pronunciations)
+  elif policy == "max-weight":
+    def merge(result: Pronunciations, pronunciations: Pronunciations) -> None:
+      for pronunciation, weight in pronunciations.items():
+        existing_weight = result.get(pronunciation)
+        if existing_weight is None or weight > existing_weight:
+          result[pronunciation] = weight
+  else:
+    # "normalize" adds the normalized weights and normalizes the sums afterwards
+    assert policy in ("add-weights", "normalize")
+
+    def merge(result: Pronunciations, pronunciations: Pronunciations) -> None:
+      for pronunciation, weight in pronunciations.items():
+        result[pronunciation] = result.get(pronunciation, 0) + weight
+  return merge
+
+
+def _get_weight_combiner(policy: MergePolicy) -> Callable[[Weight, Weight], Weight]:
+  # combines the existing with a new weight of the same pronunciation; "normalize" needs to normalize the sums afterwards
+  if policy == "first-wins":
+    return lambda existing_weight, _: existing_weight
+  if policy == "last-wins":
+    return lambda _, weight: weight
+  if policy == "max-weight":
+    return max
+  assert policy in ("add-weights", "normalize")
+  return add
+
+
+def _get_normalized(pronunciations: Pronunciations) -> Pronunciations:
+  # the weights are kept if they sum up to zero
+  total = sum(pronunciations.values())
+  if total == 0:
+    return pronunciations.copy()
+  result = OrderedDict(
+    (pronunciation, weight / total)
+    for pronunciation, weight in pronunciations.items()
+  )
+  return result
+
+
+def merge_dict_files(paths: List[Path], output_path: Path, encoding: str, options: DeserializationOptions, serialization_options: SerializationOptions, policy: MergePolicy) -> None:
+  # the files need to be sorted by word; only the entries of the current word of each file are kept in memory
+  if msg := validate_type(paths, list):
+    raise ValueError(f"Parameter 'paths': {msg}")
+  for path in paths:
+    if msg := validate_type(path, Path):
+      raise ValueError(f"Parameter 'paths': {msg}")
+  if msg := validate_type(output_path, Path):
+    raise ValueError(f"Parameter 'output_path': {msg}")
+  if msg := validate_type(encoding, str):
+    raise ValueError(f"Parameter 'encoding': {msg}")
+  if msg := validate_deserialization_options(options):
+    raise ValueError(f"Parameter 'options': {msg}")
+  if msg := _validate_serialization_options(serialization_options):
+    raise ValueError(f"Parameter 'serialization_options': {msg}")
+  if msg := validate_policy(policy):
+    raise ValueError(f"Parameter 'policy': {msg}")
+
+  # entries with the same word are ordered by the file order
+  entries = heapq.merge(*(
+    _read_sorted_entries(path, encoding, options)
+    for path in paths
+  ), key=itemgetter(0))
+  merged_entries = (
+    (word, _merge_word_pronunciations([pronunciations for _, pronunciations in word_entries], policy))
+    for word, word_entries in groupby(entries, key=itemgetter(0))
+  )
+  # the output can be one of the input files
+  _write_entries_atomic(output_path, encoding, merged_entries, serialization_options)
+
+
+def _write_entries_atomic(output_path: Path, encoding: str, entries: Iterable[Tuple[Word, Pronunciations]], serialization_options: SerializationOptions) -> None:
+  # the file is replaced only after it was written completely
+  get_lines = _get_lines_formatter(serialization_options)
+  output_path.parent.mkdir(parents=True, exist_ok=True)
+  tmp_path = output_path.parent / f".{output_path.name}.{uuid4().hex}.tmp"
+  try:
+    with open_text(tmp_path, "x", encoding, get_compression(output_path)) as file:
+      is_first_block = True
+      for items in get_batches(entries, BLOCK_SIZE):
+        if not is_first_block:
+          file.write("\n")
+        file.write("\n".join(get_lines(items)))
+        is_first_block = False
+    os.replace(tmp_path, output_path)
+  except BaseException:
+    tmp_path.unlink(missing_ok=True)
+    raise
+
+
+def _read_sorted_entries(path: Path, encoding: str, options: DeserializationOptions) -> Generator[Tuple[Word, Pronunciations], None, None]:
+  # yields the pronunciations of consecutive lines of the same word like `load_dict` would parse them; the file needs to be sorted by word
+  parse = get_line_parser(options, collect_messages=False)
+  current_word: Optional[Word] = None
+  current_pronunciations: Optional[Pronunciations] = None
+  for line_nr, line in enumerate(_read_lines(path, encoding), start=1):
+    values, _ = parse(line)
+    if values is None:
+      continue
+    word, weight, pronunciation = values
+    if weight is None:
+      weight = DEFAULT_WEIGHT
+    if word == current_word:
+      # the first weight is kept like in `deserialize`
+      if pronunciation not in current_pronunciations:
+        current_pronunciations[pronunciation] = weight
+      continue
+    if current_word is not None:
+      # in a sorted file, a word can't occur again after another word
+      if word < current_word:
+        raise ValueError(
+          f"File \"{path}\" is not sorted by word: \"{word}\" in line {line_nr} occurs after \"{current_word}\"!")
+      yield current_word, current_pronunciations
+    current_word = word
+    current_pronunciations = OrderedDict(((pronunciation, weight),))
+  if current_word is not None:
+    yield current_word, current_pronunciations
@@ -0,0 +1,56 @@
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict, Generator, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class PipelineMetrics():
+  # collects wall times per stage and counts; nothing is measured if no instance is passed
+  def __init__(self) -> None:
+    self.seconds: Dict[str, float] = {}
+    self.counts: Dict[str, int] = {}
+    self.n_jobs: int = 1
+
+  def add_seconds(self, stage: str, seconds: float) -> None:
+    self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+
+  def add_count(self, name: str, value: int = 1) -> None:
+    self.counts[name] = self.counts.get(name, 0) + value
+
+  @contextmanager
+  def measure(self, stage: str) -> Iterator[None]:
+    start = perf_counter()
+    try:
+      yield
+    finally:
+      self.add_seconds(stage, perf_counter() - start)
+
+  def measure_iterable(self, stage: str, iterable: Iterable[T]) -> Generator[T, None, None]:
+    # measures the time which is spent to get the items, e.g., to read lines
+    iterator = iter(iterable)
+    while True:
+      start = perf_counter()
+      try:
+        item = next(iterator)
+      except StopIteration:
+        self.add_seconds(stage, perf_counter() - start)
+        return
+      self.add_seconds(stage, perf_counter() - start)
+      yield item
+
+  @property
+  def worker_utilization(self) -> Optional[float]:
+    # share of the time the workers were busy while the blocks were processed in parallel
+    worker_seconds = self.seconds.get("worker")
+    parallel_seconds = self.seconds.get("parallel")
+    if worker_seconds is None or not parallel_seconds:
+      return None
+    return worker_seconds / (self.n_jobs * parallel_seconds)
+
+  def get_summary(self) -> str:
+    parts = [f"{stage}: {seconds:.3f}s" for stage, seconds in self.seconds.items()]
+    parts.extend(f"{name}: {count}" for name, count in self.counts.items())
+    if (utilization := self.worker_utilization) is not None:
+      parts.append(f"worker utilization: {utilization:.0%}")
+    return ", ".join(parts)
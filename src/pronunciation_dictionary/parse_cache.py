@@ -0,0 +1,134 @@
+import gc
+import os
+import pickle
+from dataclasses import astuple
+from hashlib import sha256
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Tuple
+from uuid import uuid4
+
+from pronunciation_dictionary.deserialization import DeserializationOptions
+from pronunciation_dictionary.types import PronunciationDict
+from pronunciation_dictionary.validation import validate_type
+
+# needs to be increased if the parsing results or the entry format change
+CACHE_FORMAT_VERSION = 2
+ENTRY_SUFFIX = ".pickle"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class ParseCache():
+  # stores parsed dictionaries; the least recently used entries are removed if the cache exceeds `max_size` bytes
+  def __init__(self, cache_dir: Path, max_size: Optional[int] = None, hash_content: bool = False) -> None:
+    if msg := validate_type(cache_dir, Path):
+      raise ValueError(f"Parameter 'cache_dir': {msg}")
+    if max_size is not None and not (isinstance(max_size, int) and max_size > 0):
+      raise ValueError("Parameter 'max_size': Invalid value!")
+    if msg := validate_type(hash_content, bool):
+      raise ValueError(f"Parameter 'hash_content': {msg}")
+    self.__cache_dir = cache_dir
+    self.__max_size = max_size
+    self.__hash_content = hash_content
+
+  @property
+  def cache_dir(self) -> Path:
+    return self.__cache_dir
+
+  def get_file_key(self, path: Path) -> str:
+    # identifies the version of the file, i.e., it needs to be taken before the file is read
+    if self.__hash_content:
+      return _get_content_hash(path)
+    stat = path.stat()
+    return f"{stat.st_size}|{stat.st_mtime_ns}"
+
+  def get(self, path: Path, encoding: str, options: DeserializationOptions, file_key: Optional[str] = None) -> Optional[PronunciationDict]:
+    entry_path = self.__get_entry_path(path, encoding, options)
+    if file_key is None:
+      file_key = self.get_file_key(path)
+    try:
+      with entry_path.open(mode="rb") as file:
+        # the key is stored before the dictionary, i.e., an outdated dictionary is not loaded
+        if pickle.load(file) != file_key:
+          result = None
+        else:
+          result = _load_without_gc(file)
+    except FileNotFoundError:
+      return None
+    except Exception:
+      result = None
+    if result is None:
+      # outdated, incomplete or incompatible entries are parsed again
+      entry_path.unlink(missing_ok=True)
+      return None
+    # the modification time is used as time of the last access
+    os.utime(entry_path)
+    return result
+
+  def put(self, path: Path, encoding: str, options: DeserializationOptions, dictionary: PronunciationDict, file_key: Optional[str] = None) -> None:
+    # replaces the entry of a previous version of the file; `file_key` needs to be taken before the file was read, otherwise changes during the reading are not detected
+    entry_path = self.__get_entry_path(path, encoding, options)
+    if file_key is None:
+      file_key = self.get_file_key(path)
+    self.__cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = self.__cache_dir / f".{entry_path.name}.{uuid4().hex}.tmp"
+    try:
+      with tmp_path.open(mode="xb") as file:
+        pickle.dump(file_key, file, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(dictionary, file, protocol=pickle.HIGHEST_PROTOCOL)
+      os.replace(tmp_path, entry_path)
+    except BaseException:
+      tmp_path.unlink(missing_ok=True)
+      raise
+    if self.__max_size is not None:
+      self.__evict(self.__max_size)
+
+  def clear(self) -> None:
+    for entry_path, _, _ in self.__get_entries():
+      entry_path.unlink(missing_ok=True)
+
+  def __evict(self, max_size: int) -> None:
+    entries = sorted(self.__get_entries(), key=lambda entry: entry[2])
+    total_size = sum(size for _, size, _ in entries)
+    for entry_path, size, _ in entries:
+      if total_size <= max_size:
+        break
+      entry_path.unlink(missing_ok=True)
+      total_size -= size
+
+  def __get_entries(self) -> List[Tuple[Path, int, int]]:
+    result = []
+    if not self.__cache_dir.is_dir():
+      return result
+    for entry_path in self.__cache_dir.glob(f"*{ENTRY_SUFFIX}"):
+      try:
+        stat = entry_path.stat()
+      except FileNotFoundError:
+        continue
+      result.append((entry_path, stat.st_size, stat.st_mtime_ns))
+    return result
+
+  def __get_entry_path(self, path: Path, encoding: str, options: DeserializationOptions) -> Path:
+    # each file has one entry per encoding and options; the version of the file is stored in the entry
+    key = f"{CACHE_FORMAT_VERSION}|{path.resolve()}|{encoding}|{astuple(options)}"
+    name = sha256(key.encode("UTF-8")).hexdigest()
+    return self.__cache_dir / f"{name}{ENTRY_SUFFIX}"
+
+
+def _load_without_gc(file: BinaryIO) -> PronunciationDict:
+  # the garbage collection would be triggered repeatedly while the containers are created
+  gc_was_enabled = gc.isenabled()
+  gc.disable()
+  try:
+    result = pickle.load(file)
+  finally:
+    if gc_was_enabled:
+      gc.enable()
+  return result
+
+
+def _get_content_hash(path: Path) -> str:
+  content_hash = sha256()
+  with path.open(mode="rb") as file:
+    while chunk := file.read(HASH_CHUNK_SIZE):
+      content_hash.update(chunk)
+  return content_hash.hexdigest()
@@ -1,14 +1,21 @@
-from typing import Set
+from typing import Set, Union
 
+from pronunciation_dictionary.binary_format import BinaryPronunciationDict
+from pronunciation_dictionary.compact_dictionary import CompactPronunciationDict
 from pronunciation_dictionary.types import PronunciationDict, Symbol
 from pronunciation_dictionary.validation import validate_dictionary
 
 
-def get_phoneme_set(dictionary: PronunciationDict) -> Set[Symbol]:
-  try:
-    validate_dictionary(dictionary)
-  except ValueError as error:
-    raise ValueError("dictionary", error.args[1]) from error
+def get_phoneme_set(dictionary: Union[PronunciationDict, CompactPronunciationDict, BinaryPronunciationDict], validate: bool = True) -> Set[Symbol]:
+  if isinstance(dictionary, (CompactPronunciationDict, BinaryPronunciationDict)):
+    # the symbol table contains exactly the symbols of all pronunciations
+    return set(dictionary.symbols)
+
+  if validate:
+    try:
+      validate_dictionary(dictionary)
+    except ValueError as error:
+      raise ValueError("dictionary", error.args[1]) from error
 
   unique_symbols = {
     symbol
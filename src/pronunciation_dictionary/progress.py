@@ -0,0 +1,59 @@
+from threading import Event
+from time import monotonic
+from typing import Callable, Optional
+
+# minimum seconds between two progress reports
+PROGRESS_INTERVAL = 0.1
+
+ProgressCallback = Callable[[int], None]
+
+
+class OperationCancelledError(Exception):
+  pass
+
+
+class CancellationToken():
+  # can be cancelled from another thread, e.g., a signal handler or a request timeout
+  def __init__(self, timeout: Optional[float] = None) -> None:
+    if timeout is not None and not (isinstance(timeout, (float, int)) and timeout >= 0):
+      raise ValueError("Parameter 'timeout': Invalid value!")
+    self.__event = Event()
+    self.__deadline = None if timeout is None else monotonic() + timeout
+
+  def cancel(self) -> None:
+    self.__event.set()
+
+  @property
+  def is_cancelled(self) -> bool:
+    if self.__deadline is not None and monotonic() >= self.__deadline:
+      self.__event.set()
+    return self.__event.is_set()
+
+  def raise_if_cancelled(self) -> None:
+    if self.is_cancelled:
+      raise OperationCancelledError("The operation was cancelled!")
+
+
+class ProgressReporter():
+  # calls the callback with the total count at most every `interval` seconds and once at the end
+  def __init__(self, callback: ProgressCallback, interval: float = PROGRESS_INTERVAL) -> None:
+    self.__callback = callback
+    self.__interval = interval
+    self.__total = 0
+    self.__reported_total: Optional[int] = None
+    self.__last_report = monotonic()
+
+  def update(self, count: int) -> None:
+    self.__total += count
+    now = monotonic()
+    if now - self.__last_report >= self.__interval:
+      self.__report(now)
+
+  def finish(self) -> None:
+    if self.__reported_total != self.__total:
+      self.__report(monotonic())
+
+  def __report(self, now: float) -> None:
+    self.__last_report = now
+    self.__reported_total = self.__total
+    self.__callback(self.__total)
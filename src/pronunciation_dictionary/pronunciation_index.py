@@ -0,0 +1,234 @@
+from typing import Dict, Generator, Iterable, KeysView, List, Optional, Tuple
+
+from pronunciation_dictionary.types import (Pronunciation, PronunciationDict, Pronunciations,
+                                            Symbol, Word)
+from pronunciation_dictionary.validation import (validate_dictionary, validate_pronunciation,
+                                                 validate_pronunciations, validate_weight,
+                                                 validate_word)
+
+DEFAULT_NGRAM_SIZE = 2
+
+SymbolNGram = Tuple[Symbol, ...]
+
+
+class PronunciationIndex():
+  # maps pronunciations to their words; the optional n-gram postings narrow down substring and similarity queries
+  def __init__(self, dictionary: PronunciationDict, ngram_size: Optional[int] = DEFAULT_NGRAM_SIZE, validate: bool = True) -> None:
+    if validate:
+      try:
+        validate_dictionary(dictionary)
+      except ValueError as error:
+        raise ValueError("dictionary", error.args[1]) from error
+    if ngram_size is not None and not (isinstance(ngram_size, int) and ngram_size > 0):
+      raise ValueError("Parameter 'ngram_size': Invalid value!")
+
+    self.__ngram_size = ngram_size
+    self.__pronunciation_words: Dict[Pronunciation, Dict[Word, None]] = {}
+    self.__word_pronunciations: Dict[Word, Tuple[Pronunciation, ...]] = {}
+    self.__length_pronunciations: Dict[int, Dict[Pronunciation, None]] = {}
+    self.__ngram_pronunciations: Optional[Dict[SymbolNGram, Dict[Pronunciation, None]]] = None
+    # pronunciations which are shorter than the n-grams
+    self.__short_pronunciations: Dict[Pronunciation, None] = {}
+    if ngram_size is not None:
+      self.__ngram_pronunciations = {}
+
+    for word, pronunciations in dictionary.items():
+      self.__add(word, tuple(pronunciations.keys()))
+
+  def __len__(self) -> int:
+    return len(self.__word_pronunciations)
+
+  def __contains__(self, pronunciation: object) -> bool:
+    return pronunciation in self.__pronunciation_words
+
+  @property
+  def pronunciations(self) -> KeysView[Pronunciation]:
+    return self.__pronunciation_words.keys()
+
+  def get_words(self, pronunciation: Pronunciation) -> KeysView[Word]:
+    # the homophones in the order they were added
+    return self.__pronunciation_words.get(pronunciation, {}).keys()
+
+  def get_homophones(self) -> Generator[Tuple[Pronunciation, KeysView[Word]], None, None]:
+    for pronunciation, words in self.__pronunciation_words.items():
+      if len(words) > 1:
+        yield pronunciation, words.keys()
+
+  def get_pronunciations_containing(self, symbols: Pronunciation) -> List[Pronunciation]:
+    # e.g. ("T", "AH0") returns all pronunciations which contain "T" directly followed by "AH0"
+    validate_pronunciation(symbols)
+    candidates = self.__get_substring_candidates(symbols)
+    result = [
+      pronunciation for pronunciation in candidates
+      if _contains_symbols(pronunciation, symbols)
+    ]
+    return result
+
+  def get_similar_pronunciations(self, pronunciation: Pronunciation, max_distance: int) -> List[Tuple[Pronunciation, int]]:
+    # pronunciations with a Levenshtein distance over symbols of at most `max_distance`, sorted by distance
+    validate_pronunciation(pronunciation)
+    if not (isinstance(max_distance, int) and max_distance >= 0):
+      raise ValueError("Parameter 'max_distance': Invalid value!")
+
+    result = []
+    for candidate in self.__get_similarity_candidates(pronunciation, max_distance):
+      distance = _get_bounded_distance(pronunciation, candidate, max_distance)
+      if distance is not None:
+        result.append((candidate, distance))
+    result.sort(key=lambda candidate_distance: candidate_distance[1])
+    return result
+
+  def update_word(self, word: Word, pronunciations: Pronunciations) -> None:
+    # needs to be called after the pronunciations of a word were added or changed
+    validate_word(word)
+    if msg := validate_pronunciations(pronunciations):
+      raise ValueError(f"Parameter 'pronunciations': {msg}")
+    for pronunciation, weight in pronunciations.items():
+      validate_pronunciation(pronunciation)
+      validate_weight(weight)
+
+    if word in self.__word_pronunciations:
+      self.__remove(word)
+    self.__add(word, tuple(pronunciations.keys()))
+
+  def remove_word(self, word: Word) -> None:
+    if word not in self.__word_pronunciations:
+      raise KeyError(word)
+    self.__remove(word)
+
+  def __add(self, word: Word, pronunciations: Tuple[Pronunciation, ...]) -> None:
+    pronunciation_words = self.__pronunciation_words
+    for pronunciation in pronunciations:
+      words = pronunciation_words.get(pronunciation)
+      if words is None:
+        pronunciation_words[pronunciation] = {word: None}
+        self.__add_pronunciation(pronunciation)
+      else:
+        words[word] = None
+    self.__word_pronunciations[word] = pronunciations
+
+  def __remove(self, word: Word) -> None:
+    for pronunciation in self.__word_pronunciations.pop(word):
+      words = self.__pronunciation_words[pronunciation]
+      del words[word]
+      if len(words) == 0:
+        del self.__pronunciation_words[pronunciation]
+        self.__remove_pronunciation(pronunciation)
+
+  def __add_pronunciation(self, pronunciation: Pronunciation) -> None:
+    self.__length_pronunciations.setdefault(len(pronunciation), {})[pronunciation] = None
+    if self.__ngram_pronunciations is None:
+      return
+    if len(pronunciation) < self.__ngram_size:
+      self.__short_pronunciations[pronunciation] = None
+      return
+    ngram_pronunciations = self.__ngram_pronunciations
+    for ngram in _get_ngrams(pronunciation, self.__ngram_size):
+      pronunciations = ngram_pronunciations.get(ngram)
+      if pronunciations is None:
+        ngram_pronunciations[ngram] = {pronunciation: None}
+      else:
+        pronunciations[pronunciation] = None
+
+  def __remove_pronunciation(self, pronunciation: Pronunciation) -> None:
+    length_pronunciations = self.__length_pronunciations[len(pronunciation)]
+    del length_pronunciations[pronunciation]
+    if len(length_pronunciations) == 0:
+      del self.__length_pronunciations[len(pronunciation)]
+    if self.__ngram_pronunciations is None:
+      return
+    if len(pronunciation) < self.__ngram_size:
+      del self.__short_pronunciations[pronunciation]
+      return
+    # n-grams can occur multiple times in one pronunciation
+    for ngram in set(_get_ngrams(pronunciation, self.__ngram_size)):
+      pronunciations = self.__ngram_pronunciations[ngram]
+      del pronunciations[pronunciation]
+      if len(pronunciations) == 0:
+        del self.__ngram_pronunciations[ngram]
+
+  def __get_substring_candidates(self, symbols: Pronunciation) -> Iterable[Pronunciation]:
+    if self.__ngram_pronunciations is None:
+      return self.__pronunciation_words.keys()
+
+    if len(symbols) >= self.__ngram_size:
+      # each pronunciation containing the symbols contains all of their n-grams
+      postings = []
+      for ngram in _get_ngrams(symbols, self.__ngram_size):
+        pronunciations = self.__ngram_pronunciations.get(ngram)
+        if pronunciations is None:
+          return ()
+        postings.append(pronunciations)
+      return min(postings, key=len).keys()
+
+    # shorter symbols occur in at least one n-gram of each longer pronunciation
+    result: Dict[Pronunciation, None] = dict(self.__short_pronunciations)
+    for ngram, pronunciations in self.__ngram_pronunciations.items():
+      if _contains_symbols(ngram, symbols):
+        result.update(pronunciations)
+    return result.keys()
+
+  def __get_similarity_candidates(self, pronunciation: Pronunciation, max_distance: int) -> Iterable[Pronunciation]:
+    # the lengths can't differ by more than the distance
+    lengths = range(max(1, len(pronunciation) - max_distance), len(pronunciation) + max_distance + 1)
+    length_pronunciations = [
+      self.__length_pronunciations[length]
+      for length in lengths
+      if length in self.__length_pronunciations
+    ]
+
+    if self.__ngram_pronunciations is not None:
+      ngrams = set(_get_ngrams(pronunciation, self.__ngram_size))
+      # each edit operation changes at most `ngram_size` n-grams
+      min_shared_ngrams = len(ngrams) - max_distance * self.__ngram_size
+      if min_shared_ngrams > 0:
+        shared_ngram_counts: Dict[Pronunciation, int] = {}
+        for ngram in ngrams:
+          for candidate in self.__ngram_pronunciations.get(ngram, ()):
+            shared_ngram_counts[candidate] = shared_ngram_counts.get(candidate, 0) + 1
+        return [
+          candidate for candidate, count in shared_ngram_counts.items()
+          if count >= min_shared_ngrams and len(candidate) in lengths
+        ]
+
+    result = [
+      candidate
+      for pronunciations in length_pronunciations
+      for candidate in pronunciations
+    ]
+    return result
+
+
+def _get_ngrams(pronunciation: Pronunciation, ngram_size: int) -> Iterable[SymbolNGram]:
+  return (pronunciation[i:i + ngram_size] for i in range(len(pronunciation) - ngram_size + 1))
+
+
+def _contains_symbols(pronunciation: Pronunciation, symbols: Pronunciation) -> bool:
+  symbols_count = len(symbols)
+  first_symbol = symbols[0]
+  for i in range(len(pronunciation) - symbols_count + 1):
+    if pronunciation[i] == first_symbol and pronunciation[i:i + symbols_count] == symbols:
+      return True
+  return False
+
+
+def _get_bounded_distance(pronunciation1: Pronunciation, pronunciation2: Pronunciation, max_distance: int) -> Optional[int]:
+  # Levenshtein distance which stops as soon as it exceeds `max_distance`
+  if abs(len(pronunciation1) - len(pronunciation2)) > max_distance:
+    return None
+  previous_row = list(range(len(pronunciation2) + 1))
+  for i, symbol1 in enumerate(pronunciation1, start=1):
+    row = [i]
+    for j, symbol2 in enumerate(pronunciation2, start=1):
+      row.append(min(
+        previous_row[j] + 1,
+        row[j - 1] + 1,
+        previous_row[j - 1] + (symbol1 != symbol2),
+      ))
+    if min(row) > max_distance:
+      return None
+    previous_row = row
+  distance = previous_row[-1]
+  if distance > max_distance:
+    return None
+  return distance
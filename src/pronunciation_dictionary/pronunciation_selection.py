@@ -1,8 +1,23 @@
 import random
-from typing import Optional
-
-from pronunciation_dictionary.types import Pronunciation, Pronunciations
-from pronunciation_dictionary.validation import validate_pronunciations, validate_seed
+from bisect import bisect
+from collections import OrderedDict
+from functools import partial
+from itertools import accumulate, islice
+from math import isfinite
+from multiprocessing.pool import Pool
+from typing import Callable, Dict, List, Literal, Optional, Tuple
+
+from pronunciation_dictionary.deserialization import get_batches
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.types import Pronunciation, PronunciationDict, Pronunciations, Word
+from pronunciation_dictionary.validation import (validate_dictionary, validate_mp_options,
+                                                 validate_pronunciations, validate_seed)
+
+SelectionStrategy = Literal["first", "last", "highest-weight", "lowest-weight",
+                            "shortest", "longest", "random", "weighted"]
+STRATEGIES = ("first", "last", "highest-weight", "lowest-weight",
+              "shortest", "longest", "random", "weighted")
+BLOCK_SIZE = 10000
 
 
 def get_first_pronunciation(pronunciations: Pronunciations) -> Pronunciation:
@@ -22,28 +37,29 @@ def get_last_pronunciation(pronunciations: Pronunciations) -> Pronunciation:
 def get_pronunciation_with_highest_weight(pronunciations: Pronunciations) -> Pronunciation:
   if msg := validate_pronunciations(pronunciations):
     raise ValueError(f"Parameter 'pronunciations': {msg}")
-  pronunciation, _ = sorted(pronunciations.items(), key=lambda kv: kv[1], reverse=True)[0]
+  # returns the first of equally weighted pronunciations like a stable sort
+  pronunciation = max(pronunciations.keys(), key=pronunciations.__getitem__)
   return pronunciation
 
 
 def get_pronunciation_with_lowest_weight(pronunciations: Pronunciations) -> Pronunciation:
   if msg := validate_pronunciations(pronunciations):
     raise ValueError(f"Parameter 'pronunciations': {msg}")
-  pronunciation, _ = sorted(pronunciations.items(), key=lambda kv: kv[1], reverse=False)[0]
+  pronunciation = min(pronunciations.keys(), key=pronunciations.__getitem__)
   return pronunciation
 
 
 def get_shortest_pronunciation(pronunciations: Pronunciations) -> Pronunciation:
   if msg := validate_pronunciations(pronunciations):
     raise ValueError(f"Parameter 'pronunciations': {msg}")
-  pronunciation = sorted(pronunciations.keys(), key=len, reverse=False)[0]
+  pronunciation = min(pronunciations.keys(), key=len)
   return pronunciation
 
 
 def get_longest_pronunciation(pronunciations: Pronunciations) -> Pronunciation:
   if msg := validate_pronunciations(pronunciations):
     raise ValueError(f"Parameter 'pronunciations': {msg}")
-  pronunciation = sorted(pronunciations.keys(), key=len, reverse=True)[0]
+  pronunciation = max(pronunciations.keys(), key=len)
   return pronunciation
 
 
@@ -53,9 +69,9 @@ def get_random_pronunciation(pronunciations: Pronunciations, seed: Optional[int]
   if seed is not None and (msg := validate_seed(seed)):
     raise ValueError(f"Parameter 'seed': {msg}")
 
-  if seed is not None:
-    random.seed(seed)
-  pronunciation = random.choice(tuple(pronunciations.keys()))
+  # a seeded generator results in the same choice as seeding the global one without changing its state
+  rng = random if seed is None else random.Random(seed)
+  pronunciation = rng.choice(tuple(pronunciations.keys()))
   return pronunciation
 
 
@@ -65,8 +81,148 @@ def get_weighted_pronunciation(pronunciations: Pronunciations, seed: Optional[in
   if seed is not None and (msg := validate_seed(seed)):
     raise ValueError(f"Parameter 'seed': {msg}")
 
-  if seed is not None:
-    random.seed(seed)
-  pronunciation = random.choices(tuple(pronunciations.keys()),
-                                 tuple(pronunciations.values()), k=1)[0]
+  rng = random if seed is None else random.Random(seed)
+  pronunciation = rng.choices(tuple(pronunciations.keys()),
+                              tuple(pronunciations.values()), k=1)[0]
   return pronunciation
+
+
+def select_pronunciations(dictionary: PronunciationDict, strategy: SelectionStrategy, seed: Optional[int], validate: bool = True, mp_options: Optional[MultiprocessingOptions] = None) -> PronunciationDict:
+  # keeps one pronunciation with its weight per word; the same pronunciations are selected as by calling the single functions with `seed` for each word
+  if validate:
+    try:
+      validate_dictionary(dictionary)
+    except ValueError as error:
+      raise ValueError("dictionary", error.args[1]) from error
+  if strategy not in STRATEGIES:
+    raise ValueError("Parameter 'strategy': Invalid value!")
+  if seed is not None and (msg := validate_seed(seed)):
+    raise ValueError(f"Parameter 'seed': {msg}")
+  if mp_options is not None and (msg := validate_mp_options(mp_options)):
+    raise ValueError(f"Parameter 'mp_options': {msg}")
+
+  result: PronunciationDict = OrderedDict()
+  if mp_options is None or mp_options.n_jobs == 1 or len(dictionary) <= BLOCK_SIZE:
+    select = _get_selector(strategy, seed)
+    # the weighted selection can fail for a single pronunciation, e.g., if its weight is zero
+    is_single_selected = strategy != "weighted"
+    for word, pronunciations in dictionary.items():
+      if is_single_selected and len(pronunciations) == 1:
+        result[word] = OrderedDict(pronunciations)
+        continue
+      if len(pronunciations) == 0:
+        raise __get_no_pronunciations_error(word)
+      pronunciation = select(pronunciations)
+      selected = OrderedDict()
+      selected[pronunciation] = pronunciations[pronunciation]
+      result[word] = selected
+    return result
+
+  items = list(dictionary.items())
+  block_ranges = (
+    (start, min(start + BLOCK_SIZE, len(items)))
+    for start in range(0, len(items), BLOCK_SIZE)
+  )
+  process_method = partial(process_select_block, strategy=strategy, seed=seed)
+
+  with Pool(
+    processes=mp_options.n_jobs,
+    initializer=__init_pool_prepare_cache_mp,
+    initargs=(items,),
+    maxtasksperchild=mp_options.maxtasksperchild,
+  ) as pool:
+    blocks = pool.imap(process_method, block_ranges, mp_options.chunksize)
+    block_items = get_batches(items, BLOCK_SIZE)
+    for current_items, pronunciations_of_block in zip(block_items, blocks):
+      for (word, pronunciations), pronunciation in zip(current_items, pronunciations_of_block):
+        selected = OrderedDict()
+        selected[pronunciation] = pronunciations[pronunciation]
+        result[word] = selected
+  return result
+
+
+def __get_no_pronunciations_error(word: Word) -> ValueError:
+  # `validate_dictionary` accepts words without pronunciations
+  return ValueError("dictionary", f"At least one pronunciation is required for word \"{word}\"!")
+
+
+process_items: List[Tuple[Word, Pronunciations]] = None
+
+
+def __init_pool_prepare_cache_mp(items: List[Tuple[Word, Pronunciations]]) -> None:
+  global process_items
+  process_items = items
+
+
+def process_select_block(block_range: Tuple[int, int], strategy: SelectionStrategy, seed: Optional[int]) -> List[Pronunciation]:
+  global process_items
+  start, end = block_range
+  assert 0 <= start < end <= len(process_items)
+  select = _get_selector(strategy, seed)
+  result = []
+  for word, pronunciations in process_items[start:end]:
+    if len(pronunciations) == 0:
+      raise __get_no_pronunciations_error(word)
+    result.append(select(pronunciations))
+  return result
+
+
+def _get_selector(strategy: SelectionStrategy, seed: Optional[int]) -> Callable[[Pronunciations], Pronunciation]:
+  # the returned method doesn't validate the pronunciations
+  if strategy == "first":
+    return lambda pronunciations: next(iter(pronunciations.keys()))
+  if strategy == "last":
+    return lambda pronunciations: next(reversed(pronunciations.keys()))
+  if strategy == "highest-weight":
+    return lambda pronunciations: max(pronunciations.keys(), key=pronunciations.__getitem__)
+  if strategy == "lowest-weight":
+    return lambda pronunciations: min(pronunciations.keys(), key=pronunciations.__getitem__)
+  if strategy == "shortest":
+    return lambda pronunciations: min(pronunciations.keys(), key=len)
+  if strategy == "longest":
+    return lambda pronunciations: max(pronunciations.keys(), key=len)
+  if strategy == "random":
+    return __get_random_selector(seed)
+  assert strategy == "weighted"
+  return __get_weighted_selector(seed)
+
+
+def __get_random_selector(seed: Optional[int]) -> Callable[[Pronunciations], Pronunciation]:
+  if seed is None:
+    rng = random.Random()
+    return lambda pronunciations: rng.choice(tuple(pronunciations.keys()))
+
+  # after seeding, the chosen index only depends on the number of pronunciations
+  indices: Dict[int, int] = {}
+
+  def select(pronunciations: Pronunciations) -> Pronunciation:
+    keys = tuple(pronunciations.keys())
+    index = indices.get(len(keys))
+    if index is None:
+      index = random.Random(seed).choice(range(len(keys)))
+      indices[len(keys)] = index
+    return keys[index]
+  return select
+
+
+def __get_weighted_selector(seed: Optional[int]) -> Callable[[Pronunciations], Pronunciation]:
+  # the same calculation as `random.choices` with `k=1`
+  rng = random.Random(seed)
+  if seed is None:
+    get_random_value = rng.random
+  else:
+    # after seeding, the same value is drawn for each word
+    random_value = rng.random()
+
+    def get_random_value() -> float:
+      return random_value
+
+  def select(pronunciations: Pronunciations) -> Pronunciation:
+    cum_weights = list(accumulate(pronunciations.values()))
+    total = cum_weights[-1] + 0.0
+    if not (total > 0.0 and isfinite(total)):
+      # `random.choices` raises an error or handles it depending on the Python version
+      return random.Random(seed).choices(tuple(pronunciations.keys()), tuple(pronunciations.values()), k=1)[0]
+    index = bisect(cum_weights, get_random_value() * total, 0, len(cum_weights) - 1)
+    return next(islice(pronunciations.keys(), index, None))
+  return select
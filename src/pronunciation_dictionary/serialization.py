@@ -1,10 +1,17 @@
 from dataclasses import dataclass
-from typing import Generator, Literal, Optional
-
-from pronunciation_dictionary.types import Pronunciation, PronunciationDict, Pronunciations
+from functools import partial
+from multiprocessing.pool import Pool
+from typing import Callable, Generator, Iterable, List, Literal, Optional, Tuple
+
+from pronunciation_dictionary.deserialization import (PENDING_BLOCKS_PER_JOB, get_batches,
+                                                      imap_bounded)
+from pronunciation_dictionary.metrics import PipelineMetrics
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.types import Pronunciation, PronunciationDict, Pronunciations, Word
 from pronunciation_dictionary.validation import validate_dictionary
 
 _PHONEME_SEP = " "
+BLOCK_SIZE = 10000
 
 
 @dataclass()
@@ -31,18 +38,108 @@ def _validate_serialization_options(options: SerializationOptions) -> Optional[s
   return None
 
 
-def serialize(dictionary: PronunciationDict, options: SerializationOptions) -> Generator[str, None, None]:
-  try:
-    validate_dictionary(dictionary)
-  except ValueError as error:
-    raise ValueError("dictionary", error.args[1]) from error
+def serialize(dictionary: PronunciationDict, options: SerializationOptions, validate: bool = True, metrics: Optional[PipelineMetrics] = None) -> Generator[str, None, None]:
+  # `validate=False` skips the validation of an already validated dictionary
+  if validate:
+    try:
+      validate_dictionary(dictionary)
+    except ValueError as error:
+      raise ValueError("dictionary", error.args[1]) from error
 
   if msg := _validate_serialization_options(options):
     raise ValueError("options", msg)
 
-  part_separator = _part_separators[options.parts_sep]
-  for word, pronunciations in dictionary.items():
-    yield from _get_lines_for_pronunciation(word, pronunciations, part_separator, options.include_weights, options.include_counter)
+  get_lines = _get_lines_formatter(options)
+  for items in get_batches(dictionary.items(), BLOCK_SIZE):
+    if metrics is None:
+      yield from get_lines(items)
+      continue
+    with metrics.measure("serialization"):
+      lines = get_lines(items)
+    metrics.add_count("lines", len(lines))
+    yield from lines
+
+
+def _serialize_blocks(dictionary: PronunciationDict, options: SerializationOptions, mp_options: Optional[MultiprocessingOptions]) -> Generator[str, None, None]:
+  # yields the lines of `BLOCK_SIZE` words joined by line breaks
+  if mp_options is None or mp_options.n_jobs == 1 or len(dictionary) <= BLOCK_SIZE:
+    get_block = partial(_get_block, get_lines=_get_lines_formatter(options))
+    for items in get_batches(dictionary.items(), BLOCK_SIZE):
+      yield get_block(items)
+    return
+
+  items = list(dictionary.items())
+  block_ranges = (
+    (start, min(start + BLOCK_SIZE, len(items)))
+    for start in range(0, len(items), BLOCK_SIZE)
+  )
+  process_method = partial(process_get_block, options=options)
+
+  with Pool(
+    processes=mp_options.n_jobs,
+    initializer=__init_pool_prepare_cache_mp,
+    initargs=(items,),
+    maxtasksperchild=mp_options.maxtasksperchild,
+  ) as pool:
+    # the finished blocks wait for the writer, i.e., only a few of them are kept in memory
+    yield from imap_bounded(pool, process_method, block_ranges, mp_options.n_jobs * PENDING_BLOCKS_PER_JOB)
+
+
+def _get_block(items: List[Tuple[Word, Pronunciations]], get_lines: Callable[[Iterable[Tuple[Word, Pronunciations]]], List[str]]) -> str:
+  block = "\n".join(get_lines(items))
+  return block
+
+
+process_items: List[Tuple[Word, Pronunciations]] = None
+
+
+def __init_pool_prepare_cache_mp(items: List[Tuple[Word, Pronunciations]]) -> None:
+  global process_items
+  process_items = items
+
+
+def process_get_block(block_range: Tuple[int, int], options: SerializationOptions) -> str:
+  global process_items
+  start, end = block_range
+  assert 0 <= start < end <= len(process_items)
+  result = _get_block(process_items[start:end], _get_lines_formatter(options))
+  return result
+
+
+def _get_lines_formatter(options: SerializationOptions) -> Callable[[Iterable[Tuple[Word, Pronunciations]]], List[str]]:
+  # returns a formatter which is specialized on the options and produces the same lines as `_get_line_for_pronunciation`
+  sep = _part_separators[options.parts_sep]
+  join_symbols = _PHONEME_SEP.join
+
+  if options.include_counter and options.include_weights:
+    def get_lines(items: Iterable[Tuple[Word, Pronunciations]]) -> List[str]:
+      return [
+        f"{word}({counter}){sep}{weight}{sep}{join_symbols(pronunciation)}" if counter > 1 else f"{word}{sep}{weight}{sep}{join_symbols(pronunciation)}"
+        for word, pronunciations in items
+        for counter, (pronunciation, weight) in enumerate(pronunciations.items(), start=1)
+      ]
+  elif options.include_counter:
+    def get_lines(items: Iterable[Tuple[Word, Pronunciations]]) -> List[str]:
+      return [
+        f"{word}({counter}){sep}{join_symbols(pronunciation)}" if counter > 1 else f"{word}{sep}{join_symbols(pronunciation)}"
+        for word, pronunciations in items
+        for counter, pronunciation in enumerate(pronunciations.keys(), start=1)
+      ]
+  elif options.include_weights:
+    def get_lines(items: Iterable[Tuple[Word, Pronunciations]]) -> List[str]:
+      return [
+        f"{word}{sep}{weight}{sep}{join_symbols(pronunciation)}"
+        for word, pronunciations in items
+        for pronunciation, weight in pronunciations.items()
+      ]
+  else:
+    def get_lines(items: Iterable[Tuple[Word, Pronunciations]]) -> List[str]:
+      return [
+        f"{word}{sep}{join_symbols(pronunciation)}"
+        for word, pronunciations in items
+        for pronunciation in pronunciations.keys()
+      ]
+  return get_lines
 
 
 def _get_lines_for_pronunciation(word: str, pronunciations: Pronunciations, part_separator: str, include_weights: bool, include_counter: bool) -> Generator[str, None, None]:
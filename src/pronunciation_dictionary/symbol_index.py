@@ -0,0 +1,162 @@
+from multiprocessing.pool import Pool
+from typing import Dict, Iterable, KeysView, List, Optional, Tuple
+
+from pronunciation_dictionary.deserialization import get_batches
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.types import PronunciationDict, Pronunciations, Symbol, Weight, Word
+from pronunciation_dictionary.validation import (validate_dictionary, validate_mp_options,
+                                                 validate_pronunciation, validate_pronunciations,
+                                                 validate_weight, validate_word)
+
+BLOCK_SIZE = 10000
+
+# occurrences and summed weights of each symbol in the pronunciations of one word
+WordSymbolStatistics = Dict[Symbol, Tuple[int, Weight]]
+
+
+class SymbolIndex():
+  # symbol counts, weighted frequencies and postings which are updated per word instead of scanning the whole dictionary
+  def __init__(self, dictionary: PronunciationDict, validate: bool = True, mp_options: Optional[MultiprocessingOptions] = None) -> None:
+    if validate:
+      try:
+        validate_dictionary(dictionary)
+      except ValueError as error:
+        raise ValueError("dictionary", error.args[1]) from error
+    if mp_options is not None and (msg := validate_mp_options(mp_options)):
+      raise ValueError(f"Parameter 'mp_options': {msg}")
+
+    # count and summed weights per symbol
+    self.__totals: Dict[Symbol, List] = {}
+    self.__symbol_words: Dict[Symbol, Dict[Word, int]] = {}
+    self.__word_symbols: Dict[Word, WordSymbolStatistics] = {}
+
+    for word, statistics in _get_statistics(dictionary, mp_options):
+      self.__add(word, statistics)
+
+  def __len__(self) -> int:
+    return len(self.__word_symbols)
+
+  def __contains__(self, word: object) -> bool:
+    return word in self.__word_symbols
+
+  @property
+  def symbols(self) -> KeysView[Symbol]:
+    return self.__totals.keys()
+
+  def get_count(self, symbol: Symbol) -> int:
+    totals = self.__totals.get(symbol)
+    return 0 if totals is None else totals[0]
+
+  def get_weighted_frequency(self, symbol: Symbol) -> Weight:
+    totals = self.__totals.get(symbol)
+    return 0 if totals is None else totals[1]
+
+  def get_words(self, symbol: Symbol) -> KeysView[Word]:
+    # the words are returned in the order they were added
+    return self.__symbol_words.get(symbol, {}).keys()
+
+  def get_symbols(self, word: Word) -> KeysView[Symbol]:
+    return self.__word_symbols[word].keys()
+
+  def update_word(self, word: Word, pronunciations: Pronunciations) -> None:
+    # needs to be called after the pronunciations of a word were added or changed
+    validate_word(word)
+    if msg := validate_pronunciations(pronunciations):
+      raise ValueError(f"Parameter 'pronunciations': {msg}")
+    for pronunciation, weight in pronunciations.items():
+      validate_pronunciation(pronunciation)
+      validate_weight(weight)
+
+    if word in self.__word_symbols:
+      self.__remove(word)
+    self.__add(word, _get_word_statistics(pronunciations))
+
+  def remove_word(self, word: Word) -> None:
+    if word not in self.__word_symbols:
+      raise KeyError(word)
+    self.__remove(word)
+
+  def __add(self, word: Word, statistics: WordSymbolStatistics) -> None:
+    all_totals = self.__totals
+    symbol_words = self.__symbol_words
+    for symbol, (count, weighted_frequency) in statistics.items():
+      totals = all_totals.get(symbol)
+      if totals is None:
+        all_totals[symbol] = [count, weighted_frequency]
+        symbol_words[symbol] = {word: count}
+        continue
+      totals[0] += count
+      totals[1] += weighted_frequency
+      symbol_words[symbol][word] = count
+    self.__word_symbols[word] = statistics
+
+  def __remove(self, word: Word) -> None:
+    statistics = self.__word_symbols.pop(word)
+    for symbol, (count, weighted_frequency) in statistics.items():
+      totals = self.__totals[symbol]
+      if totals[0] == count:
+        # removing unused symbols also resets the summed weights
+        del self.__totals[symbol]
+        del self.__symbol_words[symbol]
+        continue
+      totals[0] -= count
+      totals[1] -= weighted_frequency
+      del self.__symbol_words[symbol][word]
+
+
+def _get_statistics(dictionary: PronunciationDict, mp_options: Optional[MultiprocessingOptions]) -> Iterable[Tuple[Word, WordSymbolStatistics]]:
+  if mp_options is None or mp_options.n_jobs == 1 or len(dictionary) <= BLOCK_SIZE:
+    for word, pronunciations in dictionary.items():
+      yield word, _get_word_statistics(pronunciations)
+    return
+
+  items = list(dictionary.items())
+  block_ranges = (
+    (start, min(start + BLOCK_SIZE, len(items)))
+    for start in range(0, len(items), BLOCK_SIZE)
+  )
+
+  with Pool(
+    processes=mp_options.n_jobs,
+    initializer=__init_pool_prepare_cache_mp,
+    initargs=(items,),
+    maxtasksperchild=mp_options.maxtasksperchild,
+  ) as pool:
+    blocks = pool.imap(process_get_statistics, block_ranges, mp_options.chunksize)
+    for block_items, block_statistics in zip(get_batches(items, BLOCK_SIZE), blocks):
+      for (word, _), statistics in zip(block_items, block_statistics):
+        yield word, statistics
+
+
+process_items: List[Tuple[Word, Pronunciations]] = None
+
+
+def __init_pool_prepare_cache_mp(items: List[Tuple[Word, Pronunciations]]) -> None:
+  global process_items
+  process_items = items
+
+
+def process_get_statistics(block_range: Tuple[int, int]) -> List[WordSymbolStatistics]:
+  global process_items
+  start, end = block_range
+  assert 0 <= start < end <= len(process_items)
+  result = [
+    _get_word_statistics(pronunciations)
+    for _, pronunciations in process_items[start:end]
+  ]
+  return result
+
+
+def _get_word_statistics(pronunciations: Pronunciations) -> WordSymbolStatistics:
+  if len(pronunciations) == 1:
+    (pronunciation, weight), = pronunciations.items()
+    if len(set(pronunciation)) == len(pronunciation):
+      # the most common case: each symbol occurs once in the only pronunciation
+      return dict.fromkeys(pronunciation, (1, weight))
+
+  result: WordSymbolStatistics = {}
+  for pronunciation, weight in pronunciations.items():
+    for symbol in pronunciation:
+      count, weighted_frequency = result.get(symbol, (0, 0))
+      result[symbol] = (count + 1, weighted_frequency + weight)
+  return result
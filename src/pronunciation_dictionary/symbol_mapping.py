@@ -0,0 +1,163 @@
+from collections import OrderedDict
+from pathlib import Path
+from sys import intern
+from typing import Any, Dict, Generator, Iterable, List, Mapping, Optional, Tuple, Union
+
+from pronunciation_dictionary.deserialization import (DeserializationOptions,
+                                                      validate_deserialization_options)
+from pronunciation_dictionary.merging import (MergePolicy, _get_normalized, _get_weight_combiner,
+                                              _read_sorted_entries, _write_entries_atomic,
+                                              validate_policy)
+from pronunciation_dictionary.serialization import (SerializationOptions,
+                                                    _validate_serialization_options)
+from pronunciation_dictionary.types import (Pronunciation, PronunciationDict, Pronunciations,
+                                            Symbol, Word)
+from pronunciation_dictionary.validation import (_contain_whitespace, validate_dictionary,
+                                                 validate_type)
+
+# e.g. {"AH0": "ə", "ER0": ("ə", "r"), ("T", "S"): "ts", "#": ()}
+SymbolMappingInput = Mapping[Union[Symbol, Pronunciation], Union[Symbol, Pronunciation]]
+# the mapped pronunciations which are kept while a file is converted
+MAX_CACHED_PRONUNCIATIONS = 100000
+
+
+class SymbolMapping():
+  # compiles a mapping of symbols or symbol sequences to symbol sequences; an empty sequence removes the symbols
+  def __init__(self, mapping: SymbolMappingInput, keep_unmapped_symbols: bool = True) -> None:
+    if msg := validate_type(keep_unmapped_symbols, bool):
+      raise ValueError(f"Parameter 'keep_unmapped_symbols': {msg}")
+
+    self.__keep_unmapped_symbols = keep_unmapped_symbols
+    self.__symbol_table: Dict[Symbol, Pronunciation] = {}
+    # the sequences of at least two symbols by their first symbol, longest first
+    self.__sequence_table: Dict[Symbol, List[Tuple[Pronunciation, Pronunciation]]] = {}
+
+    for source, target in mapping.items():
+      source_symbols = (source,) if isinstance(source, str) else source
+      target_symbols = (target,) if isinstance(target, str) else target
+      if not _is_valid_symbols(source_symbols) or len(source_symbols) == 0:
+        raise ValueError(f"Parameter 'mapping': Invalid source \"{source}\"!")
+      if not _is_valid_symbols(target_symbols):
+        raise ValueError(f"Parameter 'mapping': Invalid target \"{target}\" of source \"{source}\"!")
+      # each output symbol is stored only once
+      target_symbols = tuple(map(intern, target_symbols))
+      if len(source_symbols) == 1:
+        self.__symbol_table[source_symbols[0]] = target_symbols
+      else:
+        self.__sequence_table.setdefault(source_symbols[0], []).append(
+          (tuple(source_symbols), target_symbols))
+
+    for sequences in self.__sequence_table.values():
+      sequences.sort(key=lambda sequence: len(sequence[0]), reverse=True)
+
+  def map_pronunciation(self, pronunciation: Pronunciation) -> Pronunciation:
+    # the longest matching sequence is replaced first from left to right
+    symbol_table = self.__symbol_table
+    sequence_table = self.__sequence_table
+    result: List[Symbol] = []
+    position = 0
+    while position < len(pronunciation):
+      symbol = pronunciation[position]
+      target_symbols = None
+      source_length = 1
+      for source_symbols, sequence_target_symbols in sequence_table.get(symbol, ()):
+        if pronunciation[position:position + len(source_symbols)] == source_symbols:
+          target_symbols = sequence_target_symbols
+          source_length = len(source_symbols)
+          break
+      if target_symbols is None:
+        target_symbols = symbol_table.get(symbol)
+        if target_symbols is None:
+          target_symbols = self.__get_unmapped(symbol)
+      result.extend(target_symbols)
+      position += source_length
+    return tuple(result)
+
+  def __get_unmapped(self, symbol: Symbol) -> Pronunciation:
+    if not self.__keep_unmapped_symbols:
+      raise ValueError(f"Symbol \"{symbol}\" is not mapped!")
+    # the next occurrences are found in the table
+    target_symbols = (intern(symbol),)
+    self.__symbol_table[symbol] = target_symbols
+    return target_symbols
+
+
+def _is_valid_symbols(symbols: Any) -> bool:
+  if not isinstance(symbols, tuple):
+    return False
+  return all(isinstance(symbol, str) and len(symbol) > 0 and not _contain_whitespace(symbol) for symbol in symbols)
+
+
+def map_symbols(dictionary: PronunciationDict, mapping: SymbolMapping, policy: MergePolicy = "first-wins", validate: bool = True) -> PronunciationDict:
+  # pronunciations which are mapped to the same pronunciation are merged via `policy`; empty ones are removed
+  if validate:
+    try:
+      validate_dictionary(dictionary)
+    except ValueError as error:
+      raise ValueError("dictionary", error.args[1]) from error
+  if msg := validate_type(mapping, SymbolMapping):
+    raise ValueError(f"Parameter 'mapping': {msg}")
+  if msg := validate_policy(policy):
+    raise ValueError(f"Parameter 'policy': {msg}")
+
+  result: PronunciationDict = OrderedDict()
+  # the cache can't get larger than the dictionary
+  for word, mapped_pronunciations in _map_entries(dictionary.items(), mapping, policy, max_cached=None):
+    result[word] = mapped_pronunciations
+  return result
+
+
+def map_dict_file(path: Path, output_path: Path, encoding: str, options: DeserializationOptions, serialization_options: SerializationOptions, mapping: SymbolMapping, policy: MergePolicy = "first-wins") -> None:
+  # converts the file line by line; the file needs to be sorted by word (see `sort_dict_file`), i.e., only the lines of the current word are kept in memory
+  if msg := validate_type(path, Path):
+    raise ValueError(f"Parameter 'path': {msg}")
+  if msg := validate_type(output_path, Path):
+    raise ValueError(f"Parameter 'output_path': {msg}")
+  if msg := validate_type(encoding, str):
+    raise ValueError(f"Parameter 'encoding': {msg}")
+  if msg := validate_deserialization_options(options):
+    raise ValueError(f"Parameter 'options': {msg}")
+  if msg := _validate_serialization_options(serialization_options):
+    raise ValueError(f"Parameter 'serialization_options': {msg}")
+  if msg := validate_type(mapping, SymbolMapping):
+    raise ValueError(f"Parameter 'mapping': {msg}")
+  if msg := validate_policy(policy):
+    raise ValueError(f"Parameter 'policy': {msg}")
+
+  entries = _read_sorted_entries(path, encoding, options)
+  # the output can be the input file
+  _write_entries_atomic(output_path, encoding, _map_entries(
+    entries, mapping, policy, MAX_CACHED_PRONUNCIATIONS), serialization_options)
+
+
+def _map_entries(entries: Iterable[Tuple[Word, Pronunciations]], mapping: SymbolMapping, policy: MergePolicy, max_cached: Optional[int]) -> Generator[Tuple[Word, Pronunciations], None, None]:
+  combine = _get_weight_combiner(policy)
+  normalize = policy == "normalize"
+  # most pronunciations occur multiple times in a dictionary, they are mapped only once and share one tuple; the caches are cleared if they exceed `max_cached` entries
+  mapped_cache: Dict[Pronunciation, Pronunciation] = {}
+  # equal results of different pronunciations share one tuple, too
+  mapped_tuples: Dict[Pronunciation, Pronunciation] = {}
+  for word, pronunciations in entries:
+    mapped_pronunciations: Pronunciations = OrderedDict()
+    for pronunciation, weight in pronunciations.items():
+      mapped_pronunciation = mapped_cache.get(pronunciation)
+      if mapped_pronunciation is None:
+        if max_cached is not None and len(mapped_cache) >= max_cached:
+          mapped_cache.clear()
+          mapped_tuples.clear()
+        mapped_pronunciation = mapping.map_pronunciation(pronunciation)
+        mapped_pronunciation = mapped_tuples.setdefault(mapped_pronunciation, mapped_pronunciation)
+        mapped_cache[pronunciation] = mapped_pronunciation
+      if len(mapped_pronunciation) == 0:
+        continue
+      existing_weight = mapped_pronunciations.get(mapped_pronunciation)
+      if existing_weight is None:
+        mapped_pronunciations[mapped_pronunciation] = weight
+      else:
+        mapped_pronunciations[mapped_pronunciation] = combine(existing_weight, weight)
+    if len(mapped_pronunciations) == 0:
+      continue
+    if normalize:
+      # like in `merge_dicts`, the weights of all words are normalized
+      mapped_pronunciations = _get_normalized(mapped_pronunciations)
+    yield word, mapped_pronunciations
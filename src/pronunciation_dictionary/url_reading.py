@@ -0,0 +1,222 @@
+import json
+import zlib
+from hashlib import sha256
+from http.client import HTTPConnection, HTTPException, HTTPResponse, HTTPSConnection
+from pathlib import Path
+from typing import Dict, Generator, Iterable, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, urlopen
+
+CHUNK_SIZE = 1024 * 1024
+MAX_REDIRECTS = 10
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# detects gzip and zlib headers
+GZIP_WBITS = 32 + zlib.MAX_WBITS
+
+
+class HttpConnectionPool():
+  # keeps one persistent connection per host
+  def __init__(self) -> None:
+    self.__connections: Dict[Tuple[str, str], HTTPConnection] = {}
+
+  def request(self, url: str, headers: Dict[str, str]) -> HTTPResponse:
+    for _ in range(MAX_REDIRECTS + 1):
+      response = self.__request_once(url, headers)
+      if response.status not in REDIRECT_STATUSES:
+        return response
+      location = response.getheader("Location")
+      response.read()
+      if location is None:
+        break
+      url = urljoin(url, location)
+    raise HTTPError(url, response.status, "Too many redirects!", response.headers, None)
+
+  def __request_once(self, url: str, headers: Dict[str, str]) -> HTTPResponse:
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+      raise ValueError("url", f"Scheme \"{parts.scheme}\" is not supported!")
+    key = (parts.scheme, parts.netloc)
+    target = parts.path or "/"
+    if parts.query:
+      target += f"?{parts.query}"
+
+    connection = self.__connections.get(key)
+    if connection is not None:
+      try:
+        connection.request("GET", target, headers=headers)
+        return connection.getresponse()
+      except (HTTPException, OSError):
+        # the server closed the connection in the meantime or the last response was not read completely
+        connection.close()
+
+    connection_type = HTTPSConnection if parts.scheme == "https" else HTTPConnection
+    connection = connection_type(parts.netloc)
+    self.__connections[key] = connection
+    connection.request("GET", target, headers=headers)
+    return connection.getresponse()
+
+  def close(self) -> None:
+    for connection in self.__connections.values():
+      connection.close()
+    self.__connections.clear()
+
+
+def read_url_lines(url: str, encoding: str, cache_dir: Optional[Path], connection_pool: Optional[HttpConnectionPool]) -> Generator[str, None, None]:
+  # the response is decoded and split into lines while it is downloaded
+  chunks = __read_body_chunks(url, cache_dir, connection_pool)
+  for line in __split_lines(chunks):
+    yield line.decode(encoding)
+
+
+def __open_url(url: str, headers: Dict[str, str], connection_pool: Optional[HttpConnectionPool]) -> HTTPResponse:
+  if connection_pool is not None:
+    response = connection_pool.request(url, headers)
+    if response.status >= 400:
+      response.read()
+      raise HTTPError(url, response.status, response.reason, response.headers, None)
+    return response
+  try:
+    return urlopen(Request(url, headers=headers))
+  except HTTPError as error:
+    # not modified, i.e., the cached content is valid
+    if error.code == 304:
+      return error
+    raise
+
+
+def __read_body_chunks(url: str, cache_dir: Optional[Path], connection_pool: Optional[HttpConnectionPool]) -> Generator[bytes, None, None]:
+  headers = {"Accept-Encoding": "gzip"}
+  is_gzip_file = urlsplit(url).path.lower().endswith(".gz")
+
+  if cache_dir is None:
+    with __open_url(url, headers, connection_pool) as response:
+      content_encoding = response.headers.get("Content-Encoding")
+      yield from __decode_content(__read_chunks(response), content_encoding, is_gzip_file)
+    return
+
+  cache = UrlCache(cache_dir, url)
+  metadata = cache.read_metadata()
+  validator = None if metadata is None else metadata.get("etag") or metadata.get("last_modified")
+  has_complete_content = metadata is not None and metadata["complete"] and cache.content_path.is_file()
+  has_partial_content = metadata is not None and not metadata["complete"] and cache.partial_path.is_file()
+
+  if validator is not None and has_complete_content:
+    if "etag" in metadata:
+      headers["If-None-Match"] = metadata["etag"]
+    else:
+      headers["If-Modified-Since"] = metadata["last_modified"]
+  elif validator is not None and has_partial_content:
+    # only the missing bytes are requested if the content didn't change
+    headers["Range"] = f"bytes={cache.partial_path.stat().st_size}-"
+    headers["If-Range"] = validator
+
+  with __open_url(url, headers, connection_pool) as response:
+    status = response.getcode()
+    if status == 304 and has_complete_content:
+      response.read()
+      yield from __decode_content(cache.read_content_chunks(), metadata.get("content_encoding"), is_gzip_file)
+      return
+
+    if status == 206 and has_partial_content:
+      content_encoding = metadata.get("content_encoding")
+      chunks = cache.read_partial_chunks()
+      append = True
+    elif status == 200:
+      content_encoding = response.headers.get("Content-Encoding")
+      chunks = iter(())
+      append = False
+      cache.write_metadata({
+        "complete": False,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "content_encoding": content_encoding,
+      })
+    else:
+      raise HTTPError(url, status, "Unexpected response!", response.headers, None)
+
+    def read_and_cache_chunks() -> Generator[bytes, None, None]:
+      yield from chunks
+      with cache.partial_path.open(mode="ab" if append else "wb") as partial_file:
+        for chunk in __read_chunks(response):
+          partial_file.write(chunk)
+          yield chunk
+      cache.complete()
+
+    yield from __decode_content(read_and_cache_chunks(), content_encoding, is_gzip_file)
+
+
+def __read_chunks(response: HTTPResponse) -> Generator[bytes, None, None]:
+  while chunk := response.read(CHUNK_SIZE):
+    yield chunk
+
+
+def __decode_content(chunks: Iterable[bytes], content_encoding: Optional[str], is_gzip_file: bool) -> Generator[bytes, None, None]:
+  if content_encoding not in ("gzip", "x-gzip") and not is_gzip_file:
+    yield from chunks
+    return
+
+  decompressor = zlib.decompressobj(GZIP_WBITS)
+  for chunk in chunks:
+    while chunk:
+      yield decompressor.decompress(chunk)
+      # concatenated gzip members
+      chunk = decompressor.unused_data
+      if chunk:
+        yield decompressor.flush()
+        decompressor = zlib.decompressobj(GZIP_WBITS)
+  yield decompressor.flush()
+  # otherwise truncated content would be parsed without an error
+  if not decompressor.eof:
+    raise ValueError("url", "Compressed content is incomplete!")
+
+
+def __split_lines(chunks: Iterable[bytes]) -> Generator[bytes, None, None]:
+  # lines are split at b"\n" like the lines of a binary file (without the line break)
+  rest = b""
+  for chunk in chunks:
+    lines = (rest + chunk).split(b"\n")
+    rest = lines.pop()
+    yield from lines
+  if rest:
+    yield rest
+
+
+class UrlCache():
+  def __init__(self, cache_dir: Path, url: str) -> None:
+    name = sha256(url.encode("UTF-8")).hexdigest()
+    self.metadata_path = cache_dir / f"{name}.json"
+    self.content_path = cache_dir / f"{name}.content"
+    self.partial_path = cache_dir / f"{name}.partial"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+  def read_metadata(self) -> Optional[Dict]:
+    if not self.metadata_path.is_file():
+      return None
+    try:
+      metadata = json.loads(self.metadata_path.read_text("UTF-8"))
+    except ValueError:
+      return None
+    metadata = {key: value for key, value in metadata.items() if value is not None}
+    return metadata
+
+  def write_metadata(self, metadata: Dict) -> None:
+    self.metadata_path.write_text(json.dumps(metadata), "UTF-8")
+
+  def complete(self) -> None:
+    self.partial_path.replace(self.content_path)
+    metadata = self.read_metadata()
+    metadata["complete"] = True
+    self.write_metadata(metadata)
+
+  def read_content_chunks(self) -> Generator[bytes, None, None]:
+    yield from self.__read_file_chunks(self.content_path)
+
+  def read_partial_chunks(self) -> Generator[bytes, None, None]:
+    yield from self.__read_file_chunks(self.partial_path)
+
+  @staticmethod
+  def __read_file_chunks(path: Path) -> Generator[bytes, None, None]:
+    with path.open(mode="rb") as file:
+      while chunk := file.read(CHUNK_SIZE):
+        yield chunk
@@ -1,8 +1,14 @@
 from collections import OrderedDict
-from typing import Any, Optional, Union
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing.pool import Pool
+from typing import Any, Iterable, List, Optional, Tuple, Union
 
 from pronunciation_dictionary.mp_options import MultiprocessingOptions
-from pronunciation_dictionary.types import Pronunciation, PronunciationDict, Pronunciations
+from pronunciation_dictionary.types import (Pronunciation, PronunciationDict, Pronunciations,
+                                            Word)
+
+BLOCK_SIZE = 10000
 
 
 class ValidationError():
@@ -19,31 +25,135 @@ class InternalError(ValidationError):
 
 
 def _contain_whitespace(chars: str) -> bool:
-  for char in chars:
-    if char in (" ", "\t"):
-      return True
-  return False
+  return " " in chars or "\t" in chars
+
+
+def _is_valid_word(word: Any) -> bool:
+  return isinstance(word, str) and len(word) > 0 and not _contain_whitespace(word)
 
 
-def validate_dictionary(dictionary: PronunciationDict) -> None:
+def _is_valid_pronunciation(pronunciation: Any) -> bool:
+  if not (isinstance(pronunciation, tuple) and len(pronunciation) > 0):
+    return False
+  # joining fails if any phoneme is no 'str' and checks all phonemes for whitespace at once
+  try:
+    joined_phonemes = "".join(pronunciation)
+  except TypeError:
+    return False
+  return not _contain_whitespace(joined_phonemes)
+
+
+def validate_dictionary(dictionary: PronunciationDict, mp_options: Optional[MultiprocessingOptions] = None) -> None:
   if not (isinstance(dictionary, OrderedDict)):
     raise ValueError("dictionary", "Type needs to be 'OrderedDict'!")
-  for word, pronunciations in dictionary.items():
+  violations = get_dictionary_violations(dictionary, fail_fast=True, mp_options=mp_options)
+  if len(violations) > 0:
+    raise ValueError("dictionary", violations[0].message)
+
+
+@dataclass()
+class DictionaryViolation():
+  # the numbers start at 1; `pronunciation_nr` is None if the violation concerns the whole entry
+  word_nr: int
+  word: Any
+  pronunciation_nr: Optional[int]
+  message: str
+
+
+def get_dictionary_violations(dictionary: PronunciationDict, fail_fast: bool = False, mp_options: Optional[MultiprocessingOptions] = None) -> List[DictionaryViolation]:
+  # returns all violations in the order of the entries; `fail_fast` stops after the first invalid entry
+  if msg := validate_type(dictionary, OrderedDict):
+    raise ValueError(f"Parameter 'dictionary': {msg}")
+  if msg := validate_type(fail_fast, bool):
+    raise ValueError(f"Parameter 'fail_fast': {msg}")
+  if mp_options is not None and (msg := validate_mp_options(mp_options)):
+    raise ValueError(f"Parameter 'mp_options': {msg}")
+
+  if mp_options is None or mp_options.n_jobs == 1 or len(dictionary) <= BLOCK_SIZE:
+    result = _get_block_violations(dictionary.items(), 1, fail_fast)
+    return result
+
+  result: List[DictionaryViolation] = []
+
+  items = list(dictionary.items())
+  block_ranges = (
+    (start, min(start + BLOCK_SIZE, len(items)))
+    for start in range(0, len(items), BLOCK_SIZE)
+  )
+  process_method = partial(process_get_block_violations, fail_fast=fail_fast)
+
+  with Pool(
+    processes=mp_options.n_jobs,
+    initializer=__init_pool_prepare_cache_mp,
+    initargs=(items,),
+    maxtasksperchild=mp_options.maxtasksperchild,
+  ) as pool:
+    # the blocks are returned in order, i.e., the first violation is the same as without multiprocessing
+    for block_violations in pool.imap(process_method, block_ranges, mp_options.chunksize):
+      result.extend(block_violations)
+      if fail_fast and len(result) > 0:
+        break
+  return result
+
+
+process_items: List[Tuple[Word, Pronunciations]] = None
+
+
+def __init_pool_prepare_cache_mp(items: List[Tuple[Word, Pronunciations]]) -> None:
+  global process_items
+  process_items = items
+
+
+def process_get_block_violations(block_range: Tuple[int, int], fail_fast: bool) -> List[DictionaryViolation]:
+  global process_items
+  start, end = block_range
+  assert 0 <= start < end <= len(process_items)
+  result = _get_block_violations(process_items[start:end], start + 1, fail_fast)
+  return result
+
+
+def _get_block_violations(items: Iterable[Tuple[Word, Pronunciations]], first_word_nr: int, fail_fast: bool) -> List[DictionaryViolation]:
+  result: List[DictionaryViolation] = []
+  for word_nr, (word, pronunciations) in enumerate(items, start=first_word_nr):
+    # only invalid entries are checked again to get all of their violations
+    is_valid = _is_valid_word(word) and isinstance(pronunciations, OrderedDict)
+    if is_valid:
+      for pronunciation, weight in pronunciations.items():
+        if not (_is_valid_pronunciation(pronunciation) and isinstance(weight, (float, int))):
+          is_valid = False
+          break
+    if is_valid:
+      continue
+    result.extend(_get_entry_violations(word_nr, word, pronunciations))
+    if fail_fast:
+      break
+  return result
+
+
+def _get_entry_violations(word_nr: int, word: Any, pronunciations: Any) -> List[DictionaryViolation]:
+  # the validation methods are only called to get the error messages
+  result: List[DictionaryViolation] = []
+  if not _is_valid_word(word):
     try:
       validate_word(word)
     except ValueError as error:
-      raise ValueError("dictionary", error.args[1]) from error
-    if not isinstance(pronunciations, OrderedDict):
-      raise ValueError("dictionary", "Pronunciations need to be of type 'OrderedDict'!")
-    for pronunciation, weight in pronunciations.items():
+      result.append(DictionaryViolation(word_nr, word, None, error.args[1]))
+  if not isinstance(pronunciations, OrderedDict):
+    result.append(DictionaryViolation(word_nr, word, None,
+                  "Pronunciations need to be of type 'OrderedDict'!"))
+    return result
+  for pronunciation_nr, (pronunciation, weight) in enumerate(pronunciations.items(), start=1):
+    if not _is_valid_pronunciation(pronunciation):
       try:
         validate_pronunciation(pronunciation)
       except ValueError as error:
-        raise ValueError("dictionary", error.args[1]) from error
+        result.append(DictionaryViolation(word_nr, word, pronunciation_nr, error.args[1]))
+    if not isinstance(weight, (float, int)):
       try:
         validate_weight(weight)
       except ValueError as error:
-        raise ValueError("dictionary", error.args[1]) from error
+        result.append(DictionaryViolation(word_nr, word, pronunciation_nr, error.args[1]))
+  return result
 
 
 def validate_word(word: str) -> None:
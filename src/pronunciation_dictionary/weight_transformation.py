@@ -0,0 +1,235 @@
+import heapq
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import partial
+from math import isfinite
+from multiprocessing.pool import Pool
+from typing import Callable, Generator, List, Optional, Tuple
+
+from pronunciation_dictionary.deserialization import get_batches
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.types import PronunciationDict, Pronunciations, Weight, Word
+from pronunciation_dictionary.validation import validate_dictionary, validate_mp_options
+
+BLOCK_SIZE = 10000
+
+# the indices of the kept pronunciations (None if all are kept) and their new weights
+TransformedWeights = Tuple[Optional[List[int]], List[Weight]]
+
+
+@dataclass()
+class WeightTransformationOptions():
+  # the transformations are applied per word in the order of the properties
+  remove_zero_weights: bool = False
+  # each weight w is replaced by w ** (1 / temperature)
+  temperature: Optional[float] = None
+  # pronunciations with a lower share of the summed weights are removed except the one with the highest weight
+  threshold: Optional[float] = None
+  # keeps the pronunciations with the highest weights in their original order
+  top_k: Optional[int] = None
+  normalize: bool = False
+
+
+def validate_weight_transformation_options(options: WeightTransformationOptions) -> Optional[str]:
+  if not isinstance(options.remove_zero_weights, bool):
+    return "Property 'remove_zero_weights' is invalid!"
+  if not (options.temperature is None or (isinstance(options.temperature, (float, int)) and options.temperature > 0 and isfinite(options.temperature))):
+    return "Property 'temperature' is invalid!"
+  if not (options.threshold is None or (isinstance(options.threshold, (float, int)) and 0 <= options.threshold <= 1)):
+    return "Property 'threshold' is invalid!"
+  if not (options.top_k is None or (isinstance(options.top_k, int) and options.top_k > 0)):
+    return "Property 'top_k' is invalid!"
+  if not isinstance(options.normalize, bool):
+    return "Property 'normalize' is invalid!"
+  return None
+
+
+def transform_weights(dictionary: PronunciationDict, options: WeightTransformationOptions, in_place: bool = False, validate: bool = True, mp_options: Optional[MultiprocessingOptions] = None) -> PronunciationDict:
+  # words without remaining pronunciations are removed; `in_place` changes and returns the given dictionary
+  if validate:
+    try:
+      validate_dictionary(dictionary)
+    except ValueError as error:
+      raise ValueError("dictionary", error.args[1]) from error
+  if msg := validate_weight_transformation_options(options):
+    raise ValueError(f"Parameter 'options': {msg}")
+  if mp_options is not None and (msg := validate_mp_options(mp_options)):
+    raise ValueError(f"Parameter 'mp_options': {msg}")
+
+  result: PronunciationDict = dictionary if in_place else OrderedDict()
+  if options == WeightTransformationOptions(normalize=True):
+    # the most common case: the weights are replaced directly
+    __normalize_weights(dictionary, result, in_place)
+    return result
+
+  if in_place and options.temperature is not None:
+    # checked before any weight is changed, i.e., the dictionary is unchanged on an error
+    __validate_non_negative_weights(dictionary)
+
+  transformed_entries = __get_transformed_entries(dictionary, options, mp_options)
+  removed_words: List[Word] = []
+  for word, pronunciations, transformed in transformed_entries:
+    __set_transformed(result, word, pronunciations, transformed, in_place, removed_words)
+  for word in removed_words:
+    del result[word]
+  return result
+
+
+def __validate_non_negative_weights(dictionary: PronunciationDict) -> None:
+  for pronunciations in dictionary.values():
+    if min(pronunciations.values()) < 0:
+      raise ValueError("dictionary", "Temperature scaling requires non-negative weights!")
+
+
+def __normalize_weights(dictionary: PronunciationDict, result: PronunciationDict, in_place: bool) -> None:
+  for word, pronunciations in dictionary.items():
+    if not in_place:
+      pronunciations = pronunciations.copy()
+      result[word] = pronunciations
+    total = sum(pronunciations.values())
+    if total > 0:
+      for pronunciation, weight in pronunciations.items():
+        pronunciations[pronunciation] = weight / total
+
+
+def __get_transformed_entries(dictionary: PronunciationDict, options: WeightTransformationOptions, mp_options: Optional[MultiprocessingOptions]) -> Generator[Tuple[Word, Pronunciations, TransformedWeights], None, None]:
+  if mp_options is None or mp_options.n_jobs == 1 or len(dictionary) <= BLOCK_SIZE:
+    transform = _get_weights_transformer(options)
+    for word, pronunciations in dictionary.items():
+      yield word, pronunciations, transform(list(pronunciations.values()))
+  else:
+    items = list(dictionary.items())
+    block_ranges = (
+      (start, min(start + BLOCK_SIZE, len(items)))
+      for start in range(0, len(items), BLOCK_SIZE)
+    )
+    process_method = partial(process_transform_block, options=options)
+
+    with Pool(
+      processes=mp_options.n_jobs,
+      initializer=__init_pool_prepare_cache_mp,
+      initargs=(items,),
+      maxtasksperchild=mp_options.maxtasksperchild,
+    ) as pool:
+      # only the weights are transferred back
+      blocks = pool.imap(process_method, block_ranges, mp_options.chunksize)
+      for block_items, transformed_block in zip(get_batches(items, BLOCK_SIZE), blocks):
+        for (word, pronunciations), transformed in zip(block_items, transformed_block):
+          yield word, pronunciations, transformed
+
+
+def __set_transformed(result: PronunciationDict, word: Word, pronunciations: Pronunciations, transformed: TransformedWeights, in_place: bool, removed_words: List[Word]) -> None:
+  kept_indices, weights = transformed
+  if len(weights) == 0:
+    if in_place:
+      # the dictionary can't be changed while it is iterated
+      removed_words.append(word)
+    return
+  if kept_indices is None:
+    if in_place:
+      if len(weights) == 1:
+        pronunciations[next(iter(pronunciations))] = weights[0]
+        return
+      for pronunciation, weight in zip(pronunciations.keys(), weights):
+        pronunciations[pronunciation] = weight
+    else:
+      result[word] = OrderedDict(zip(pronunciations.keys(), weights))
+    return
+  all_pronunciations = list(pronunciations.keys())
+  kept_pronunciations = OrderedDict(
+    (all_pronunciations[index], weight)
+    for index, weight in zip(kept_indices, weights)
+  )
+  if in_place:
+    pronunciations.clear()
+    pronunciations.update(kept_pronunciations)
+  else:
+    result[word] = kept_pronunciations
+
+
+process_items: List[Tuple[Word, Pronunciations]] = None
+
+
+def __init_pool_prepare_cache_mp(items: List[Tuple[Word, Pronunciations]]) -> None:
+  global process_items
+  process_items = items
+
+
+def process_transform_block(block_range: Tuple[int, int], options: WeightTransformationOptions) -> List[TransformedWeights]:
+  global process_items
+  start, end = block_range
+  assert 0 <= start < end <= len(process_items)
+  transform = _get_weights_transformer(options)
+  result = [
+    transform(list(pronunciations.values()))
+    for _, pronunciations in process_items[start:end]
+  ]
+  return result
+
+
+def _get_weights_transformer(options: WeightTransformationOptions) -> Callable[[List[Weight]], TransformedWeights]:
+  # the transformations only depend on the weights and their order
+  remove_zero_weights = options.remove_zero_weights
+  exponent = None if options.temperature is None else 1 / options.temperature
+  threshold = options.threshold
+  top_k = options.top_k
+  normalize = options.normalize
+
+  def transform(weights: List[Weight]) -> TransformedWeights:
+    kept_indices = None
+    if len(weights) == 1:
+      # the most common case: the threshold and top-k keep the only pronunciation
+      weight = weights[0]
+      if remove_zero_weights and weight == 0:
+        return kept_indices, []
+      if exponent is not None:
+        if weight < 0:
+          raise ValueError("dictionary", "Temperature scaling requires non-negative weights!")
+        weight = weight ** exponent
+      if normalize and weight > 0:
+        weight = 1.0
+      return kept_indices, [weight]
+
+    if remove_zero_weights and 0 in weights:
+      kept_indices, weights = __keep(kept_indices, weights, [
+        index for index, weight in enumerate(weights) if weight != 0
+      ])
+      if len(weights) == 0:
+        return kept_indices, weights
+
+    if exponent is not None:
+      if min(weights) < 0:
+        raise ValueError("dictionary", "Temperature scaling requires non-negative weights!")
+      weights = [weight ** exponent for weight in weights]
+
+    if threshold is not None and len(weights) > 1:
+      total = sum(weights)
+      if total > 0:
+        best_index = max(range(len(weights)), key=weights.__getitem__)
+        indices = [
+          index for index, weight in enumerate(weights)
+          if weight / total >= threshold or index == best_index
+        ]
+        if len(indices) < len(weights):
+          kept_indices, weights = __keep(kept_indices, weights, indices)
+
+    if top_k is not None and len(weights) > top_k:
+      # the first of equally weighted pronunciations is kept like in a stable sort
+      indices = sorted(heapq.nlargest(top_k, range(len(weights)), key=weights.__getitem__))
+      kept_indices, weights = __keep(kept_indices, weights, indices)
+
+    if normalize:
+      total = sum(weights)
+      if total > 0:
+        weights = [weight / total for weight in weights]
+    return kept_indices, weights
+
+  return transform
+
+
+def __keep(kept_indices: Optional[List[int]], weights: List[Weight], indices: List[int]) -> TransformedWeights:
+  if kept_indices is not None:
+    indices_of_original = [kept_indices[index] for index in indices]
+  else:
+    indices_of_original = indices
+  return indices_of_original, [weights[index] for index in indices]
@@ -0,0 +1,55 @@
+import random
+from bisect import bisect
+from itertools import accumulate
+from math import isfinite
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pronunciation_dictionary.types import Pronunciation, PronunciationDict, Weight, Word
+from pronunciation_dictionary.validation import validate_dictionary, validate_seed
+
+
+class WeightedPronunciationSampler():
+  # draws pronunciations like `get_weighted_pronunciation` from cumulative weights which are calculated only once
+  def __init__(self, dictionary: PronunciationDict, seed: Optional[int] = None, validate: bool = True) -> None:
+    if validate:
+      try:
+        validate_dictionary(dictionary)
+      except ValueError as error:
+        raise ValueError("dictionary", error.args[1]) from error
+    if seed is not None and (msg := validate_seed(seed)):
+      raise ValueError(f"Parameter 'seed': {msg}")
+
+    self.__rng = random.Random(seed)
+    self.__tables: Dict[Word, Tuple[Tuple[Pronunciation, ...], List[Weight], float, int]] = {}
+    for word, pronunciations in dictionary.items():
+      cum_weights = list(accumulate(pronunciations.values()))
+      # words without pronunciations are accepted by `validate_dictionary`
+      total = cum_weights[-1] + 0.0 if len(cum_weights) > 0 else 0.0
+      if not (total > 0.0 and isfinite(total)):
+        raise ValueError("dictionary", f"Weights of word \"{word}\" need to sum up to a positive finite value!")
+      self.__tables[word] = (tuple(pronunciations.keys()), cum_weights, total, len(cum_weights) - 1)
+
+  def __len__(self) -> int:
+    return len(self.__tables)
+
+  def __contains__(self, word: object) -> bool:
+    return word in self.__tables
+
+  def seed(self, seed: Optional[int]) -> None:
+    if seed is not None and (msg := validate_seed(seed)):
+      raise ValueError(f"Parameter 'seed': {msg}")
+    self.__rng.seed(seed)
+
+  def sample(self, word: Word) -> Pronunciation:
+    pronunciations, cum_weights, total, hi = self.__tables[word]
+    # one random value is drawn per word like in `random.choices` with `k=1`
+    return pronunciations[bisect(cum_weights, self.__rng.random() * total, 0, hi)]
+
+  def sample_many(self, words: Iterable[Word]) -> List[Pronunciation]:
+    tables = self.__tables
+    get_random_value = self.__rng.random
+    result = []
+    for word in words:
+      pronunciations, cum_weights, total, hi = tables[word]
+      result.append(pronunciations[bisect(cum_weights, get_random_value() * total, 0, hi)])
+    return result
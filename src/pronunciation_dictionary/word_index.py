@@ -0,0 +1,175 @@
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence
+
+from pronunciation_dictionary.deserialization import WORD_ALT_PATTERN
+from pronunciation_dictionary.types import PronunciationDict, Word
+from pronunciation_dictionary.validation import validate_dictionary, validate_type
+
+MAGIC = b"PRONWIDX"
+FORMAT_VERSION = 2
+# magic, version, byte order, count of words and length of the word blob
+HEADER_FORMAT = "<8sHB5x2Q"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+TEXT_ENCODING = "UTF-8"
+TEXT_ERRORS = "surrogatepass"
+BYTE_ORDERS = {"little": 0, "big": 1}
+# words can't contain spaces and tabs but any other character, e.g., line breaks
+WORD_SEPARATOR = " "
+MAX_CHAR = chr(sys.maxunicode)
+
+
+class WordIndex():
+  # the words sorted by code points and by their case-folded form; all queries are binary searches
+  def __init__(self, dictionary: PronunciationDict, validate: bool = True) -> None:
+    if validate:
+      try:
+        validate_dictionary(dictionary)
+      except ValueError as error:
+        raise ValueError("dictionary", error.args[1]) from error
+
+    words = sorted(dictionary.keys())
+    folded_words = [word.casefold() for word in words]
+    # the sort is stable, i.e., words with the same case-folded form keep their order
+    folded_word_ids = array("Q", sorted(range(len(words)), key=folded_words.__getitem__))
+    self.__set_words(words, folded_word_ids)
+
+  @classmethod
+  def _from_sorted_words(cls, words: List[Word], folded_word_ids: array) -> "WordIndex":
+    result = cls.__new__(cls)
+    result.__set_words(words, folded_word_ids)
+    return result
+
+  def __set_words(self, words: List[Word], folded_word_ids: array) -> None:
+    self.__words = words
+    self.__folded_word_ids = folded_word_ids
+    self.__folded_words = [words[word_id].casefold() for word_id in folded_word_ids]
+
+  @property
+  def words(self) -> Sequence[Word]:
+    return self.__words
+
+  def __len__(self) -> int:
+    return len(self.__words)
+
+  def __iter__(self) -> Iterator[Word]:
+    return iter(self.__words)
+
+  def __contains__(self, word: object) -> bool:
+    if not isinstance(word, str):
+      return False
+    position = bisect_left(self.__words, word)
+    return position < len(self.__words) and self.__words[position] == word
+
+  def get_casefolded_words(self, word: Word) -> List[Word]:
+    # e.g. "Abbe" returns "ABBE", "Abbe" and "abbe" if they exist
+    folded_word = word.casefold()
+    start = bisect_left(self.__folded_words, folded_word)
+    end = start
+    while end < len(self.__folded_words) and self.__folded_words[end] == folded_word:
+      end += 1
+    return self.__get_folded_range(start, end)
+
+  def get_words_with_prefix(self, prefix: str, casefold: bool = False) -> List[Word]:
+    if casefold:
+      prefix = prefix.casefold()
+    return self.__get_range(prefix, _get_prefix_end(prefix), casefold)
+
+  def get_words_in_range(self, start: Optional[str], end: Optional[str], casefold: bool = False) -> List[Word]:
+    # the range includes `start` but not `end`; `None` means unbounded
+    if casefold:
+      start = None if start is None else start.casefold()
+      end = None if end is None else end.casefold()
+    return self.__get_range(start, end, casefold)
+
+  def __get_range(self, start: Optional[str], end: Optional[str], casefold: bool) -> List[Word]:
+    sorted_words = self.__folded_words if casefold else self.__words
+    start_position = 0 if start is None else bisect_left(sorted_words, start)
+    end_position = len(sorted_words) if end is None else bisect_left(sorted_words, end)
+    end_position = max(start_position, end_position)
+    if casefold:
+      return self.__get_folded_range(start_position, end_position)
+    return self.__words[start_position:end_position]
+
+  def get_alternative_words(self, word: Word) -> List[Word]:
+    # the word and its numbered entries, e.g., "ABBE", "ABBE(1)" and "ABBE(2)", which are merged if `consider_word_nrs` is set
+    candidates = self.get_words_with_prefix(f"{word}(")
+    alternatives = []
+    for candidate in candidates:
+      match = WORD_ALT_PATTERN.fullmatch(candidate)
+      if match is not None and match.group(1) == word:
+        alternatives.append(candidate)
+    alternatives.sort(key=lambda alternative: int(alternative[len(word) + 1:-1]))
+    if word in self:
+      alternatives.insert(0, word)
+    return alternatives
+
+  def __get_folded_range(self, start: int, end: int) -> List[Word]:
+    words = self.__words
+    return [words[word_id] for word_id in self.__folded_word_ids[start:end]]
+
+  def _get_folded_word_ids(self) -> array:
+    return self.__folded_word_ids
+
+  def __reduce__(self):
+    # the case-folded words are not stored
+    return WordIndex._from_sorted_words, (self.__words, self.__folded_word_ids)
+
+
+def _get_prefix_end(prefix: str) -> Optional[str]:
+  # the smallest string which is greater than all strings starting with `prefix`
+  prefix = prefix.rstrip(MAX_CHAR)
+  if prefix == "":
+    return None
+  return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def save_word_index(index: WordIndex, path: Path) -> None:
+  if msg := validate_type(index, WordIndex):
+    raise ValueError(f"Parameter 'index': {msg}")
+  if msg := validate_type(path, Path):
+    raise ValueError(f"Parameter 'path': {msg}")
+
+  word_blob = WORD_SEPARATOR.join(index.words).encode(TEXT_ENCODING, TEXT_ERRORS)
+  header = struct.pack(
+    HEADER_FORMAT,
+    MAGIC,
+    FORMAT_VERSION,
+    BYTE_ORDERS[sys.byteorder],
+    len(index),
+    len(word_blob),
+  )
+  path.parent.mkdir(parents=True, exist_ok=True)
+  with path.open(mode="wb") as file:
+    file.write(header)
+    file.write(word_blob)
+    file.write(index._get_folded_word_ids().tobytes())
+
+
+def load_word_index(path: Path) -> WordIndex:
+  if msg := validate_type(path, Path):
+    raise ValueError(f"Parameter 'path': {msg}")
+
+  content = path.read_bytes()
+  if len(content) < HEADER_SIZE:
+    raise ValueError("Parameter 'path': File is not a word index!")
+  magic, version, byte_order, n_words, word_blob_length = struct.unpack_from(
+    HEADER_FORMAT, content)
+  if magic != MAGIC:
+    raise ValueError("Parameter 'path': File is not a word index!")
+  if version != FORMAT_VERSION:
+    raise ValueError(f"Parameter 'path': Format version {version} is not supported!")
+
+  word_blob = content[HEADER_SIZE:HEADER_SIZE + word_blob_length]
+  words = word_blob.decode(TEXT_ENCODING, TEXT_ERRORS).split(WORD_SEPARATOR) if n_words > 0 else []
+  folded_word_ids = array("Q")
+  folded_word_ids.frombytes(content[HEADER_SIZE + word_blob_length:])
+  if byte_order != BYTE_ORDERS[sys.byteorder]:
+    folded_word_ids.byteswap()
+  if len(words) != n_words or len(folded_word_ids) != n_words:
+    raise ValueError("Parameter 'path': File is incomplete!")
+  result = WordIndex._from_sorted_words(words, folded_word_ids)
+  return result
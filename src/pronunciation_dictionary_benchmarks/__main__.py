@@ -0,0 +1,83 @@
+import json
+import platform
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pronunciation_dictionary_benchmarks.benchmarks import (BENCHMARKS, BenchmarkResult, get_cases,
+                                                            result_to_json, run_cases)
+from pronunciation_dictionary_benchmarks.generation import GenerationOptions
+
+DEFAULT_SIZES = [10000, 100000, 1000000]
+
+
+def main(args: Optional[List[str]] = None) -> int:
+  parser = ArgumentParser(
+    prog="python -m pronunciation_dictionary_benchmarks",
+    description="Measures the runtime, throughput and peak memory on synthetic CMU-style dictionaries.",
+  )
+  parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                      help="number of lines of the generated dictionaries (10k to 5M)")
+  parser.add_argument("--benchmarks", type=str, nargs="+", choices=BENCHMARKS,
+                      default=list(BENCHMARKS))
+  parser.add_argument("--n-jobs", type=int, nargs="+", default=[1, 2, 4])
+  parser.add_argument("--chunksize", type=int, nargs="+", default=[10000, 100000])
+  parser.add_argument("--weights", action="store_true", help="generate weights")
+  parser.add_argument("--counters", action="store_true", help="generate word numbers, e.g., 'WORD(2)'")
+  parser.add_argument("--comments", action="store_true", help="generate line comments")
+  parser.add_argument("--pronunciation-comments", action="store_true",
+                      help="generate pronunciation comments")
+  parser.add_argument("--repeat", type=int, default=3, help="the best of these runs is reported")
+  parser.add_argument("--seed", type=int, default=1234)
+  parser.add_argument("--output", type=Path, help="write the results as JSON to this file")
+  parser.add_argument("--baseline", type=Path, help="compare against the results in this JSON file")
+  parser.add_argument("--tolerance", type=float, default=0.1,
+                      help="maximum relative slowdown compared to the baseline")
+  ns = parser.parse_args(args)
+
+  options = GenerationOptions(ns.weights, ns.counters, ns.comments, ns.pronunciation_comments)
+  cases = get_cases(ns.benchmarks, ns.sizes, ns.n_jobs, ns.chunksize)
+  results = run_cases(cases, options, ns.repeat, ns.seed, __print_result)
+
+  report = {
+    "python": platform.python_version(),
+    "platform": platform.platform(),
+    "options": vars(options),
+    "results": [result_to_json(result) for result in results],
+  }
+  if ns.output is not None:
+    ns.output.parent.mkdir(parents=True, exist_ok=True)
+    ns.output.write_text(json.dumps(report, indent=2), "UTF-8")
+
+  if ns.baseline is None:
+    return 0
+  baseline = json.loads(ns.baseline.read_text("UTF-8"))
+  regressions = compare_to_baseline(report, baseline, ns.tolerance)
+  for regression in regressions:
+    print(regression)
+  print(f"{len(regressions)} regression(s) compared to {ns.baseline}.")
+  return 1 if len(regressions) > 0 else 0
+
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+  # only cases which exist in both reports are compared
+  baseline_seconds = {result["key"]: result["seconds"] for result in baseline["results"]}
+  result = []
+  for current in report["results"]:
+    previous_seconds = baseline_seconds.get(current["key"])
+    if previous_seconds is None:
+      continue
+    if current["seconds"] > previous_seconds * (1 + tolerance):
+      result.append(
+        f"{current['key']}: {current['seconds']:.3f}s instead of {previous_seconds:.3f}s (+{current['seconds'] / previous_seconds - 1:.0%})")
+  return result
+
+
+def __print_result(result: BenchmarkResult) -> None:
+  peak_rss = "n/a" if result.peak_rss is None else f"{result.peak_rss / 1024:.1f}MiB"
+  print(f"{result.case.key:<50} {result.seconds:>9.3f}s {result.lines_per_second:>12.0f} lines/s  peak RSS {peak_rss}", flush=True)
+
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,172 @@
+import multiprocessing
+import time
+import traceback
+from collections import deque
+from dataclasses import asdict, dataclass
+from multiprocessing.connection import Connection
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, Dict, List, Optional
+
+from pronunciation_dictionary.deserialization import deserialize
+from pronunciation_dictionary.io import load_dict, save_dict
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.phoneme_set_extraction import get_phoneme_set
+from pronunciation_dictionary.pronunciation_selection import STRATEGIES, select_pronunciations
+from pronunciation_dictionary.serialization import SerializationOptions, serialize
+from pronunciation_dictionary_benchmarks.generation import (GenerationOptions,
+                                                            get_deserialization_options,
+                                                            write_dictionary_file)
+
+try:
+  import resource
+except ImportError:
+  # not available on Windows
+  resource = None
+
+BENCHMARKS = ("deserialize", "load_dict", "serialize", "save_dict",
+              "get_phoneme_set", "select_pronunciations")
+# only these benchmarks use `MultiprocessingOptions`
+MP_BENCHMARKS = ("deserialize", "load_dict", "save_dict")
+
+
+@dataclass()
+class BenchmarkCase():
+  benchmark: str
+  n_lines: int
+  n_jobs: int
+  chunksize: int
+  strategy: Optional[str] = None
+
+  @property
+  def key(self) -> str:
+    result = f"{self.benchmark}|{self.n_lines}|{self.n_jobs}|{self.chunksize}"
+    if self.strategy is not None:
+      result += f"|{self.strategy}"
+    return result
+
+
+@dataclass()
+class BenchmarkResult():
+  case: BenchmarkCase
+  seconds: float
+  lines_per_second: float
+  # in KiB, None if not available on the platform
+  peak_rss: Optional[int]
+  setup_rss: Optional[int]
+
+
+def get_cases(benchmarks: List[str], sizes: List[int], n_jobs_grid: List[int], chunksize_grid: List[int]) -> List[BenchmarkCase]:
+  result = []
+  for n_lines in sizes:
+    for benchmark in benchmarks:
+      if benchmark in MP_BENCHMARKS:
+        for n_jobs in n_jobs_grid:
+          for chunksize in chunksize_grid:
+            result.append(BenchmarkCase(benchmark, n_lines, n_jobs, chunksize))
+      elif benchmark == "select_pronunciations":
+        for strategy in STRATEGIES:
+          result.append(BenchmarkCase(benchmark, n_lines, 1, 1, strategy))
+      else:
+        result.append(BenchmarkCase(benchmark, n_lines, 1, 1))
+  return result
+
+
+def run_cases(cases: List[BenchmarkCase], options: GenerationOptions, repeat: int, seed: int, on_result: Callable[[BenchmarkResult], None]) -> List[BenchmarkResult]:
+  result = []
+  with TemporaryDirectory(prefix="pronunciation_dictionary_benchmarks") as tmp_dir:
+    paths: Dict[int, Path] = {}
+    for case in cases:
+      if case.n_lines not in paths:
+        paths[case.n_lines] = Path(tmp_dir) / f"{case.n_lines}.dict"
+        write_dictionary_file(paths[case.n_lines], case.n_lines, options, seed)
+      benchmark_result = run_case(case, paths[case.n_lines], options, repeat)
+      on_result(benchmark_result)
+      result.append(benchmark_result)
+  return result
+
+
+def run_case(case: BenchmarkCase, path: Path, options: GenerationOptions, repeat: int) -> BenchmarkResult:
+  # each case runs in a new process, otherwise the peak memory of previous cases would be included
+  # a pool can't be used because its daemonic workers can't start the pools of the benchmarks
+  context = multiprocessing.get_context("spawn")
+  receiver, sender = context.Pipe(duplex=False)
+  process = context.Process(target=_measure_case, args=(sender, case, path, options, repeat))
+  process.start()
+  sender.close()
+  try:
+    is_successful, values = receiver.recv()
+  except EOFError:
+    # the process was killed, e.g., because it ran out of memory
+    is_successful, values = False, "No result was received!"
+  process.join()
+  if not is_successful:
+    raise RuntimeError(f"Benchmark '{case.key}' failed:\n{values}")
+  seconds, peak_rss, setup_rss = values
+  result = BenchmarkResult(
+    case=case,
+    seconds=seconds,
+    lines_per_second=case.n_lines / seconds if seconds > 0 else float("inf"),
+    peak_rss=peak_rss,
+    setup_rss=setup_rss,
+  )
+  return result
+
+
+def _measure_case(sender: Connection, case: BenchmarkCase, path: Path, options: GenerationOptions, repeat: int) -> None:
+  try:
+    method = __prepare_case(case, path, options)
+    setup_rss = __get_peak_rss()
+    best_seconds = float("inf")
+    for _ in range(repeat):
+      start = time.perf_counter()
+      method()
+      best_seconds = min(best_seconds, time.perf_counter() - start)
+    sender.send((True, (best_seconds, __get_peak_rss(), setup_rss)))
+  except Exception:
+    sender.send((False, traceback.format_exc()))
+  finally:
+    sender.close()
+
+
+def __prepare_case(case: BenchmarkCase, path: Path, options: GenerationOptions) -> Callable[[], Any]:
+  # returns the method to measure; reading the input is not measured
+  deserialization_options = get_deserialization_options(options)
+  mp_options = MultiprocessingOptions(case.n_jobs, None, case.chunksize)
+  serialization_options = SerializationOptions(
+    "DOUBLE-SPACE", options.include_counters, options.include_weights)
+
+  if case.benchmark == "deserialize":
+    lines = path.read_text("UTF-8").splitlines()
+    return lambda: deserialize(lines, deserialization_options, mp_options)
+  if case.benchmark == "load_dict":
+    return lambda: load_dict(path, "UTF-8", deserialization_options, mp_options)
+
+  dictionary = load_dict(path, "UTF-8", deserialization_options,
+                         MultiprocessingOptions(1, None, 1))
+  if case.benchmark == "serialize":
+    # consumes the lines without keeping them
+    return lambda: deque(serialize(dictionary, serialization_options), maxlen=0)
+  if case.benchmark == "save_dict":
+    output_path = path.parent / f"{path.name}.{case.key.replace('|', '_')}.out"
+    return lambda: save_dict(dictionary, output_path, "UTF-8", serialization_options, mp_options=mp_options)
+  if case.benchmark == "get_phoneme_set":
+    return lambda: get_phoneme_set(dictionary)
+  assert case.benchmark == "select_pronunciations"
+  return lambda: select_pronunciations(dictionary, case.strategy, 1234)
+
+
+def __get_peak_rss() -> Optional[int]:
+  if resource is None:
+    return None
+  # KiB on Linux, bytes on macOS; the workers of the benchmarks are included after they exited
+  return max(
+    resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+  )
+
+
+def result_to_json(result: BenchmarkResult) -> Dict[str, Any]:
+  json_result = asdict(result)
+  json_result["key"] = result.case.key
+  return json_result
@@ -0,0 +1,85 @@
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Generator
+
+from pronunciation_dictionary.deserialization import DeserializationOptions
+
+ARPABET_VOWELS = ("AA", "AE", "AH", "AO", "AW", "AY", "EH", "ER",
+                  "EY", "IH", "IY", "OW", "OY", "UH", "UW")
+ARPABET_CONSONANTS = ("B", "CH", "D", "DH", "F", "G", "HH", "JH", "K", "L", "M", "N",
+                      "NG", "P", "R", "S", "SH", "T", "TH", "V", "W", "Y", "Z", "ZH")
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ'"
+# ratio of words with alternative pronunciations, similar to the CMU dictionary
+ALTERNATIVES_RATIO = 0.08
+COMMENTS_RATIO = 0.01
+PRONUNCIATION_COMMENTS_RATIO = 0.05
+
+
+@dataclass()
+class GenerationOptions():
+  include_weights: bool
+  include_counters: bool
+  include_comments: bool
+  include_pronunciation_comments: bool
+
+
+def get_deserialization_options(options: GenerationOptions) -> DeserializationOptions:
+  result = DeserializationOptions(
+    consider_comments=options.include_comments,
+    consider_word_nrs=options.include_counters,
+    consider_pronunciation_comments=options.include_pronunciation_comments,
+    consider_weights=options.include_weights,
+  )
+  return result
+
+
+def generate_lines(n_lines: int, options: GenerationOptions, seed: int) -> Generator[str, None, None]:
+  # CMU-style lines, e.g., "WORD(2)  0.5  W ER1 D # comment"
+  rng = random.Random(seed)
+  word_nr = 0
+  n_generated = 0
+  while n_generated < n_lines:
+    if options.include_comments and rng.random() < COMMENTS_RATIO:
+      yield f";;; comment {n_generated}"
+      n_generated += 1
+      continue
+
+    word = __get_word(rng, word_nr)
+    word_nr += 1
+    n_pronunciations = 2 if rng.random() < ALTERNATIVES_RATIO else 1
+    for counter in range(1, n_pronunciations + 1):
+      if n_generated == n_lines:
+        break
+      parts = [f"{word}({counter})" if options.include_counters and counter > 1 else word]
+      if options.include_weights:
+        parts.append(f"{rng.choice((0.25, 0.5, 0.75, 1.0))}")
+      parts.append(" ".join(__get_pronunciation(rng)))
+      line = "  ".join(parts)
+      if options.include_pronunciation_comments and rng.random() < PRONUNCIATION_COMMENTS_RATIO:
+        line += " # place, name"
+      yield line
+      n_generated += 1
+
+
+def write_dictionary_file(path: Path, n_lines: int, options: GenerationOptions, seed: int) -> None:
+  path.parent.mkdir(parents=True, exist_ok=True)
+  with path.open(mode="w", encoding="UTF-8") as file:
+    for line_nr, line in enumerate(generate_lines(n_lines, options, seed)):
+      if line_nr > 0:
+        file.write("\n")
+      file.write(line)
+
+
+def __get_word(rng: random.Random, word_nr: int) -> str:
+  # the number makes the words unique
+  prefix = "".join(rng.choice(LETTERS) for _ in range(rng.randint(2, 8)))
+  return f"{prefix}{word_nr}"
+
+
+def __get_pronunciation(rng: random.Random) -> Generator[str, None, None]:
+  for _ in range(rng.randint(2, 10)):
+    if rng.random() < 0.4:
+      yield f"{rng.choice(ARPABET_VOWELS)}{rng.randint(0, 2)}"
+    else:
+      yield rng.choice(ARPABET_CONSONANTS)
@@ -0,0 +1,94 @@
+import math
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from pronunciation_dictionary.binary_format import open_dict_binary, save_dict_binary
+from pronunciation_dictionary.phoneme_set_extraction import get_phoneme_set
+from pronunciation_dictionary.serialization import SerializationOptions, serialize
+from pronunciation_dictionary.types import PronunciationDict, Pronunciations
+
+
+def get_test_dictionary() -> PronunciationDict:
+  dictionary = PronunciationDict()
+  dictionary["test"] = Pronunciations()
+  dictionary["test"][("T", "E", "S", "T")] = 0.25
+  dictionary["test"][("T", "E", "S")] = 0.75
+  dictionary["ärger"] = Pronunciations()
+  dictionary["ärger"][("ɛ", "ɐ")] = 2
+  dictionary["Abc"] = Pronunciations()
+  dictionary["Abc"][("A",)] = 1.0
+  return dictionary
+
+
+def test_round_trip(tmp_path: Path):
+  dictionary = get_test_dictionary()
+  path = tmp_path / "test.bin"
+  save_dict_binary(dictionary, path)
+
+  with open_dict_binary(path) as result:
+    assert len(result) == 3
+    assert list(result.keys()) == ["test", "ärger", "Abc"]
+    assert list(result.items()) == list(dictionary.items())
+    assert isinstance(result["ärger"][("ɛ", "ɐ")], int)
+    assert get_phoneme_set(result) == {"T", "E", "S", "ɛ", "ɐ", "A"}
+    options = SerializationOptions("TAB", True, True)
+    assert list(serialize(OrderedDict(result.items()), options)) == list(serialize(dictionary, options))
+
+
+def test_lookup(tmp_path: Path):
+  path = tmp_path / "test.bin"
+  save_dict_binary(get_test_dictionary(), path)
+
+  with open_dict_binary(path) as result:
+    assert result["Abc"] == OrderedDict(((("A",), 1.0),))
+    assert "abc" not in result
+    assert 1 not in result
+    with pytest.raises(KeyError):
+      result["abc"]
+
+
+def test_pickle_reopens_file(tmp_path: Path):
+  path = tmp_path / "test.bin"
+  save_dict_binary(get_test_dictionary(), path)
+
+  with open_dict_binary(path) as result:
+    with pickle.loads(pickle.dumps(result)) as unpickled:
+      assert unpickled.path == path
+      assert list(unpickled.items()) == list(result.items())
+
+
+def test_empty_dictionary(tmp_path: Path):
+  path = tmp_path / "test.bin"
+  save_dict_binary(OrderedDict(), path)
+
+  with open_dict_binary(path) as result:
+    assert len(result) == 0
+    assert "test" not in result
+
+
+def test_text_file_raises_error(tmp_path: Path):
+  path = tmp_path / "test.dict"
+  path.write_text("test  T E S T\n" * 20, "UTF-8")
+
+  with pytest.raises(ValueError) as error:
+    open_dict_binary(path)
+
+  assert error.value.args == ("path", "File is not a binary dictionary!")
+
+
+def test_nan_weight_is_stored(tmp_path: Path):
+  path = tmp_path / "test.bin"
+  save_dict_binary(OrderedDict((("a", OrderedDict(((("A",), float("nan")),))),)), path)
+
+  with open_dict_binary(path) as result:
+    assert math.isnan(result["a"][("A",)])
+
+
+def test_too_large_int_weight_raises_error(tmp_path: Path):
+  with pytest.raises(ValueError) as error:
+    save_dict_binary(OrderedDict((("a", OrderedDict(((("A",), 10**400),))),)), tmp_path / "test.bin")
+
+  assert error.value.args == ("dictionary", f"Weight \"{10**400}\" can't be stored as float!")
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+
+import pytest
+
+from pronunciation_dictionary.compact_dictionary import CompactPronunciationDict
+from pronunciation_dictionary.phoneme_set_extraction import get_phoneme_set
+from pronunciation_dictionary.pronunciation_selection import get_pronunciation_with_highest_weight
+from pronunciation_dictionary.types import PronunciationDict, Pronunciations
+
+
+def get_test_dictionary() -> PronunciationDict:
+  dictionary = PronunciationDict()
+  dictionary["test"] = Pronunciations()
+  dictionary["test"][("T", "E", "S", "T")] = 0.25
+  dictionary["test"][("T", "E", "S")] = 0.75
+  dictionary["xy"] = Pronunciations()
+  dictionary["xy"][("X", "Y")] = 1
+  return dictionary
+
+
+def test_items_are_equal():
+  dictionary = get_test_dictionary()
+  result = CompactPronunciationDict(dictionary)
+
+  assert len(result) == 2
+  assert list(result.items()) == list(dictionary.items())
+  assert isinstance(result["xy"][("X", "Y")], int)
+
+
+def test_symbols():
+  result = CompactPronunciationDict(get_test_dictionary())
+
+  assert result.symbols == ("T", "E", "S", "X", "Y")
+  assert get_phoneme_set(result) == {"T", "E", "S", "X", "Y"}
+
+
+def test_selection_on_values():
+  result = CompactPronunciationDict(get_test_dictionary())
+
+  assert get_pronunciation_with_highest_weight(result["test"]) == ("T", "E", "S")
+
+
+def test_missing_word_raises_key_error():
+  result = CompactPronunciationDict(get_test_dictionary())
+
+  assert "abc" not in result
+  with pytest.raises(KeyError):
+    result["abc"]
+
+
+def test_invalid_dictionary_raises_error():
+  with pytest.raises(ValueError):
+    CompactPronunciationDict({})
+
+
+def test_empty_dictionary():
+  result = CompactPronunciationDict(OrderedDict())
+
+  assert len(result) == 0
+  assert result.symbols == ()
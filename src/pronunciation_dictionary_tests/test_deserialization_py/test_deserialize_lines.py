@@ -0,0 +1,77 @@
+from collections import OrderedDict
+
+import pytest
+
+from pronunciation_dictionary.deserialization import (DeserializationOptions, deserialize,
+                                                      deserialize_lines)
+from pronunciation_dictionary.filtering import EntryFilter
+from pronunciation_dictionary.metrics import PipelineMetrics
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+
+
+def test_generator_is_supported():
+  lines = (line for line in ("a A", "b B", "a A2"))
+
+  result = deserialize_lines(lines, DeserializationOptions(
+    False, False, False, False), MultiprocessingOptions(1, None, 1))
+
+  assert result == OrderedDict((
+    ("a", OrderedDict(((("A",), 1.0), (("A2",), 1.0)))),
+    ("b", OrderedDict(((("B",), 1.0),))),
+  ))
+
+
+def test_result_is_independent_of_window_size():
+  lines = [f"w{i % 7}  A{i % 3} B" for i in range(100)]
+  options = DeserializationOptions(False, False, False, False)
+
+  result_single = deserialize_lines(lines, options, MultiprocessingOptions(1, None, 100))
+  result_multi = deserialize_lines(lines, options, MultiprocessingOptions(2, None, 3))
+
+  assert result_single == result_multi
+  assert result_single == deserialize(lines, options, MultiprocessingOptions(1, None, 1))
+
+
+def test_only_duplicates_with_other_weight_are_warned(caplog):
+  lines = ["a  1.0  A", "a  1.0  A", "a  2.0  A"]
+
+  result = deserialize_lines(lines, DeserializationOptions(
+    False, False, False, True), MultiprocessingOptions(1, None, 1))
+
+  assert result == OrderedDict((("a", OrderedDict(((("A",), 1.0),))),))
+  assert [record.levelname for record in caplog.records if record.levelname == "WARNING"] == ["WARNING"]
+  assert any("(1.0 vs. 2.0)" in message for message in caplog.messages)
+
+
+def test_entry_filter_is_applied_before_parsing():
+  lines = [
+    ";;; comment",
+    "a  A",
+    "b(2)  B",
+    "invalid",
+    "c  C X",
+    "b  X",
+    "d  D",
+  ]
+  options = DeserializationOptions(True, True, False, False)
+  entry_filter = EntryFilter(words={"b", "c"}, symbols={"B", "C"})
+  metrics = PipelineMetrics()
+
+  result_single = deserialize_lines(lines, options, MultiprocessingOptions(
+    1, None, 100), metrics=metrics, entry_filter=entry_filter)
+  result_multi = deserialize_lines(lines, options, MultiprocessingOptions(
+    2, None, 2), entry_filter=entry_filter)
+
+  assert result_single == OrderedDict((
+    ("b", OrderedDict(((("B",), 1.0),))),
+  ))
+  assert result_multi == result_single
+  assert metrics.counts["filtered_lines"] == 4
+  assert metrics.counts["skipped_lines"] == 2
+
+
+def test_non_iterable_lines_raise_error():
+  with pytest.raises(ValueError) as error:
+    deserialize_lines(5, DeserializationOptions(False, False, False, False),
+                      MultiprocessingOptions(1, None, 1))
+  assert error.value.args[0] == "Property 'lines': Value needs of type 'Iterable'!"
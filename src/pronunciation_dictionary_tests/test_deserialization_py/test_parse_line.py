@@ -0,0 +1,46 @@
+from pronunciation_dictionary.deserialization import DeserializationOptions, parse_line
+
+
+def test_empty_line():
+  result = parse_line("  \t", DeserializationOptions(False, False, False, False))
+
+  assert result == (None, ["Ignored empty line."])
+
+
+def test_comment():
+  result = parse_line(";;; test", DeserializationOptions(True, False, False, False))
+
+  assert result == (None, ["Ignored comment -> \";;; test\""])
+
+
+def test_invalid_line():
+  result = parse_line("test", DeserializationOptions(False, False, False, False))
+
+  assert result == (None, ["Ignored invalid line -> \"test\""])
+
+
+def test_weight_with_invalid_chars_is_invalid_line():
+  result = parse_line("test 1e5 T", DeserializationOptions(False, False, False, True))
+
+  assert result == (None, ["Ignored invalid line -> \"test 1e5 T\""])
+
+
+def test_weight_not_parseable():
+  result = parse_line("test 1.2.3 T", DeserializationOptions(False, False, False, True))
+
+  assert result == (None, ["Weight couldn't be parsed -> \"1.2.3\""])
+
+
+def test_word_nr_and_comment():
+  result = parse_line("test(2)  T E\tS # c # d", DeserializationOptions(False, True, True, False))
+
+  assert result == (("test", None, ("T", "E", "S", "#", "c")), [
+    "Got alternate pronunciation \"(2)\" for word \"test\"",
+    "Got comment for word \"test\" and pronunciation \"T E\tS # c\" -> \"# d\"",
+  ])
+
+
+def test_word_nr_without_digits_is_kept():
+  result = parse_line("test() 0.5 T#", DeserializationOptions(False, True, True, True))
+
+  assert result == (("test()", 0.5, ("T#",)), [])
@@ -0,0 +1,56 @@
+import logging
+from pathlib import Path
+
+import pytest
+
+from pronunciation_dictionary.deserialization import DeserializationOptions
+from pronunciation_dictionary.external_sort import sort_dict_file
+from pronunciation_dictionary.serialization import SerializationOptions
+
+OPTIONS = DeserializationOptions(True, True, False, True)
+SERIALIZATION_OPTIONS = SerializationOptions("DOUBLE-SPACE", True, True)
+LINES = [
+  ";;; comment",
+  "c  1.0  C",
+  "a  0.5  A B",
+  "b  1.0  B",
+  "a(2)  1.0  A",
+  "c  2.0  C",
+  "a  0.5  A B",
+  "",
+  "b(2)  1.0  B B",
+]
+EXPECTED = "a  0.5  A B\na(2)  1.0  A\nb  1.0  B\nb(2)  1.0  B B\nc  1.0  C"
+
+
+@pytest.mark.parametrize("max_entries_in_memory", [1, 2, 3, 100])
+def test_sorts_and_deduplicates(tmp_path: Path, max_entries_in_memory: int):
+  path = tmp_path / "in.dict"
+  path.write_text("\n".join(LINES), "UTF-8")
+  output_path = tmp_path / "out.dict.gz"
+
+  sort_dict_file(path, output_path, "UTF-8", OPTIONS, SERIALIZATION_OPTIONS,
+                 max_entries_in_memory, tmp_dir=tmp_path)
+
+  result_path = tmp_path / "result.dict"
+  sort_dict_file(output_path, result_path, "UTF-8", OPTIONS, SERIALIZATION_OPTIONS)
+  assert result_path.read_text("UTF-8") == EXPECTED
+  assert sorted(path.name for path in tmp_path.iterdir()) == ["in.dict", "out.dict.gz", "result.dict"]
+
+
+def test_logs_skipped_lines_and_conflicts(tmp_path: Path, caplog):
+  path = tmp_path / "in.dict"
+  path.write_text("\n".join(LINES), "UTF-8")
+
+  with caplog.at_level(logging.INFO):
+    sort_dict_file(path, path, "UTF-8", OPTIONS, SERIALIZATION_OPTIONS, 2)
+
+  assert path.read_text("UTF-8") == EXPECTED
+  assert "Skipped 2 empty, comment or invalid line(s) and 2 duplicate pronunciation(s) of 9 line(s)." in caplog.messages
+  assert "1 duplicate pronunciation(s) had another weight than the first occurrence and were ignored!" in caplog.messages
+
+
+def test_invalid_max_entries_raises_error(tmp_path: Path):
+  with pytest.raises(ValueError):
+    sort_dict_file(tmp_path / "in.dict", tmp_path / "out.dict", "UTF-8",
+                   OPTIONS, SERIALIZATION_OPTIONS, 0)
@@ -0,0 +1,54 @@
+import re
+from collections import OrderedDict
+
+import pytest
+
+from pronunciation_dictionary.filtering import EntryFilter, filter_dict
+
+
+def get_dictionary() -> OrderedDict:
+  return OrderedDict((
+    ("a", OrderedDict(((("A",), 1.0), (("A", "X"), 2.0)))),
+    ("b", OrderedDict(((("B",), 1.0),))),
+    ("c1", OrderedDict(((("X",), 1.0),))),
+  ))
+
+
+def test_words():
+  result = filter_dict(get_dictionary(), EntryFilter(words={"b", "c1", "d"}))
+
+  assert result == OrderedDict((
+    ("b", OrderedDict(((("B",), 1.0),))),
+    ("c1", OrderedDict(((("X",), 1.0),))),
+  ))
+
+
+def test_word_pattern_needs_to_match_whole_word():
+  result = filter_dict(get_dictionary(), EntryFilter(word_pattern=re.compile(r"[a-z]")))
+
+  assert list(result.keys()) == ["a", "b"]
+
+
+def test_symbols_remove_pronunciations_and_empty_words():
+  dictionary = get_dictionary()
+
+  result = filter_dict(dictionary, EntryFilter(symbols={"A", "B"}))
+
+  assert result == OrderedDict((
+    ("a", OrderedDict(((("A",), 1.0),))),
+    ("b", OrderedDict(((("B",), 1.0),))),
+  ))
+  assert dictionary == get_dictionary()
+
+
+def test_all_properties_need_to_match():
+  result = filter_dict(get_dictionary(), EntryFilter(
+    words={"a", "b"}, word_pattern=re.compile("a"), symbols={"A"}))
+
+  assert result == OrderedDict((("a", OrderedDict(((("A",), 1.0),))),))
+
+
+def test_invalid_words_raise_error():
+  with pytest.raises(ValueError) as error:
+    filter_dict(get_dictionary(), EntryFilter(words=["a"]))
+  assert error.value.args[0] == "Parameter 'entry_filter': Property 'words' is invalid!"
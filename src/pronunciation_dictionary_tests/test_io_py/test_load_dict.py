@@ -0,0 +1,88 @@
+from collections import OrderedDict
+from pathlib import Path
+
+from pronunciation_dictionary.deserialization import DeserializationOptions
+from pronunciation_dictionary.filtering import EntryFilter
+from pronunciation_dictionary.io import load_dict
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.parse_cache import ParseCache
+
+
+def test_component(tmp_path: Path):
+  path = tmp_path / "test.dict"
+  path.write_text(
+    ";;; comment\n"
+    "test  T E S T\r\n"
+    "\n"
+    "test(2)  T E S T2 # comment\n"
+    "xy\t0.5\tX Y",
+    "UTF-8"
+  )
+
+  result = load_dict(path, "UTF-8", DeserializationOptions(
+    True, True, True, False), MultiprocessingOptions(1, None, 2))
+
+  assert result == OrderedDict((
+    ("test", OrderedDict((
+      (("T", "E", "S", "T"), 1.0),
+      (("T", "E", "S", "T2"), 1.0),
+    ))),
+    ("xy", OrderedDict((
+      (("0.5", "X", "Y"), 1.0),
+    ))),
+  ))
+
+
+def test_empty_file_returns_empty_dict(tmp_path: Path):
+  path = tmp_path / "test.dict"
+  path.write_text("", "UTF-8")
+
+  result = load_dict(path, "UTF-8", DeserializationOptions(
+    False, False, False, False), MultiprocessingOptions(1, None, 2))
+
+  assert result == OrderedDict()
+
+
+def test_lines_are_split_like_splitlines(tmp_path: Path):
+  path = tmp_path / "test.dict"
+  path.write_text("a A\x0cb B\rc C", "UTF-8")
+
+  result = load_dict(path, "UTF-8", DeserializationOptions(
+    False, False, False, False), MultiprocessingOptions(1, None, 2))
+
+  assert list(result.keys()) == ["a", "b", "c"]
+
+
+def test_entry_filter_is_applied_to_cached_dictionary(tmp_path: Path):
+  path = tmp_path / "test.dict"
+  path.write_text("a  A\nb  B", "UTF-8")
+  options = DeserializationOptions(False, False, False, False)
+  mp_options = MultiprocessingOptions(1, None, 100)
+  cache = ParseCache(tmp_path / "cache")
+  entry_filter = EntryFilter(words={"b"})
+
+  filtered = load_dict(path, "UTF-8", options, mp_options, cache, entry_filter=entry_filter)
+  full = load_dict(path, "UTF-8", options, mp_options, cache)
+  filtered_from_cache = load_dict(path, "UTF-8", options, mp_options,
+                                  cache, entry_filter=entry_filter)
+
+  assert filtered == OrderedDict((("b", OrderedDict(((("B",), 1.0),))),))
+  assert list(full.keys()) == ["a", "b"]
+  assert filtered_from_cache == filtered
+
+
+def test_symbol_filter_keeps_word_order_of_cached_dictionary(tmp_path: Path):
+  path = tmp_path / "test.dict"
+  path.write_text("a  Q\nb  X\na  X", "UTF-8")
+  options = DeserializationOptions(False, False, False, False)
+  mp_options = MultiprocessingOptions(1, None, 100)
+  cache = ParseCache(tmp_path / "cache")
+  entry_filter = EntryFilter(symbols={"X"})
+
+  filtered = load_dict(path, "UTF-8", options, mp_options, cache, entry_filter=entry_filter)
+  load_dict(path, "UTF-8", options, mp_options, cache)
+  filtered_from_cache = load_dict(path, "UTF-8", options, mp_options,
+                                  cache, entry_filter=entry_filter)
+
+  assert list(filtered.keys()) == ["a", "b"]
+  assert filtered_from_cache == filtered
@@ -0,0 +1,130 @@
+import asyncio
+import gzip
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Thread
+
+import pytest
+
+from pronunciation_dictionary.deserialization import DeserializationOptions
+from pronunciation_dictionary.io import (UrlDictionaryLoader, load_dict_from_url,
+                                         load_dict_from_url_async)
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+
+CONTENT = "\n".join(f"word{i}  W O R D{i % 3}" for i in range(1000)).encode("UTF-8")
+ETAG = "\"v1\""
+
+
+class DictionaryHandler(BaseHTTPRequestHandler):
+  protocol_version = "HTTP/1.1"
+  requests = []
+  connections = set()
+
+  def do_GET(self):
+    DictionaryHandler.requests.append((self.path, dict(self.headers)))
+    DictionaryHandler.connections.add(self.client_address)
+    body = CONTENT
+    status = 200
+    headers = {"ETag": ETAG}
+    if self.path == "/gzip":
+      body = gzip.compress(body)
+      headers["Content-Encoding"] = "gzip"
+    elif self.path == "/truncated-gzip":
+      # without the checksum and the size
+      body = gzip.compress(body)[:-8]
+      headers["Content-Encoding"] = "gzip"
+    if self.headers.get("If-None-Match") == ETAG:
+      status, body = 304, b""
+    elif (byte_range := self.headers.get("Range")) and self.headers.get("If-Range") == ETAG:
+      start = int(byte_range[len("bytes="):-1])
+      status, body = 206, body[start:]
+    self.send_response(status)
+    for key, value in headers.items():
+      self.send_header(key, value)
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, *args):
+    pass
+
+
+@pytest.fixture()
+def server_url():
+  server = ThreadingHTTPServer(("127.0.0.1", 0), DictionaryHandler)
+  thread = Thread(target=server.serve_forever, daemon=True)
+  thread.start()
+  DictionaryHandler.requests = []
+  DictionaryHandler.connections = set()
+  yield f"http://127.0.0.1:{server.server_address[1]}"
+  server.shutdown()
+  server.server_close()
+
+
+OPTIONS = DeserializationOptions(False, False, False, False)
+MP_OPTIONS = MultiprocessingOptions(1, None, 100)
+
+
+def test_plain_and_gzip_are_equal(server_url: str):
+  result_plain = load_dict_from_url(f"{server_url}/plain", "UTF-8", OPTIONS, MP_OPTIONS)
+  result_gzip = load_dict_from_url(f"{server_url}/gzip", "UTF-8", OPTIONS, MP_OPTIONS)
+
+  assert len(result_plain) == 1000
+  assert result_plain["word999"] == {("W", "O", "R", "D0"): 1.0}
+  assert result_gzip == result_plain
+
+
+
+def test_truncated_gzip_raises_error(server_url: str):
+  with pytest.raises(ValueError) as error:
+    load_dict_from_url(f"{server_url}/truncated-gzip", "UTF-8", OPTIONS, MP_OPTIONS)
+
+  assert error.value.args == ("url", "Compressed content is incomplete!")
+
+
+def test_cache_uses_etag(server_url: str, tmp_path: Path):
+  result_first = load_dict_from_url(f"{server_url}/gzip", "UTF-8", OPTIONS, MP_OPTIONS, tmp_path)
+  result_second = load_dict_from_url(f"{server_url}/gzip", "UTF-8", OPTIONS, MP_OPTIONS, tmp_path)
+
+  assert result_second == result_first
+  assert "If-None-Match" not in DictionaryHandler.requests[0][1]
+  assert DictionaryHandler.requests[1][1]["If-None-Match"] == ETAG
+
+
+def test_cache_resumes_partial_download(server_url: str, tmp_path: Path):
+  with UrlDictionaryLoader(MP_OPTIONS, tmp_path) as loader:
+    expected = loader.load_dict(f"{server_url}/plain", "UTF-8", OPTIONS)
+  content_path = next(tmp_path.glob("*.content"))
+  metadata_path = next(tmp_path.glob("*.json"))
+  # simulate an interrupted download
+  content_path.replace(content_path.with_suffix(".partial"))
+  content_path.with_suffix(".partial").write_bytes(CONTENT[:500])
+  metadata_path.write_text(metadata_path.read_text("UTF-8").replace(
+    "\"complete\": true", "\"complete\": false"), "UTF-8")
+
+  result = load_dict_from_url(f"{server_url}/plain", "UTF-8", OPTIONS, MP_OPTIONS, tmp_path)
+
+  assert result == expected
+  assert DictionaryHandler.requests[-1][1]["Range"] == "bytes=500-"
+
+
+def test_loader_reuses_connection(server_url: str):
+  with UrlDictionaryLoader(MultiprocessingOptions(2, None, 100)) as loader:
+    results = loader.load_dicts([f"{server_url}/plain", f"{server_url}/gzip"], "UTF-8", OPTIONS)
+
+  assert results[0] == results[1]
+  assert len(DictionaryHandler.requests) == 2
+  assert len(DictionaryHandler.connections) == 1
+
+
+def test_async(server_url: str):
+  async def load_all():
+    return await asyncio.gather(
+      load_dict_from_url_async(f"{server_url}/plain", "UTF-8", OPTIONS, MP_OPTIONS),
+      load_dict_from_url_async(f"{server_url}/gzip", "UTF-8", OPTIONS, MP_OPTIONS),
+    )
+
+  results = asyncio.run(load_all())
+
+  assert len(results[0]) == 1000
+  assert results[0] == results[1]
@@ -0,0 +1,47 @@
+from pathlib import Path
+
+from pronunciation_dictionary.deserialization import DeserializationOptions
+from pronunciation_dictionary.io import DictionaryLoader, load_dict, load_dicts
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+
+
+def write_test_files(directory: Path, count: int):
+  paths = []
+  for file_nr in range(count):
+    path = directory / f"test{file_nr}.dict"
+    path.write_text("\n".join(
+      f"w{line_nr % 50}  F{file_nr} S{line_nr % 3}" for line_nr in range(200 + file_nr)
+    ), "UTF-8")
+    paths.append(path)
+  return paths
+
+
+def test_results_are_in_input_order(tmp_path: Path):
+  paths = write_test_files(tmp_path, 3)
+  options = DeserializationOptions(False, False, False, False)
+  mp_options = MultiprocessingOptions(2, None, 16)
+
+  result = load_dicts(list(reversed(paths)), "UTF-8", options, mp_options)
+
+  assert result == [load_dict(path, "UTF-8", options, mp_options) for path in reversed(paths)]
+  assert result[0]["w0"] == {("F2", "S0"): 1.0, ("F2", "S2"): 1.0, ("F2", "S1"): 1.0}
+
+
+def test_loader_reuses_pool(tmp_path: Path):
+  paths = write_test_files(tmp_path, 2)
+  options = DeserializationOptions(False, False, False, False)
+  mp_options = MultiprocessingOptions(2, None, 16)
+
+  with DictionaryLoader(mp_options) as loader:
+    result_0 = loader.load_dict(paths[0], "UTF-8", options)
+    result_all = loader.load_dicts(paths, "UTF-8", options)
+
+  assert result_all[0] == result_0
+  assert result_all[1] == load_dict(paths[1], "UTF-8", options, MultiprocessingOptions(1, None, 16))
+
+
+def test_empty_list_returns_empty_list():
+  result = load_dicts([], "UTF-8", DeserializationOptions(False, False, False, False),
+                      MultiprocessingOptions(2, None, 16))
+
+  assert result == []
@@ -0,0 +1,78 @@
+import gzip
+import lzma
+from collections import OrderedDict
+from pathlib import Path
+
+from pronunciation_dictionary.deserialization import DeserializationOptions
+from pronunciation_dictionary.io import load_dict, save_dict
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.serialization import SerializationOptions
+from pronunciation_dictionary.types import PronunciationDict, Pronunciations
+
+
+def get_test_dictionary() -> PronunciationDict:
+  dictionary = PronunciationDict()
+  for i in range(25000):
+    dictionary[f"test{i}"] = Pronunciations()
+    dictionary[f"test{i}"][("T", "E", "S", "T")] = 0.25
+    dictionary[f"test{i}"][("T", "E", "S")] = 0.75
+  return dictionary
+
+
+def test_content_has_no_trailing_line_break(tmp_path: Path):
+  path = tmp_path / "test.dict"
+
+  save_dict(get_test_dictionary(), path, "UTF-8", SerializationOptions("TAB", True, True))
+
+  lines = path.read_text("UTF-8").split("\n")
+  assert len(lines) == 50000
+  assert lines[0] == "test0\t0.25\tT E S T"
+  assert lines[-1] == "test24999(2)\t0.75\tT E S"
+
+
+def test_empty_dictionary_creates_empty_file(tmp_path: Path):
+  path = tmp_path / "test.dict"
+
+  save_dict(OrderedDict(), path, "UTF-8", SerializationOptions("TAB", True, True))
+
+  assert path.read_text("UTF-8") == ""
+
+
+def test_atomic_replaces_file(tmp_path: Path):
+  path = tmp_path / "test.dict"
+  path.write_text("old", "UTF-8")
+
+  save_dict(get_test_dictionary(), path, "UTF-8",
+            SerializationOptions("TAB", False, False), atomic=True)
+
+  assert path.read_text("UTF-8").startswith("test0\tT E S T\n")
+  assert list(tmp_path.iterdir()) == [path]
+
+
+def test_compression_is_selected_by_suffix(tmp_path: Path):
+  dictionary = get_test_dictionary()
+  gz_path = tmp_path / "test.dict.gz"
+  xz_path = tmp_path / "test.dict.xz"
+
+  save_dict(dictionary, gz_path, "UTF-8", SerializationOptions("TAB", False, True))
+  save_dict(dictionary, xz_path, "UTF-8", SerializationOptions("TAB", False, True), atomic=True)
+
+  with gzip.open(gz_path, "rt", encoding="UTF-8") as file:
+    assert file.readline() == "test0\t0.25\tT E S T\n"
+  with lzma.open(xz_path, "rt", encoding="UTF-8") as file:
+    assert file.readline() == "test0\t0.25\tT E S T\n"
+  result = load_dict(gz_path, "UTF-8", DeserializationOptions(False, False, False, True),
+                     MultiprocessingOptions(1, None, 1000))
+  assert result == dictionary
+
+
+def test_parallel_content_is_identical(tmp_path: Path):
+  dictionary = get_test_dictionary()
+  path_single = tmp_path / "single.dict"
+  path_multi = tmp_path / "multi.dict"
+  options = SerializationOptions("DOUBLE-SPACE", True, True)
+
+  save_dict(dictionary, path_single, "UTF-8", options)
+  save_dict(dictionary, path_multi, "UTF-8", options, mp_options=MultiprocessingOptions(2, None, 1))
+
+  assert path_single.read_bytes() == path_multi.read_bytes()
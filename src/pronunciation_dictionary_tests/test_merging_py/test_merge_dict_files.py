@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from pronunciation_dictionary.deserialization import DeserializationOptions
+from pronunciation_dictionary.merging import merge_dict_files
+from pronunciation_dictionary.serialization import SerializationOptions
+
+OPTIONS = DeserializationOptions(False, True, False, True)
+SERIALIZATION_OPTIONS = SerializationOptions("DOUBLE-SPACE", True, True)
+
+
+def test_merges_sorted_files(tmp_path: Path):
+  path1 = tmp_path / "1.dict"
+  path1.write_text("a  1.0  A\na(2)  3.0  B\nc  1.0  C\nc  2.0  C", "UTF-8")
+  path2 = tmp_path / "2.dict"
+  path2.write_text("a  1.0  B\nb  2.0  B\n", "UTF-8")
+  output_path = tmp_path / "out.dict"
+
+  merge_dict_files([path1, path2], output_path, "UTF-8",
+                   OPTIONS, SERIALIZATION_OPTIONS, "add-weights")
+
+  assert output_path.read_text("UTF-8") == "a  1.0  A\na(2)  4.0  B\nb  2.0  B\nc  1.0  C"
+
+
+def test_output_can_be_an_input(tmp_path: Path):
+  path1 = tmp_path / "1.dict"
+  path1.write_text("a  1.0  A", "UTF-8")
+  path2 = tmp_path / "2.dict"
+  path2.write_text("a  2.0  A", "UTF-8")
+
+  merge_dict_files([path1, path2], path1, "UTF-8", OPTIONS, SERIALIZATION_OPTIONS, "last-wins")
+
+  assert path1.read_text("UTF-8") == "a  2.0  A"
+  assert [path.name for path in sorted(tmp_path.iterdir())] == ["1.dict", "2.dict"]
+
+
+def test_unsorted_file_raises_error(tmp_path: Path):
+  path = tmp_path / "1.dict"
+  path.write_text("b  1.0  B\na  1.0  A", "UTF-8")
+
+  with pytest.raises(ValueError):
+    merge_dict_files([path], tmp_path / "out.dict", "UTF-8", OPTIONS, SERIALIZATION_OPTIONS, "first-wins")
+  assert not (tmp_path / "out.dict").exists()
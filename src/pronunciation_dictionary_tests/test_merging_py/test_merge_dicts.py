@@ -0,0 +1,54 @@
+from collections import OrderedDict
+
+import pytest
+
+from pronunciation_dictionary.merging import POLICIES, merge_dicts
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+
+
+def get_test_dictionaries():
+  dictionary1 = OrderedDict()
+  dictionary1["a"] = OrderedDict(((("a",), 1.0), (("b",), 3.0)))
+  dictionary1["b"] = OrderedDict(((("b",), 2.0),))
+  dictionary2 = OrderedDict()
+  dictionary2["c"] = OrderedDict(((("c",), 1.0),))
+  dictionary2["a"] = OrderedDict(((("b",), 1.0), (("c",), 4.0)))
+  return [dictionary1, dictionary2]
+
+
+@pytest.mark.parametrize("policy, expected_a", [
+  ("first-wins", [(("a",), 1.0), (("b",), 3.0), (("c",), 4.0)]),
+  ("last-wins", [(("a",), 1.0), (("b",), 1.0), (("c",), 4.0)]),
+  ("add-weights", [(("a",), 1.0), (("b",), 4.0), (("c",), 4.0)]),
+  ("max-weight", [(("a",), 1.0), (("b",), 3.0), (("c",), 4.0)]),
+  ("normalize", [(("a",), 0.125), (("b",), 0.475), (("c",), 0.4)]),
+])
+def test_policies(policy, expected_a):
+  dictionaries = get_test_dictionaries()
+
+  result = merge_dicts(dictionaries, policy)
+
+  assert list(result.keys()) == ["a", "b", "c"]
+  assert list(result["a"].keys()) == [pronunciation for pronunciation, _ in expected_a]
+  assert list(result["a"].values()) == pytest.approx([weight for _, weight in expected_a])
+  assert dictionaries == get_test_dictionaries()
+
+
+@pytest.mark.parametrize("policy", POLICIES)
+def test_parallel_result_is_same(policy):
+  dictionaries = []
+  for dictionary_nr in range(3):
+    dictionary = OrderedDict()
+    for word_nr in range(dictionary_nr, 12000, 2):
+      dictionary[str(word_nr)] = OrderedDict((((str(word_nr % 7),), 1.0 + dictionary_nr),))
+    dictionaries.append(dictionary)
+
+  result = merge_dicts(dictionaries, policy, mp_options=MultiprocessingOptions(2, None, 1))
+
+  assert result == merge_dicts(dictionaries, policy)
+  assert list(result.keys()) == list(merge_dicts(dictionaries, policy).keys())
+
+
+def test_invalid_policy_raises_error():
+  with pytest.raises(ValueError):
+    merge_dicts(get_test_dictionaries(), "random")
@@ -0,0 +1,60 @@
+import logging
+from pathlib import Path
+
+from pronunciation_dictionary.deserialization import DeserializationOptions, deserialize
+from pronunciation_dictionary.io import load_dict, save_dict
+from pronunciation_dictionary.metrics import PipelineMetrics
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.serialization import SerializationOptions
+
+OPTIONS = DeserializationOptions(True, True, False, False)
+LINES = [";;; comment", "a  A", "", "a  A", "b  B", "b(2)  C"]
+
+
+def test_deserialize_counts_lines():
+  metrics = PipelineMetrics()
+
+  deserialize(LINES, OPTIONS, MultiprocessingOptions(1, None, 2), metrics)
+
+  assert metrics.counts == {
+    "lines": 6,
+    "skipped_lines": 2,
+    "duplicates": 1,
+    "words": 2,
+  }
+  assert set(metrics.seconds) == {"read", "parse", "merge", "deserialization"}
+  assert metrics.worker_utilization is None
+
+
+def test_parallel_deserialize_measures_workers():
+  metrics = PipelineMetrics()
+
+  deserialize(LINES * 100, OPTIONS, MultiprocessingOptions(2, None, 10), metrics)
+
+  assert metrics.counts["lines"] == 600
+  assert {"pool_startup", "wait", "worker", "parallel"} <= set(metrics.seconds)
+  assert metrics.worker_utilization is not None
+  assert "worker utilization" in metrics.get_summary()
+
+
+def test_load_and_save_dict(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  load_metrics = PipelineMetrics()
+  save_metrics = PipelineMetrics()
+  path.write_text("\n".join(LINES), "UTF-8")
+
+  dictionary = load_dict(path, "UTF-8", OPTIONS, MultiprocessingOptions(1, None, 2), metrics=load_metrics)
+  save_dict(dictionary, path, "UTF-8", SerializationOptions("TAB", True, False), metrics=save_metrics)
+
+  assert load_metrics.counts["bytes"] == len("\n".join(LINES))
+  assert save_metrics.counts == {"lines": 3, "bytes": len("a\tA\nb\tB\nb(2)\tC")}
+  assert set(save_metrics.seconds) == {"validation", "serialization", "write"}
+
+
+def test_single_lines_are_logged_as_debug(caplog):
+  with caplog.at_level(logging.INFO):
+    deserialize(LINES, OPTIONS, MultiprocessingOptions(1, None, 2))
+
+  assert [record.getMessage() for record in caplog.records] == [
+    "Skipped 2 empty, comment or invalid line(s) and 1 duplicate pronunciation(s) of 6 line(s)."
+  ]
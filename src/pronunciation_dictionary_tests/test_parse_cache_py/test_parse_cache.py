@@ -0,0 +1,140 @@
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+import pronunciation_dictionary.io
+from pronunciation_dictionary.deserialization import DeserializationOptions
+from pronunciation_dictionary.io import load_dict, load_dicts
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.parse_cache import ParseCache
+
+OPTIONS = DeserializationOptions(False, False, False, False)
+MP_OPTIONS = MultiprocessingOptions(1, None, 100)
+
+
+def write_dict(path: Path, content: str, mtime_ns: int) -> None:
+  path.write_text(content, "UTF-8")
+  os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_warm_load_returns_cached_dictionary(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  write_dict(path, "a  A B\nb  C", 10**18)
+  cache = ParseCache(tmp_path / "cache")
+
+  result_cold = load_dict(path, "UTF-8", OPTIONS, MP_OPTIONS, cache)
+  result_warm = load_dict(path, "UTF-8", OPTIONS, MP_OPTIONS, cache)
+
+  assert result_cold == OrderedDict((
+    ("a", OrderedDict(((("A", "B"), 1.0),))),
+    ("b", OrderedDict(((("C",), 1.0),))),
+  ))
+  assert result_warm == result_cold
+  assert result_warm is not result_cold
+  assert len(list((tmp_path / "cache").glob("*.pickle"))) == 1
+
+
+def test_changed_file_or_options_are_parsed_again(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  write_dict(path, "a  A", 10**18)
+  cache = ParseCache(tmp_path / "cache")
+  load_dict(path, "UTF-8", OPTIONS, MP_OPTIONS, cache)
+
+  write_dict(path, "a  B", 10**18 + 1)
+  result_changed = load_dict(path, "UTF-8", OPTIONS, MP_OPTIONS, cache)
+  result_other_options = cache.get(path, "UTF-8", DeserializationOptions(True, False, False, False))
+
+  assert result_changed == OrderedDict((("a", OrderedDict(((("B",), 1.0),))),))
+  assert result_other_options is None
+  # the entry of the previous version of the file was replaced
+  assert len(list((tmp_path / "cache").glob("*.pickle"))) == 1
+
+
+def test_outdated_entry_is_removed(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  write_dict(path, "a  A", 10**18)
+  cache = ParseCache(tmp_path / "cache")
+  load_dict(path, "UTF-8", OPTIONS, MP_OPTIONS, cache)
+
+  write_dict(path, "a  B", 10**18 + 1)
+
+  assert cache.get(path, "UTF-8", OPTIONS) is None
+  assert len(list((tmp_path / "cache").glob("*.pickle"))) == 0
+
+
+def test_content_hash_ignores_modification_time(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  write_dict(path, "a  A", 10**18)
+  cache = ParseCache(tmp_path / "cache", hash_content=True)
+  load_dict(path, "UTF-8", OPTIONS, MP_OPTIONS, cache)
+
+  write_dict(path, "a  A", 10**18 + 1)
+
+  assert cache.get(path, "UTF-8", OPTIONS) is not None
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path: Path):
+  paths = [tmp_path / f"dict{i}.txt" for i in range(3)]
+  for path in paths:
+    write_dict(path, "a  A", 10**18)
+  cache_dir = tmp_path / "cache"
+  cache = ParseCache(cache_dir)
+  entry_paths = []
+  for entry_nr, path in enumerate(paths[:2]):
+    load_dict(path, "UTF-8", OPTIONS, MP_OPTIONS, cache)
+    entry_path = next(p for p in cache_dir.glob("*.pickle") if p not in entry_paths)
+    os.utime(entry_path, ns=(entry_nr + 1, entry_nr + 1))
+    entry_paths.append(entry_path)
+  entry_size = entry_paths[0].stat().st_size
+  # reading the older entry marks it as recently used
+  cache.get(paths[0], "UTF-8", OPTIONS)
+
+  cache = ParseCache(cache_dir, max_size=2 * entry_size)
+  load_dicts(paths[2:], "UTF-8", OPTIONS, MP_OPTIONS, cache)
+
+  assert len(list(cache_dir.glob("*.pickle"))) == 2
+  assert entry_paths[0].exists()
+  assert not entry_paths[1].exists()
+
+
+def test_corrupt_entry_is_ignored(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  write_dict(path, "a  A", 10**18)
+  cache = ParseCache(tmp_path / "cache")
+  load_dict(path, "UTF-8", OPTIONS, MP_OPTIONS, cache)
+  entry_path = next((tmp_path / "cache").glob("*.pickle"))
+  entry_path.write_bytes(b"corrupt")
+
+  assert cache.get(path, "UTF-8", OPTIONS) is None
+  assert not entry_path.exists()
+
+
+def test_file_changed_after_taking_key_is_not_returned(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  write_dict(path, "a  A", 10**18)
+  cache = ParseCache(tmp_path / "cache")
+  file_key = cache.get_file_key(path)
+  write_dict(path, "a  B", 10**18 + 1)
+
+  cache.put(path, "UTF-8", OPTIONS, OrderedDict((("a", OrderedDict(((("A",), 1.0),))),)), file_key)
+
+  assert cache.get(path, "UTF-8", OPTIONS) is None
+
+
+def test_file_changed_while_loading_is_parsed_again(tmp_path: Path, monkeypatch):
+  path = tmp_path / "dict.txt"
+  write_dict(path, "a  A", 10**18)
+  cache = ParseCache(tmp_path / "cache")
+  read_lines = pronunciation_dictionary.io._read_lines
+
+  def read_lines_and_change_file(file_path: Path, encoding: str):
+    yield from read_lines(file_path, encoding)
+    write_dict(file_path, "a  B", 10**18 + 1)
+
+  monkeypatch.setattr(pronunciation_dictionary.io, "_read_lines", read_lines_and_change_file)
+  result_changing = load_dict(path, "UTF-8", OPTIONS, MP_OPTIONS, cache)
+  monkeypatch.undo()
+  result_changed = load_dict(path, "UTF-8", OPTIONS, MP_OPTIONS, cache)
+
+  assert result_changing == OrderedDict((("a", OrderedDict(((("A",), 1.0),))),))
+  assert result_changed == OrderedDict((("a", OrderedDict(((("B",), 1.0),))),))
@@ -0,0 +1,65 @@
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from pronunciation_dictionary.deserialization import DeserializationOptions, deserialize_lines
+from pronunciation_dictionary.io import save_dict
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.progress import CancellationToken, OperationCancelledError
+from pronunciation_dictionary.serialization import SerializationOptions
+
+OPTIONS = DeserializationOptions(False, False, False, False)
+
+
+def get_lines_cancelling_after(token: CancellationToken, n_lines: int) -> Generator[str, None, None]:
+  for i in range(100000):
+    if i == n_lines:
+      token.cancel()
+    yield f"word{i}  A B"
+
+
+def test_timeout():
+  assert not CancellationToken().is_cancelled
+  assert not CancellationToken(3600).is_cancelled
+  assert CancellationToken(0).is_cancelled
+
+
+def test_invalid_timeout_raises_error():
+  with pytest.raises(ValueError):
+    CancellationToken(-1)
+
+
+def test_cancelled_deserialization_raises_error():
+  token = CancellationToken()
+  lines = get_lines_cancelling_after(token, 500)
+
+  with pytest.raises(OperationCancelledError):
+    deserialize_lines(lines, OPTIONS, MultiprocessingOptions(1, None, 100),
+                      cancellation_token=token)
+
+  # the lines are not read further
+  assert next(lines) == "word600  A B"
+
+
+def test_cancelled_parallel_deserialization_raises_error():
+  token = CancellationToken()
+  lines = get_lines_cancelling_after(token, 500)
+
+  with pytest.raises(OperationCancelledError):
+    deserialize_lines(lines, OPTIONS, MultiprocessingOptions(2, None, 100),
+                      cancellation_token=token)
+
+  assert int(next(lines).split()[0][len("word"):]) < 100000
+
+
+def test_cancelled_atomic_save_dict_removes_file(tmp_path: Path):
+  token = CancellationToken()
+  token.cancel()
+  dictionary = deserialize_lines(["a  A"], OPTIONS, MultiprocessingOptions(1, None, 100))
+
+  with pytest.raises(OperationCancelledError):
+    save_dict(dictionary, tmp_path / "dict.txt", "UTF-8", SerializationOptions("DOUBLE-SPACE", False, False),
+              atomic=True, cancellation_token=token)
+
+  assert list(tmp_path.iterdir()) == []
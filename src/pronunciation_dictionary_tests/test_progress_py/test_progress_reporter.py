@@ -0,0 +1,64 @@
+from pathlib import Path
+
+from pronunciation_dictionary.deserialization import DeserializationOptions, deserialize
+from pronunciation_dictionary.io import load_dict, save_dict
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.progress import ProgressReporter
+from pronunciation_dictionary.serialization import SerializationOptions
+
+OPTIONS = DeserializationOptions(False, False, False, False)
+LINES = [f"word{i}  A B" for i in range(1000)]
+
+
+def test_reports_at_most_every_interval_and_at_the_end():
+  totals = []
+  reporter = ProgressReporter(totals.append, interval=3600)
+
+  reporter.update(2)
+  reporter.update(3)
+  reporter.finish()
+  reporter.finish()
+
+  assert totals == [5]
+
+
+def test_reports_every_update_without_interval():
+  totals = []
+  reporter = ProgressReporter(totals.append, interval=0)
+
+  reporter.update(2)
+  reporter.update(3)
+  reporter.finish()
+
+  assert totals == [2, 5]
+
+
+def test_deserialize_reports_all_lines():
+  totals = []
+
+  deserialize(LINES, OPTIONS, MultiprocessingOptions(1, None, 100), progress=totals.append)
+
+  assert totals[-1] == 1000
+
+
+def test_parallel_deserialize_reports_all_lines():
+  totals = []
+
+  deserialize(LINES, OPTIONS, MultiprocessingOptions(2, None, 100), progress=totals.append)
+
+  assert totals[-1] == 1000
+
+
+def test_load_and_save_dict_report_all_lines(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  path.write_text("\n".join(LINES), "UTF-8")
+  load_totals = []
+  save_totals = []
+
+  dictionary = load_dict(path, "UTF-8", OPTIONS, MultiprocessingOptions(1, None, 100),
+                         progress=load_totals.append)
+  save_dict(dictionary, tmp_path / "out.txt", "UTF-8",
+            SerializationOptions("DOUBLE-SPACE", False, False), progress=save_totals.append)
+
+  assert load_totals[-1] == 1000
+  assert save_totals[-1] == 1000
@@ -0,0 +1,61 @@
+from collections import OrderedDict
+
+import pytest
+
+from pronunciation_dictionary.pronunciation_index import PronunciationIndex
+
+
+def get_test_dictionary() -> OrderedDict:
+  result = OrderedDict()
+  result["read"] = OrderedDict(((("R", "EH", "D"), 1.0), (("R", "IY", "D"), 1.0)))
+  result["red"] = OrderedDict(((("R", "EH", "D"), 1.0),))
+  result["reed"] = OrderedDict(((("R", "IY", "D"), 1.0),))
+  result["bed"] = OrderedDict(((("B", "EH", "D"), 1.0),))
+  result["a"] = OrderedDict(((("AH",), 1.0),))
+  return result
+
+
+@pytest.mark.parametrize("ngram_size", [None, 1, 2, 3])
+def test_queries(ngram_size):
+  index = PronunciationIndex(get_test_dictionary(), ngram_size)
+
+  assert list(index.get_words(("R", "EH", "D"))) == ["read", "red"]
+  assert list(index.get_words(("X",))) == []
+  assert [(pronunciation, list(words)) for pronunciation, words in index.get_homophones()] == [
+    (("R", "EH", "D"), ["read", "red"]),
+    (("R", "IY", "D"), ["read", "reed"]),
+  ]
+  assert set(index.get_pronunciations_containing(("EH", "D"))) == {
+    ("R", "EH", "D"), ("B", "EH", "D")}
+  assert set(index.get_pronunciations_containing(("AH",))) == {("AH",)}
+  assert index.get_pronunciations_containing(("D", "R")) == []
+  assert index.get_similar_pronunciations(("R", "EH", "D"), 0) == [(("R", "EH", "D"), 0)]
+  assert sorted(index.get_similar_pronunciations(("R", "EH", "D"), 1)) == [
+    (("B", "EH", "D"), 1), (("R", "EH", "D"), 0), (("R", "IY", "D"), 1)]
+
+
+def test_update_and_remove_word():
+  dictionary = get_test_dictionary()
+  index = PronunciationIndex(dictionary)
+
+  index.update_word("red", OrderedDict(((("R", "EH", "D", "Z"), 1.0),)))
+  index.remove_word("bed")
+
+  assert list(index.get_words(("R", "EH", "D"))) == ["read"]
+  assert list(index.get_words(("R", "EH", "D", "Z"))) == ["red"]
+  assert ("B", "EH", "D") not in index
+  assert index.get_pronunciations_containing(("D", "Z")) == [("R", "EH", "D", "Z")]
+  assert len(index) == 4
+  with pytest.raises(KeyError):
+    index.remove_word("bed")
+
+
+def test_invalid_parameters_raise_error():
+  index = PronunciationIndex(get_test_dictionary())
+
+  with pytest.raises(ValueError):
+    PronunciationIndex(get_test_dictionary(), ngram_size=0)
+  with pytest.raises(ValueError):
+    index.get_similar_pronunciations(("R",), -1)
+  with pytest.raises(ValueError):
+    index.get_pronunciations_containing(())
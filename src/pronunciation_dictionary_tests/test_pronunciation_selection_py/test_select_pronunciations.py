@@ -0,0 +1,96 @@
+import random
+from collections import OrderedDict
+
+import pytest
+
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.pronunciation_selection import (get_first_pronunciation,
+                                                              get_last_pronunciation,
+                                                              get_longest_pronunciation,
+                                                              get_pronunciation_with_highest_weight,
+                                                              get_pronunciation_with_lowest_weight,
+                                                              get_random_pronunciation,
+                                                              get_shortest_pronunciation,
+                                                              get_weighted_pronunciation,
+                                                              select_pronunciations)
+
+SINGLE_METHODS = {
+  "first": get_first_pronunciation,
+  "last": get_last_pronunciation,
+  "highest-weight": get_pronunciation_with_highest_weight,
+  "lowest-weight": get_pronunciation_with_lowest_weight,
+  "shortest": get_shortest_pronunciation,
+  "longest": get_longest_pronunciation,
+}
+
+
+def get_test_dictionary(n_words: int) -> OrderedDict:
+  rng = random.Random(0)
+  result = OrderedDict()
+  for word_nr in range(n_words):
+    pronunciations = OrderedDict()
+    for _ in range(rng.randint(1, 5)):
+      pronunciation = tuple(rng.choice("abc") for _ in range(rng.randint(1, 3)))
+      pronunciations[pronunciation] = rng.choice([0.5, 1, 2.0, rng.random()])
+    result[f"w{word_nr}"] = pronunciations
+  return result
+
+
+@pytest.mark.parametrize("strategy", list(SINGLE_METHODS))
+def test_same_as_single_methods(strategy: str):
+  dictionary = get_test_dictionary(500)
+
+  result = select_pronunciations(dictionary, strategy, None)
+
+  assert list(result.keys()) == list(dictionary.keys())
+  for word, pronunciations in dictionary.items():
+    pronunciation = SINGLE_METHODS[strategy](pronunciations)
+    assert result[word] == OrderedDict(((pronunciation, pronunciations[pronunciation]),))
+
+
+@pytest.mark.parametrize("strategy, method", [
+  ("random", get_random_pronunciation),
+  ("weighted", get_weighted_pronunciation),
+])
+def test_seeded_same_as_single_methods(strategy: str, method):
+  dictionary = get_test_dictionary(500)
+
+  result = select_pronunciations(dictionary, strategy, 1234)
+
+  for word, pronunciations in dictionary.items():
+    assert list(result[word].keys()) == [method(pronunciations, 1234)]
+
+
+def test_seeded_does_not_change_global_random_state():
+  state = random.getstate()
+  select_pronunciations(get_test_dictionary(10), "random", 1234)
+  get_random_pronunciation(OrderedDict(((("a",), 1.0), (("b",), 1.0))), 1234)
+
+  assert random.getstate() == state
+
+
+@pytest.mark.parametrize("strategy", ["highest-weight", "random", "weighted"])
+def test_parallel_same_as_serial(strategy: str):
+  dictionary = get_test_dictionary(25000)
+
+  result_serial = select_pronunciations(dictionary, strategy, 1234)
+  result_parallel = select_pronunciations(
+    dictionary, strategy, 1234, mp_options=MultiprocessingOptions(2, None, 1))
+
+  assert result_parallel == result_serial
+
+
+def test_invalid_strategy_raises_error():
+  with pytest.raises(ValueError):
+    select_pronunciations(get_test_dictionary(1), "best", None)
+
+
+@pytest.mark.parametrize("strategy", list(SINGLE_METHODS))
+def test_word_without_pronunciations_raises_error(strategy: str):
+  dictionary = get_test_dictionary(3)
+  dictionary["w1"] = OrderedDict()
+
+  with pytest.raises(ValueError) as error:
+    select_pronunciations(dictionary, strategy, None)
+
+  assert error.value.args == ("dictionary", "At least one pronunciation is required for word \"w1\"!")
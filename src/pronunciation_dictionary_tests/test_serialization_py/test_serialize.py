@@ -1,3 +1,6 @@
+from collections import OrderedDict
+
+from pronunciation_dictionary.compact_dictionary import CompactPronunciationDict
 from pronunciation_dictionary.serialization import SerializationOptions, serialize
 from pronunciation_dictionary.types import PronunciationDict, Pronunciations
 
@@ -38,3 +41,13 @@ def test_weights_are_included():
   assert lines[0] == 'test\t0.25\tT E S T1'
   assert lines[1] == 'test(2)\t0.75\tT E S T2'
   assert lines[2] == 'XY\t1.0\tX Y'
+
+
+def test_validation_can_be_skipped():
+  dictionary = CompactPronunciationDict(OrderedDict((
+    ("test", OrderedDict(((("T", "E"), 1.0),))),
+  )))
+
+  lines = list(serialize(dictionary, SerializationOptions("TAB", False, False), validate=False))
+
+  assert lines == ['test\tT E']
@@ -0,0 +1,69 @@
+from collections import OrderedDict
+
+import pytest
+
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.phoneme_set_extraction import get_phoneme_set
+from pronunciation_dictionary.symbol_index import SymbolIndex
+
+
+def get_test_dictionary() -> OrderedDict:
+  result = OrderedDict()
+  result["a"] = OrderedDict(((("a", "b", "a"), 2.0),))
+  result["b"] = OrderedDict(((("b",), 1.0), (("c",), 0.5)))
+  return result
+
+
+def test_statistics():
+  index = SymbolIndex(get_test_dictionary())
+
+  assert set(index.symbols) == {"a", "b", "c"}
+  assert index.get_count("a") == 2
+  assert index.get_count("b") == 2
+  assert index.get_weighted_frequency("a") == 4.0
+  assert index.get_weighted_frequency("b") == 3.0
+  assert list(index.get_words("b")) == ["a", "b"]
+  assert list(index.get_symbols("b")) == ["b", "c"]
+  assert index.get_count("x") == 0
+  assert list(index.get_words("x")) == []
+
+
+def test_update_and_remove_word():
+  dictionary = get_test_dictionary()
+  index = SymbolIndex(dictionary)
+
+  dictionary["b"] = OrderedDict(((("d",), 1.0),))
+  index.update_word("b", dictionary["b"])
+  dictionary["e"] = OrderedDict(((("a",), 1),))
+  index.update_word("e", dictionary["e"])
+  del dictionary["a"]
+  index.remove_word("a")
+
+  assert set(index.symbols) == get_phoneme_set(dictionary)
+  assert index.get_count("a") == 1
+  assert index.get_weighted_frequency("a") == 1
+  assert list(index.get_words("a")) == ["e"]
+  assert index.get_count("c") == 0
+  assert len(index) == 2
+
+
+def test_update_word_invalid_pronunciation_raises_error():
+  index = SymbolIndex(get_test_dictionary())
+  with pytest.raises(ValueError):
+    index.update_word("b", OrderedDict(((("x y",), 1.0),)))
+
+
+def test_parallel_same_as_serial():
+  dictionary = OrderedDict(
+    (f"w{i}", OrderedDict((((f"s{i % 7}", f"s{i % 3}"), 1.0 + i % 2),)))
+    for i in range(25000)
+  )
+
+  index_serial = SymbolIndex(dictionary)
+  index_parallel = SymbolIndex(dictionary, mp_options=MultiprocessingOptions(2, None, 1))
+
+  for symbol in index_serial.symbols:
+    assert index_parallel.get_count(symbol) == index_serial.get_count(symbol)
+    assert index_parallel.get_weighted_frequency(
+      symbol) == index_serial.get_weighted_frequency(symbol)
+    assert list(index_parallel.get_words(symbol)) == list(index_serial.get_words(symbol))
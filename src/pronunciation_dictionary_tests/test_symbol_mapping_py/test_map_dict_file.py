@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+
+from pronunciation_dictionary import symbol_mapping
+from pronunciation_dictionary.deserialization import DeserializationOptions
+from pronunciation_dictionary.serialization import SerializationOptions
+from pronunciation_dictionary.symbol_mapping import SymbolMapping, map_dict_file
+
+OPTIONS = DeserializationOptions(False, True, False, True)
+SERIALIZATION_OPTIONS = SerializationOptions("DOUBLE-SPACE", True, True)
+
+
+def test_maps_file_in_place(tmp_path: Path):
+  path = tmp_path / "1.dict"
+  path.write_text("a  1.0  #\nb  1.0  A B\nb  2.0  C B\nc  1.0  A", "UTF-8")
+  mapping = SymbolMapping({"A": "x", "C": "x", "#": ()})
+
+  map_dict_file(path, path, "UTF-8", OPTIONS, SERIALIZATION_OPTIONS, mapping, "add-weights")
+
+  assert path.read_text("UTF-8") == "b  3.0  x B\nc  1.0  x"
+  assert [file.name for file in tmp_path.iterdir()] == ["1.dict"]
+
+
+def test_unsorted_file_raises_error(tmp_path: Path):
+  path = tmp_path / "1.dict"
+  path.write_text("a  1.0  A0\nb  1.0  B\na  2.0  A1", "UTF-8")
+  output_path = tmp_path / "out.dict"
+
+  with pytest.raises(ValueError) as error:
+    map_dict_file(path, output_path, "UTF-8", OPTIONS, SERIALIZATION_OPTIONS,
+                  SymbolMapping({"A0": "A", "A1": "A"}), "add-weights")
+
+  assert error.value.args[0] == f"File \"{path}\" is not sorted by word: \"a\" in line 3 occurs after \"b\"!"
+  assert not output_path.exists()
+
+
+def test_result_is_independent_of_cache_size(tmp_path: Path, monkeypatch):
+  path = tmp_path / "1.dict"
+  path.write_text("a  1.0  A\nb  1.0  B\nc  1.0  A\nd  1.0  B A", "UTF-8")
+  mapping = SymbolMapping({"A": "x"})
+  map_dict_file(path, tmp_path / "expected.dict", "UTF-8", OPTIONS, SERIALIZATION_OPTIONS, mapping)
+
+  monkeypatch.setattr(symbol_mapping, "MAX_CACHED_PRONUNCIATIONS", 1)
+  map_dict_file(path, tmp_path / "out.dict", "UTF-8", OPTIONS, SERIALIZATION_OPTIONS, mapping)
+
+  assert (tmp_path / "out.dict").read_text("UTF-8") == (tmp_path / "expected.dict").read_text("UTF-8")
@@ -0,0 +1,80 @@
+from collections import OrderedDict
+
+import pytest
+
+from pronunciation_dictionary.symbol_mapping import SymbolMapping, map_symbols
+
+
+def test_keeps_dictionary_and_order():
+  dictionary = OrderedDict((
+    ("b", OrderedDict(((("A", "B"), 1.0),))),
+    ("a", OrderedDict(((("B",), 2.0),))),
+  ))
+
+  result = map_symbols(dictionary, SymbolMapping({"A": "a"}))
+
+  assert result == OrderedDict((
+    ("b", OrderedDict(((("a", "B"), 1.0),))),
+    ("a", OrderedDict(((("B",), 2.0),))),
+  ))
+  assert list(result.keys()) == ["b", "a"]
+  assert dictionary["b"] == OrderedDict(((("A", "B"), 1.0),))
+
+
+@pytest.mark.parametrize("policy, expected", [
+  ("first-wins", OrderedDict(((("a",), 1.0), (("C",), 4.0)))),
+  ("last-wins", OrderedDict(((("a",), 3.0), (("C",), 4.0)))),
+  ("add-weights", OrderedDict(((("a",), 4.0), (("C",), 4.0)))),
+  ("max-weight", OrderedDict(((("a",), 3.0), (("C",), 4.0)))),
+  ("normalize", OrderedDict(((("a",), 0.5), (("C",), 0.5)))),
+])
+def test_collapsed_pronunciations_are_merged(policy: str, expected: OrderedDict):
+  dictionary = OrderedDict((
+    ("a", OrderedDict(((("A",), 1.0), (("C",), 4.0), (("B",), 3.0)))),
+  ))
+
+  result = map_symbols(dictionary, SymbolMapping({"A": "a", "B": "a"}), policy)
+
+  assert result["a"] == expected
+
+
+def test_removes_empty_pronunciations_and_words():
+  dictionary = OrderedDict((
+    ("a", OrderedDict(((("#",), 1.0), (("A",), 2.0)))),
+    ("b", OrderedDict(((("#",), 1.0),))),
+  ))
+
+  result = map_symbols(dictionary, SymbolMapping({"#": ()}))
+
+  assert result == OrderedDict((("a", OrderedDict(((("A",), 2.0),))),))
+
+
+def test_equal_results_share_one_tuple():
+  dictionary = OrderedDict((
+    ("a", OrderedDict(((("A",), 1.0),))),
+    ("b", OrderedDict(((("B",), 1.0),))),
+  ))
+
+  result = map_symbols(dictionary, SymbolMapping({"A": "x", "B": "x"}))
+
+  assert next(iter(result["a"])) is next(iter(result["b"]))
+
+
+def test_invalid_policy_raises_error():
+  with pytest.raises(ValueError) as error:
+    map_symbols(OrderedDict(), SymbolMapping({}), "invalid")
+  assert error.value.args[0].startswith("Parameter 'policy': ")
+
+
+def test_normalize_normalizes_all_words():
+  dictionary = OrderedDict((
+    ("a", OrderedDict(((("A",), 1.0), (("B",), 3.0)))),
+    ("b", OrderedDict(((("B",), 3.0), (("C",), 1.0)))),
+  ))
+
+  result = map_symbols(dictionary, SymbolMapping({"A": "B"}), "normalize")
+
+  assert result == OrderedDict((
+    ("a", OrderedDict(((("B",), 1.0),))),
+    ("b", OrderedDict(((("B",), 0.75), (("C",), 0.25)))),
+  ))
@@ -0,0 +1,41 @@
+import pytest
+
+from pronunciation_dictionary.symbol_mapping import SymbolMapping
+
+
+def test_maps_single_symbols():
+  mapping = SymbolMapping({"AH0": "ə", "ER0": ("ə", "r")})
+
+  result = mapping.map_pronunciation(("AH0", "T", "ER0"))
+
+  assert result == ("ə", "T", "ə", "r")
+
+
+def test_longest_sequence_is_mapped_first():
+  mapping = SymbolMapping({("T", "S"): "ts", ("T", "S", "H"): "tʃ", "T": "t"})
+
+  result = mapping.map_pronunciation(("T", "S", "H", "T", "S", "T"))
+
+  assert result == ("tʃ", "ts", "t")
+
+
+def test_empty_target_removes_symbols():
+  mapping = SymbolMapping({"#": ()})
+
+  result = mapping.map_pronunciation(("#", "A", "#"))
+
+  assert result == ("A",)
+
+
+def test_unmapped_symbol_raises_error_if_not_kept():
+  mapping = SymbolMapping({"A": "a"}, keep_unmapped_symbols=False)
+
+  with pytest.raises(ValueError) as error:
+    mapping.map_pronunciation(("A", "B"))
+  assert error.value.args[0] == "Symbol \"B\" is not mapped!"
+
+
+def test_invalid_target_raises_error():
+  with pytest.raises(ValueError) as error:
+    SymbolMapping({"A": "a b"})
+  assert error.value.args[0] == "Parameter 'mapping': Invalid target \"a b\" of source \"A\"!"
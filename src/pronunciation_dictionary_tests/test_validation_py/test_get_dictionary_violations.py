@@ -0,0 +1,58 @@
+from collections import OrderedDict
+
+import pytest
+
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.types import PronunciationDict
+from pronunciation_dictionary.validation import DictionaryViolation, get_dictionary_violations
+
+
+def get_invalid_dictionary() -> PronunciationDict:
+  result = PronunciationDict()
+  result["a"] = OrderedDict(((("a",), 1.0),))
+  result["b c"] = OrderedDict(((("b",), 1.0), (("c d",), "1")))
+  result["e"] = {}
+  result[""] = OrderedDict(((("f",), 1.0),))
+  return result
+
+
+def test_all_violations_are_returned():
+  result = get_dictionary_violations(get_invalid_dictionary())
+
+  assert result == [
+    DictionaryViolation(2, "b c", None, "Word contains whitespace which is not allowed!"),
+    DictionaryViolation(2, "b c", 2, "Pronunciation contains whitespace which is not allowed!"),
+    DictionaryViolation(2, "b c", 2, "Weight needs to be of type 'float' or 'int'!"),
+    DictionaryViolation(3, "e", None, "Pronunciations need to be of type 'OrderedDict'!"),
+    DictionaryViolation(4, "", None, "Empty words are not allowed!"),
+  ]
+
+
+def test_fail_fast_returns_violations_of_first_invalid_entry():
+  result = get_dictionary_violations(get_invalid_dictionary(), fail_fast=True)
+
+  assert [violation.word_nr for violation in result] == [2, 2, 2]
+
+
+def test_valid_dictionary_returns_empty_list():
+  dictionary = PronunciationDict()
+  dictionary["a"] = OrderedDict(((("a",), 1),))
+
+  assert get_dictionary_violations(dictionary) == []
+
+
+@pytest.mark.parametrize("fail_fast", [False, True])
+def test_parallel_same_as_serial(fail_fast: bool):
+  dictionary = PronunciationDict(
+    (f"w{i}", OrderedDict((((f"s{i % 7}",), 1.0),)))
+    for i in range(25000)
+  )
+  dictionary["w12000"] = OrderedDict(((("x y",), 1.0),))
+  dictionary["w24000"] = OrderedDict(((("x",), None),))
+
+  result_serial = get_dictionary_violations(dictionary, fail_fast)
+  result_parallel = get_dictionary_violations(
+    dictionary, fail_fast, MultiprocessingOptions(2, None, 1))
+
+  assert result_parallel == result_serial
+  assert result_serial[0].word_nr == 12001
@@ -66,3 +66,31 @@ def test_error_in_weight_updates_first_argument():
     "dictionary",
     "Weight needs to be of type 'float' or 'int'!"
   )
+
+
+def test_error_in_phoneme_type_updates_first_argument():
+  dictionary = PronunciationDict()
+  dictionary["test"] = Pronunciations()
+  dictionary["test"][("A", 1)] = 1.2
+
+  with raises(ValueError) as error:
+    validate_dictionary(dictionary)
+
+  assert error.value.args == (
+    "dictionary",
+    "Phonemes need to be of type 'str'!"
+  )
+
+
+def test_empty_pronunciation_updates_first_argument():
+  dictionary = PronunciationDict()
+  dictionary["test"] = Pronunciations()
+  dictionary["test"][()] = 1.2
+
+  with raises(ValueError) as error:
+    validate_dictionary(dictionary)
+
+  assert error.value.args == (
+    "dictionary",
+    "Pronunciation is empty!"
+  )
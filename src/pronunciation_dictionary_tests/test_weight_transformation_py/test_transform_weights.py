@@ -0,0 +1,123 @@
+from collections import OrderedDict
+
+import pytest
+
+from pronunciation_dictionary.mp_options import MultiprocessingOptions
+from pronunciation_dictionary.weight_transformation import (WeightTransformationOptions,
+                                                            transform_weights)
+
+
+def get_test_dictionary() -> OrderedDict:
+  result = OrderedDict()
+  result["a"] = OrderedDict(((("a",), 1.0), (("b",), 0), (("c",), 3.0), (("d",), 4.0)))
+  result["b"] = OrderedDict(((("b",), 0),))
+  result["c"] = OrderedDict(((("c",), 2),))
+  return result
+
+
+def test_normalize():
+  result = transform_weights(get_test_dictionary(), WeightTransformationOptions(normalize=True))
+
+  assert list(result["a"].values()) == [0.125, 0, 0.375, 0.5]
+  assert result["b"] == OrderedDict(((("b",), 0),))
+  assert result["c"] == OrderedDict(((("c",), 1.0),))
+
+
+def test_remove_zero_weights():
+  result = transform_weights(get_test_dictionary(),
+                             WeightTransformationOptions(remove_zero_weights=True))
+
+  assert list(result.keys()) == ["a", "c"]
+  assert list(result["a"].keys()) == [("a",), ("c",), ("d",)]
+
+
+def test_threshold_keeps_the_highest_weight():
+  result = transform_weights(get_test_dictionary(), WeightTransformationOptions(threshold=0.3))
+
+  assert list(result["a"].items()) == [(("c",), 3.0), (("d",), 4.0)]
+
+  result = transform_weights(get_test_dictionary(), WeightTransformationOptions(threshold=1.0))
+
+  assert list(result["a"].items()) == [(("d",), 4.0)]
+  assert list(result["b"].items()) == [(("b",), 0)]
+
+
+def test_top_k_keeps_order():
+  dictionary = get_test_dictionary()
+  dictionary["a"][("e",)] = 3.0
+
+  result = transform_weights(dictionary, WeightTransformationOptions(top_k=2))
+
+  assert list(result["a"].items()) == [(("c",), 3.0), (("d",), 4.0)]
+
+
+def test_temperature_and_normalize():
+  result = transform_weights(get_test_dictionary(), WeightTransformationOptions(
+    remove_zero_weights=True, temperature=0.5, normalize=True))
+
+  assert list(result["a"].values()) == pytest.approx([1 / 26, 9 / 26, 16 / 26])
+
+
+def test_in_place():
+  dictionary = get_test_dictionary()
+  pronunciations = dictionary["a"]
+
+  result = transform_weights(dictionary, WeightTransformationOptions(
+    remove_zero_weights=True, top_k=2, normalize=True), in_place=True)
+
+  assert result is dictionary
+  assert result["a"] is pronunciations
+  assert list(result.keys()) == ["a", "c"]
+  assert list(pronunciations.items()) == [(("c",), 3 / 7), (("d",), 4 / 7)]
+
+
+
+def test_normalize_in_place():
+  dictionary = get_test_dictionary()
+  pronunciations = dictionary["a"]
+  expected = transform_weights(get_test_dictionary(), WeightTransformationOptions(normalize=True))
+
+  result = transform_weights(dictionary, WeightTransformationOptions(normalize=True), in_place=True)
+
+  assert result is dictionary
+  assert result["a"] is pronunciations
+  assert result == expected
+
+
+@pytest.mark.parametrize("mp_options", [None, MultiprocessingOptions(2, None, 1)])
+def test_negative_weight_keeps_dictionary_unchanged(mp_options: MultiprocessingOptions):
+  dictionary = OrderedDict()
+  for word_nr in range(25000):
+    dictionary[str(word_nr)] = OrderedDict(((("a",), 4.0),))
+  dictionary["b"] = OrderedDict(((("a",), 4.0), (("b",), -1.0)))
+  expected = OrderedDict((word, pronunciations.copy()) for word, pronunciations in dictionary.items())
+
+  with pytest.raises(ValueError) as error:
+    transform_weights(dictionary, WeightTransformationOptions(temperature=0.5),
+                      in_place=True, mp_options=mp_options)
+
+  assert error.value.args == ("dictionary", "Temperature scaling requires non-negative weights!")
+  assert dictionary == expected
+
+
+@pytest.mark.parametrize("in_place", [False, True])
+def test_parallel_result_is_same(in_place: bool):
+  dictionary = OrderedDict()
+  for word_nr in range(25000):
+    dictionary[str(word_nr)] = OrderedDict(
+      ((("a", str(pronunciation_nr)), (word_nr + pronunciation_nr) % 4) for pronunciation_nr in range(word_nr % 4 + 1)))
+  options = WeightTransformationOptions(True, 2.0, 0.2, 2, True)
+  expected = transform_weights(dictionary, options)
+
+  result = transform_weights(dictionary, options, in_place=in_place,
+                             mp_options=MultiprocessingOptions(2, None, 1))
+
+  assert result == expected
+  assert list(result.keys()) == list(expected.keys())
+
+
+def test_invalid_options_raise_error():
+  with pytest.raises(ValueError):
+    transform_weights(get_test_dictionary(), WeightTransformationOptions(top_k=0))
+  with pytest.raises(ValueError):
+    transform_weights(get_test_dictionary(), WeightTransformationOptions(temperature=0))
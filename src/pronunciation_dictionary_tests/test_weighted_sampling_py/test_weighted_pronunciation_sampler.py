@@ -0,0 +1,68 @@
+import random
+from collections import Counter, OrderedDict
+
+import pytest
+
+from pronunciation_dictionary.weighted_sampling import WeightedPronunciationSampler
+
+
+def get_test_dictionary() -> OrderedDict:
+  result = OrderedDict()
+  result["a"] = OrderedDict(((("a",), 1.0),))
+  result["b"] = OrderedDict(((("b", "1"), 1), (("b", "2"), 3.0), (("b", "3"), 0)))
+  result["c"] = OrderedDict(((("c", "1"), 1e-20), (("c", "2"), 1e20)))
+  return result
+
+
+def test_same_draws_as_random_choices():
+  dictionary = get_test_dictionary()
+  words = ["a", "b", "c", "b"] * 100
+  rng = random.Random(1234)
+  expected = [
+    rng.choices(tuple(dictionary[word].keys()), tuple(dictionary[word].values()), k=1)[0]
+    for word in words
+  ]
+  sampler = WeightedPronunciationSampler(dictionary, 1234)
+
+  result = sampler.sample_many(words)
+
+  assert result == expected
+
+
+def test_sample_continues_sample_many():
+  words = ["b"] * 10
+  sampler = WeightedPronunciationSampler(get_test_dictionary(), 1234)
+  expected = sampler.sample_many(words + words)
+  sampler.seed(1234)
+
+  result = sampler.sample_many(words) + [sampler.sample(word) for word in words]
+
+  assert result == expected
+
+
+def test_distribution_follows_weights():
+  sampler = WeightedPronunciationSampler(get_test_dictionary(), 1)
+
+  counts = Counter(sampler.sample_many(["b"] * 40000))
+
+  assert counts[("b", "3")] == 0
+  assert 0.24 < counts[("b", "1")] / 40000 < 0.26
+
+
+def test_unknown_word_raises_key_error():
+  sampler = WeightedPronunciationSampler(get_test_dictionary(), 1)
+  with pytest.raises(KeyError):
+    sampler.sample_many(["a", "x"])
+
+
+def test_zero_weights_raise_error():
+  dictionary = OrderedDict((("a", OrderedDict(((("a",), 0),))),))
+  with pytest.raises(ValueError):
+    WeightedPronunciationSampler(dictionary)
+
+
+def test_word_without_pronunciations_raises_error():
+  dictionary = OrderedDict((("a", OrderedDict()),))
+  with pytest.raises(ValueError) as error:
+    WeightedPronunciationSampler(dictionary)
+  assert error.value.args == ("dictionary", "Weights of word \"a\" need to sum up to a positive finite value!")
@@ -0,0 +1,52 @@
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from pronunciation_dictionary.word_index import WordIndex, load_word_index, save_word_index
+
+
+def test_save_and_load(tmp_path: Path):
+  dictionary = OrderedDict()
+  for word in ["b", "Ä", "a", "A", "\udc80"]:
+    dictionary[word] = OrderedDict(((("a",), 1.0),))
+  index = WordIndex(dictionary)
+  path = tmp_path / "words.idx"
+
+  save_word_index(index, path)
+  result = load_word_index(path)
+
+  assert list(result) == list(index)
+  assert result.get_casefolded_words("a") == ["A", "a"]
+  assert result.get_words_with_prefix("ä", casefold=True) == ["Ä"]
+
+
+def test_empty_index(tmp_path: Path):
+  path = tmp_path / "words.idx"
+
+  save_word_index(WordIndex(OrderedDict()), path)
+  result = load_word_index(path)
+
+  assert len(result) == 0
+
+
+def test_invalid_file_raises_error(tmp_path: Path):
+  path = tmp_path / "words.idx"
+  path.write_bytes(b"no index")
+
+  with pytest.raises(ValueError):
+    load_word_index(path)
+
+
+def test_words_with_line_breaks_are_loaded(tmp_path: Path):
+  dictionary = OrderedDict()
+  for word in ["a\nb", "a", "\r\n", "b\x85c"]:
+    dictionary[word] = OrderedDict(((("a",), 1.0),))
+  index = WordIndex(dictionary)
+  path = tmp_path / "words.idx"
+
+  save_word_index(index, path)
+  result = load_word_index(path)
+
+  assert list(result) == ["\r\n", "a", "a\nb", "b\x85c"]
+  assert "a\nb" in result
@@ -0,0 +1,65 @@
+import pickle
+from collections import OrderedDict
+
+from pronunciation_dictionary.word_index import WordIndex
+
+WORDS = ["abbe", "ABBE(2)", "ABBE(10)", "ABBE", "Abbey", "b", "ABBE(1)x", "ABBEY(1)"]
+
+
+def get_test_dictionary() -> OrderedDict:
+  result = OrderedDict()
+  for word in WORDS:
+    result[word] = OrderedDict(((("a",), 1.0),))
+  return result
+
+
+def test_exact_lookup():
+  index = WordIndex(get_test_dictionary())
+
+  assert len(index) == len(WORDS)
+  assert list(index) == sorted(WORDS)
+  assert "Abbey" in index
+  assert "abbey" not in index
+  assert 1 not in index
+
+
+def test_casefolded_lookup():
+  index = WordIndex(get_test_dictionary())
+
+  assert index.get_casefolded_words("aBBe") == ["ABBE", "abbe"]
+  assert index.get_casefolded_words("x") == []
+
+
+def test_prefix_lookup():
+  index = WordIndex(get_test_dictionary())
+
+  assert index.get_words_with_prefix("ABBE(") == ["ABBE(1)x", "ABBE(10)", "ABBE(2)"]
+  assert index.get_words_with_prefix("abbey", casefold=True) == ["Abbey", "ABBEY(1)"]
+  assert index.get_words_with_prefix("") == sorted(WORDS)
+  assert index.get_words_with_prefix("c") == []
+
+
+def test_range_lookup():
+  index = WordIndex(get_test_dictionary())
+
+  assert index.get_words_in_range("Abbey", None) == ["Abbey", "abbe", "b"]
+  assert index.get_words_in_range(None, "ABBE(") == ["ABBE"]
+  assert index.get_words_in_range("abbey", "B", casefold=True) == ["Abbey", "ABBEY(1)"]
+  assert index.get_words_in_range("b", "a") == []
+
+
+def test_alternative_words():
+  index = WordIndex(get_test_dictionary())
+
+  assert index.get_alternative_words("ABBE") == ["ABBE", "ABBE(2)", "ABBE(10)"]
+  assert index.get_alternative_words("ABBEY") == ["ABBEY(1)"]
+  assert index.get_alternative_words("x") == []
+
+
+def test_pickle():
+  index = WordIndex(get_test_dictionary())
+
+  result = pickle.loads(pickle.dumps(index))
+
+  assert list(result) == list(index)
+  assert result.get_casefolded_words("abbe") == ["ABBE", "abbe"]